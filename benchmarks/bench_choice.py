@@ -0,0 +1,57 @@
+"""
+Provide benchmarks of the random choice.
+"""
+import numpy as np
+import pytest
+
+from eos_name_generator.utils import FastRandomChoice
+
+DISTRIBUTIONS_SIZES = (10, 1_000, 100_000)
+CHOICES_NUM = 10_000
+SINGLE_CHOICES_NUM = 100
+
+
+def get_distribution(size) -> tuple:
+    """
+    Get the sequence and random probabilities of the distribution.
+
+    :param size: number of elements of the distribution.
+    :return: tuple of the sequence and probabilities
+    """
+    probabilities = np.random.default_rng(0).random(size)
+    return list(range(size)), (probabilities / probabilities.sum()).tolist()
+
+
+@pytest.mark.parametrize('size', DISTRIBUTIONS_SIZES)
+def bench_choice(benchmark, size):
+    """
+    Benchmark choice of single elements from the distribution.
+
+    Every choice validates the distribution, so there are fewer choices than draws of the prepared choice.
+    """
+    random_provider = FastRandomChoice(0)
+    seq, p = get_distribution(size)
+
+    benchmark(lambda: [random_provider.choice(seq, p) for _ in range(SINGLE_CHOICES_NUM)])
+
+
+@pytest.mark.parametrize('size', DISTRIBUTIONS_SIZES)
+def bench_choice_size(benchmark, size):
+    """
+    Benchmark choice of the array of elements from the distribution.
+    """
+    random_provider = FastRandomChoice(0)
+    seq, p = get_distribution(size)
+
+    chosen_elements = benchmark(random_provider.choice, seq, p, size=CHOICES_NUM)
+    assert len(chosen_elements) == CHOICES_NUM
+
+
+@pytest.mark.parametrize('size', DISTRIBUTIONS_SIZES)
+def bench_prepared_choice(benchmark, size):
+    """
+    Benchmark draws of single elements from the prepared choice.
+    """
+    prepared_choice = FastRandomChoice(0).prepare(*get_distribution(size))
+
+    benchmark(lambda: [prepared_choice.draw() for _ in range(CHOICES_NUM)])
@@ -0,0 +1,29 @@
+"""
+Provide benchmarks of the CLI cold start.
+"""
+import subprocess
+import sys
+from os.path import (
+    abspath,
+    dirname,
+)
+
+import pytest
+
+PROJECT_PATH = dirname(dirname(abspath(__file__)))
+ROUNDS = 5
+
+
+@pytest.mark.parametrize('arguments', (['--help'], ['generate', 'name']))
+def bench_cli_cold_start(benchmark, arguments):
+    """
+    Benchmark the CLI command run in the new interpreter.
+    """
+    command = [sys.executable, '-c', 'from cli.entrypoint import cli; cli()', *arguments]
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=(command,),
+        kwargs={'cwd': PROJECT_PATH, 'check': True, 'stdout': subprocess.DEVNULL},
+        rounds=ROUNDS,
+    )
@@ -0,0 +1,26 @@
+"""
+Provide benchmarks of reading the seed data.
+"""
+from eos_name_generator.random_generator.data_reader import DataReader
+
+
+def bench_read_text_data(benchmark, synthetic_corpus_path):
+    """
+    Benchmark reading and validation of the text seed data.
+    """
+    data_reader = DataReader(data_path=synthetic_corpus_path, seed_data_cache=None)
+
+    words_by_word_len = benchmark(data_reader.get_dictionary_by_word_len)
+    assert words_by_word_len
+
+
+def bench_read_compiled_data(benchmark, synthetic_corpus_path, tmp_path):
+    """
+    Benchmark reading of the compiled seed data.
+    """
+    compiled_data_path = tmp_path / 'compiled_data.bin'
+    DataReader(data_path=synthetic_corpus_path, seed_data_cache=None).compile(compiled_data_path)
+    data_reader = DataReader(data_path=compiled_data_path, seed_data_cache=None)
+
+    words_by_word_len = benchmark(data_reader.get_dictionary_by_word_len)
+    assert words_by_word_len
@@ -0,0 +1,60 @@
+"""
+Provide benchmarks of the generation of names.
+"""
+import pytest
+
+from eos_name_generator import (
+    MarkovChainNameGenerator,
+    RandomNameGenerator,
+    RNNNameGenerator,
+)
+from eos_name_generator.utils import FastRandomChoice
+
+SCALAR_NUMS = (100, 1_000, 10_000)
+BATCH_NUMS = (1_000, 10_000, 100_000)
+
+
+@pytest.fixture(scope='module')
+def random_generator():
+    """
+    Get the random generator of the default seed data.
+    """
+    return RandomNameGenerator(random_provider_instance=FastRandomChoice(0))
+
+
+@pytest.mark.parametrize('num', SCALAR_NUMS)
+def bench_random_generate(benchmark, random_generator, num):
+    """
+    Benchmark generation of `num` names one by one.
+    """
+    names = benchmark(lambda: [random_generator.generate() for _ in range(num)])
+    assert len(names) == num
+
+
+@pytest.mark.parametrize('num', BATCH_NUMS)
+def bench_random_generate_list(benchmark, random_generator, num):
+    """
+    Benchmark generation of the list of `num` names.
+    """
+    names = benchmark(random_generator.generate_list, num)
+    assert len(names) == num
+
+
+@pytest.mark.parametrize('num', BATCH_NUMS)
+def bench_random_generate_list_unique(benchmark, random_generator, num):
+    """
+    Benchmark generation of the list of `num` unique names.
+    """
+    names = benchmark(random_generator.generate_list, num, unique=True)
+    assert len(names) == num
+
+
+@pytest.mark.parametrize('generator_class', (MarkovChainNameGenerator, RNNNameGenerator))
+def bench_model_generate_list(benchmark, generator_class):
+    """
+    Benchmark generation of the list of names by the generator of the trained model.
+    """
+    generator = generator_class(random_provider_instance=FastRandomChoice(0))
+
+    names = benchmark(generator.generate_list, 10_000)
+    assert len(names) == 10_000
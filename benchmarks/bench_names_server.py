@@ -0,0 +1,56 @@
+"""
+Provide benchmarks of requests to the names server.
+"""
+import threading
+
+import pytest
+
+from eos_name_generator import RandomNameGenerator
+from eos_name_generator.names_server import (
+    NamesClient,
+    NamesServer,
+)
+from eos_name_generator.utils import FastRandomChoice
+
+REQUESTS_NUM = 1_000
+
+
+@pytest.fixture(scope='module', params=['unix', 'tcp'])
+def names_client(request, tmp_path_factory):
+    """
+    Get the client of the names server served in the thread over the Unix domain socket and the TCP socket.
+    """
+    generator = RandomNameGenerator(random_provider_instance=FastRandomChoice(0))
+    if request.param == 'unix':
+        socket_path = str(tmp_path_factory.mktemp('names_server') / 'names.sock')
+        names_server = NamesServer(generator=generator, socket_path=socket_path)
+        client_address = {'socket_path': socket_path}
+    else:
+        names_server = NamesServer(generator=generator, port=0)
+        client_address = {'port': names_server.address[1]}
+
+    serve_thread = threading.Thread(target=names_server.serve_forever)
+    serve_thread.start()
+
+    with NamesClient(**client_address) as names_client:
+        yield names_client
+
+    names_server.shutdown()
+    serve_thread.join()
+    names_server.close()
+
+
+def bench_request_name(benchmark, names_client):
+    """
+    Benchmark requests of single names over one connection.
+    """
+    benchmark(lambda: [names_client.generate() for _ in range(REQUESTS_NUM)])
+
+
+@pytest.mark.parametrize('num', (100, 10_000))
+def bench_request_names_list(benchmark, names_client, num):
+    """
+    Benchmark requests of lists of names.
+    """
+    names = benchmark(names_client.generate_list, num)
+    assert num == len(names)
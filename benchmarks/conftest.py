@@ -0,0 +1,94 @@
+"""
+Provide fixtures for benchmarks.
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+from eos_name_generator.constants import EOS_NAME_LENGTH
+
+CORPORA_SIZES = {
+    'small': 10_000,
+    'large': 1_000_000,
+}
+BENCHMARK_COMPARE_FAIL = 'min:25%'
+NO_BASELINE_MESSAGE = 'No saved benchmarks run, regressions are not checked, save one with --benchmark-save=baseline'
+
+
+def is_baseline_saved(config) -> bool:
+    """
+    Check if any benchmarks run is saved in the benchmarks storage.
+
+    :param config: `pytest` config.
+    :return: `True` if the storage contains saved runs
+    """
+    storage_path = Path(config.getoption('benchmark_storage').replace('file://', '', 1))
+    return any(storage_path.glob('*/*.json'))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Compare benchmarks with the latest saved run if any run is saved, fail if the minimal time regresses by 25%.
+
+    Options are set before `pytest-benchmark` reads them, explicit `--benchmark-compare`
+    and `--benchmark-compare-fail` options are kept.
+    """
+    if not config.getoption('benchmark_compare'):
+        if not is_baseline_saved(config):
+            return
+
+        config.option.benchmark_compare = True
+
+    if not config.getoption('benchmark_compare_fail'):
+        config.option.benchmark_compare_fail = [parse_compare_fail(BENCHMARK_COMPARE_FAIL)]
+
+
+def pytest_report_header(config):
+    """
+    Warn before benchmarks that there is no saved run to compare with.
+    """
+    if not config.getoption('benchmark_compare'):
+        return f'WARNING: {NO_BASELINE_MESSAGE}'
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Warn after benchmarks that there is no saved run to compare with.
+    """
+    if not config.getoption('benchmark_compare'):
+        terminalreporter.write_sep('!', NO_BASELINE_MESSAGE, yellow=True, bold=True)
+
+
+def write_synthetic_corpus(path, words_num, seed=0):
+    """
+    Write the seed data of random lowercase words of 1 to `EOS_NAME_LENGTH` letters, one word per line.
+
+    :param path: path to the seed data.
+    :param words_num: number of words.
+    :param seed: seed of random words.
+    """
+    random_generator = np.random.default_rng(seed)
+    letters = random_generator.integers(ord('a'), ord('z') + 1, size=(words_num, EOS_NAME_LENGTH), dtype=np.uint8)
+    words_lens = random_generator.integers(1, EOS_NAME_LENGTH + 1, size=words_num)
+
+    lines = np.full((words_num, EOS_NAME_LENGTH + 1), ord('\n'), dtype=np.uint8)
+    lines[:, :EOS_NAME_LENGTH] = letters
+
+    lines[np.arange(words_num), words_lens] = ord('\n')
+    lines_mask = np.arange(EOS_NAME_LENGTH + 1) <= words_lens[:, np.newaxis]
+
+    path.write_bytes(lines[lines_mask].tobytes())
+
+
+@pytest.fixture(scope='session', params=list(CORPORA_SIZES))
+def synthetic_corpus_path(request, tmp_path_factory):
+    """
+    Get path to the synthetic seed data of the small and the large corpus.
+    """
+    path = tmp_path_factory.mktemp('seed_data') / f'{request.param}.txt'
+    write_synthetic_corpus(path, CORPORA_SIZES[request.param])
+
+    return path
@@ -4,6 +4,14 @@ Provide implementation of the command line interface to interact with `eos-name-
 import click
 
 from cli.generate.cli import generate_commands
+from cli.markov_chain.cli import markov_chain_commands
+from cli.names_index.cli import names_index_commands
+from cli.names_server.cli import (
+    request_names,
+    serve_names,
+)
+from cli.rnn.cli import rnn_commands
+from cli.seed_data.cli import seed_data_commands
 
 
 @click.group()
@@ -16,3 +24,9 @@ def cli():
 
 
 cli.add_command(generate_commands)
+cli.add_command(markov_chain_commands)
+cli.add_command(names_index_commands)
+cli.add_command(rnn_commands)
+cli.add_command(seed_data_commands)
+cli.add_command(request_names)
+cli.add_command(serve_names)
@@ -7,22 +7,24 @@ import click
 
 from cli.constants import (
     FAILED_EXIT_FROM_COMMAND_CODE,
-    FAST_RANDOM_CHOICE_PROVIDER,
     NUMBERS_PROBABILITY,
-    NUMPY_RANDOM_PROVIDER,
 )
-from cli.generate.forms import GenerateNameForm
 from cli.generate.help import (
+    EXCLUDE_PATH_HELP_MESSAGE,
     NUM_HELP_MESSAGE,
     NUMBERS_PROBABILITY_HELP_MESSAGE,
     NUMPY_RANDOM_PROVIDER_HELP_MESSAGE,
     SEED_DATA_PATH_HELP_MESSAGE,
+    STATS_HELP_MESSAGE,
+    UNIQUE_HELP_MESSAGE,
+    WORKERS_HELP_MESSAGE,
 )
 from cli.utils import (
+    get_numpy_random_provider,
     print_errors,
     print_result,
+    print_stats,
 )
-from eos_name_generator import RandomNameGenerator
 from eos_name_generator.constants import SEED_DATA_PATH
 
 
@@ -37,15 +39,24 @@ def generate_commands():
 @click.option('--numbers-probabilities', type=float, required=False, help=NUMBERS_PROBABILITY_HELP_MESSAGE,
               default=NUMBERS_PROBABILITY)
 @click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--stats', is_flag=True, required=False, help=STATS_HELP_MESSAGE)
 @generate_commands.command('name')
-def generate_name(numpy_random_provider, numbers_probabilities, seed_data_path):
+def generate_name(numpy_random_provider, numbers_probabilities, seed_data_path, stats):
     """
     Generate random name.
     """
+    from cli.generate.forms import GenerateNameForm
+    from eos_name_generator import RandomNameGenerator
+    from eos_name_generator.utils import (
+        DEFAULT_RANDOM_PROVIDER,
+        GenerationStats,
+    )
+
     arguments, errors = GenerateNameForm().load({
         'numpy_random_provider': numpy_random_provider,
         'numbers_probabilities': numbers_probabilities,
         'seed_data_path': seed_data_path,
+        'stats': stats,
     })
 
     if errors:
@@ -55,16 +66,16 @@ def generate_name(numpy_random_provider, numbers_probabilities, seed_data_path):
     numpy_random_provider = arguments.get('numpy_random_provider')
     numbers_probabilities = arguments.get('numbers_probabilities')
     seed_data_path = arguments.get('seed_data_path')
+    generation_stats = GenerationStats() if arguments.get('stats') else None
 
-    random_provider = FAST_RANDOM_CHOICE_PROVIDER
-    if numpy_random_provider:
-        random_provider = NUMPY_RANDOM_PROVIDER
+    random_provider = get_numpy_random_provider() if numpy_random_provider else DEFAULT_RANDOM_PROVIDER
 
     try:
         generator = RandomNameGenerator(
             random_provider_instance=random_provider,
             numbers_probabilities=numbers_probabilities,
             seed_data_path=seed_data_path,
+            stats=generation_stats,
         )
         random_name = generator.generate()
 
@@ -73,6 +84,8 @@ def generate_name(numpy_random_provider, numbers_probabilities, seed_data_path):
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
     print_result(random_name)
+    if generation_stats is not None:
+        print_stats(generation_stats)
 
 
 @click.option('--num', '-n', type=int, required=True, help=NUM_HELP_MESSAGE)
@@ -80,16 +93,32 @@ def generate_name(numpy_random_provider, numbers_probabilities, seed_data_path):
 @click.option('--numbers-probabilities', type=float, required=False, help=NUMBERS_PROBABILITY_HELP_MESSAGE,
               default=NUMBERS_PROBABILITY)
 @click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--workers', type=int, required=False, help=WORKERS_HELP_MESSAGE)
+@click.option('--unique', is_flag=True, required=False, help=UNIQUE_HELP_MESSAGE)
+@click.option('--exclude-path', type=str, required=False, help=EXCLUDE_PATH_HELP_MESSAGE)
+@click.option('--stats', is_flag=True, required=False, help=STATS_HELP_MESSAGE)
 @generate_commands.command('names_list')
-def names_list(num, numpy_random_provider, numbers_probabilities, seed_data_path):
+def names_list(num, numpy_random_provider, numbers_probabilities, seed_data_path, workers, unique, exclude_path, stats):
     """
     Generate random list of names.
     """
+    from cli.generate.forms import GenerateNameForm
+    from eos_name_generator import RandomNameGenerator
+    from eos_name_generator.utils import (
+        DEFAULT_RANDOM_PROVIDER,
+        GenerationStats,
+    )
+    from eos_name_generator.utils.names_index import load_names_index
+
     arguments, errors = GenerateNameForm().load({
         'num': num,
         'numpy_random_provider': numpy_random_provider,
         'numbers_probabilities': numbers_probabilities,
         'seed_data_path': seed_data_path,
+        'workers': workers,
+        'unique': unique,
+        'exclude_path': exclude_path,
+        'stats': stats,
     })
 
     if errors:
@@ -100,24 +129,32 @@ def names_list(num, numpy_random_provider, numbers_probabilities, seed_data_path
     numpy_random_provider = arguments.get('numpy_random_provider')
     numbers_probabilities = arguments.get('numbers_probabilities')
     seed_data_path = arguments.get('seed_data_path')
+    workers = arguments.get('workers')
+    unique = arguments.get('unique')
+    exclude_path = arguments.get('exclude_path')
+    generation_stats = GenerationStats() if arguments.get('stats') else None
 
-    random_provider = FAST_RANDOM_CHOICE_PROVIDER
-    if numpy_random_provider:
-        random_provider = NUMPY_RANDOM_PROVIDER
+    random_provider = get_numpy_random_provider() if numpy_random_provider else DEFAULT_RANDOM_PROVIDER
 
     try:
         generator = RandomNameGenerator(
             random_provider_instance=random_provider,
             numbers_probabilities=numbers_probabilities,
             seed_data_path=seed_data_path,
+            stats=generation_stats,
+        )
+        exclude = None if exclude_path is None else load_names_index(exclude_path)
+        random_names_chunks = generator.iter_names(
+            num=num, as_chunks=True, workers=workers, unique=unique, exclude=exclude,
         )
-        random_name = generator.generate_list(num=num)
+
+        for random_names_chunk in random_names_chunks:
+            random_names_str = b'\n'.join(random_names_chunk.tolist()).decode()
+            print_result(random_names_str)
 
     except Exception as error:
         print_errors(errors=str(error))
         sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
 
-    random_name_str = '\n'
-    random_name_str = random_name_str.join(random_name)
-
-    print_result(random_name_str)
+    if generation_stats is not None:
+        print_stats(generation_stats)
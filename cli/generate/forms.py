@@ -31,3 +31,14 @@ class GenerateNameForm(Schema):
         ],
     )
     seed_data_path = fields.String(required=False)
+    workers = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=1, error='Workers must be greater than 0.'),
+        ],
+    )
+    unique = fields.Bool(required=False)
+    exclude_path = fields.String(allow_none=True, required=False)
+    stats = fields.Bool(required=False)
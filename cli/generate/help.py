@@ -5,3 +5,7 @@ NUMPY_RANDOM_PROVIDER_HELP_MESSAGE = 'Used `numpy.random` as random provider ins
 NUMBERS_PROBABILITY_HELP_MESSAGE = 'The probability of occurrence of numbers in the generated word.'
 SEED_DATA_PATH_HELP_MESSAGE = 'Path to the data based on which the name will be generated.'
 NUM_HELP_MESSAGE = 'Number of generated names.'
+WORKERS_HELP_MESSAGE = 'Number of worker processes to generate names in parallel.'
+UNIQUE_HELP_MESSAGE = 'Generate every name at most once.'
+EXCLUDE_PATH_HELP_MESSAGE = 'Path to the names index file of names which must not be generated.'
+STATS_HELP_MESSAGE = 'Print counters and timings of generation stages to the standard error.'
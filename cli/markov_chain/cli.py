@@ -0,0 +1,69 @@
+"""
+Provide implementation of the command line interface's Markov chain commands.
+"""
+import sys
+
+import click
+
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.markov_chain.help import (
+    MODEL_PATH_HELP_MESSAGE,
+    ORDER_HELP_MESSAGE,
+    SEED_DATA_PATH_HELP_MESSAGE,
+    UPDATE_HELP_MESSAGE,
+)
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+from eos_name_generator.constants import (
+    MARKOV_CHAIN_ORDER,
+    SEED_DATA_PATH,
+)
+
+
+@click.group('markov_chain')
+def markov_chain_commands():
+    """
+    Provide commands for working with Markov chain models.
+    """
+
+
+@click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--order', type=int, required=False, help=ORDER_HELP_MESSAGE, default=MARKOV_CHAIN_ORDER)
+@click.option('--model-path', '-o', type=str, required=True, help=MODEL_PATH_HELP_MESSAGE)
+@click.option('--update', is_flag=True, required=False, help=UPDATE_HELP_MESSAGE)
+@markov_chain_commands.command('fit')
+def fit_markov_chain(seed_data_path, order, model_path, update):
+    """
+    Fit Markov chain model on seed data and save it into the memory-mapped format.
+    """
+    from cli.markov_chain.forms import FitMarkovChainForm
+    from eos_name_generator.markov_chain_generator.model import MarkovChainModel
+    from eos_name_generator.random_generator.data_reader import DataReader
+
+    arguments, errors = FitMarkovChainForm().load({
+        'seed_data_path': seed_data_path,
+        'order': order,
+        'model_path': model_path,
+        'update': update,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    seed_data_path = arguments.get('seed_data_path')
+    model_path = arguments.get('model_path')
+
+    try:
+        model = MarkovChainModel.load(model_path) if arguments.get('update') else \
+            MarkovChainModel(order=arguments.get('order'))
+        model.fit(DataReader(data_path=seed_data_path).get_dictionary_by_word_len())
+        model.save(model_path)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(model_path)
@@ -0,0 +1,31 @@
+"""
+Provide forms for command line interface's Markov chain commands.
+"""
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+)
+
+from eos_name_generator.constants import MARKOV_CHAIN_MAX_ORDER
+
+
+class FitMarkovChainForm(Schema):
+    """
+    Fit Markov chain model form.
+    """
+
+    seed_data_path = fields.String(required=True)
+    order = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(
+                min=1,
+                max=MARKOV_CHAIN_MAX_ORDER,
+                error=f'Order must be between 1 and {MARKOV_CHAIN_MAX_ORDER}.',
+            ),
+        ],
+    )
+    model_path = fields.String(required=True)
+    update = fields.Bool(required=False)
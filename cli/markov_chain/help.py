@@ -0,0 +1,7 @@
+"""
+Provide help messages for command line interface's Markov chain commands.
+"""
+SEED_DATA_PATH_HELP_MESSAGE = 'Path to the seed data the Markov chain model is fitted on.'
+ORDER_HELP_MESSAGE = 'Number of the previous characters the next character depends on.'
+MODEL_PATH_HELP_MESSAGE = 'Path to the Markov chain model file to be written.'
+UPDATE_HELP_MESSAGE = 'Fit the saved Markov chain model on the seed data instead of fitting the new model.'
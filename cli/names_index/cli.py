@@ -0,0 +1,71 @@
+"""
+Provide implementation of the command line interface's names index commands.
+"""
+import sys
+
+import click
+
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.names_index.help import (
+    BLOOM_FILTER_ERROR_RATE_HELP_MESSAGE,
+    INDEX_PATH_HELP_MESSAGE,
+    NAMES_PATH_HELP_MESSAGE,
+)
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+
+
+@click.group('names_index')
+def names_index_commands():
+    """
+    Provide commands for working with names indices.
+    """
+
+
+@click.option('--names-path', type=str, required=True, help=NAMES_PATH_HELP_MESSAGE)
+@click.option('--index-path', '-o', type=str, required=True, help=INDEX_PATH_HELP_MESSAGE)
+@click.option('--bloom-filter-error-rate', type=float, required=False, help=BLOOM_FILTER_ERROR_RATE_HELP_MESSAGE)
+@names_index_commands.command('compile')
+def compile_names_index(names_path, index_path, bloom_filter_error_rate):
+    """
+    Compile names into the binary memory-mapped index of names excluded from generation.
+    """
+    from cli.names_index.forms import CompileNamesIndexForm
+    from eos_name_generator.utils.names_index import (
+        BloomFilter,
+        SortedNamesArray,
+        read_encoded_names,
+    )
+
+    arguments, errors = CompileNamesIndexForm().load({
+        'names_path': names_path,
+        'index_path': index_path,
+        'bloom_filter_error_rate': bloom_filter_error_rate,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    names_path = arguments.get('names_path')
+    index_path = arguments.get('index_path')
+    bloom_filter_error_rate = arguments.get('bloom_filter_error_rate')
+
+    try:
+        names = read_encoded_names(names_path)
+
+        if bloom_filter_error_rate is None:
+            names_index = SortedNamesArray(names=names)
+        else:
+            names_index = BloomFilter.for_capacity(capacity=len(names), error_rate=bloom_filter_error_rate)
+            names_index.add(names)
+
+        names_index.save(index_path)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(index_path)
@@ -0,0 +1,25 @@
+"""
+Provide forms for command line interface's names index commands.
+"""
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+)
+
+
+class CompileNamesIndexForm(Schema):
+    """
+    Compile names index form.
+    """
+
+    names_path = fields.String(required=True)
+    index_path = fields.String(required=True)
+    bloom_filter_error_rate = fields.Float(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=0, max=1, error='Bloom filter error rate must be between 0 and 1.'),
+        ],
+    )
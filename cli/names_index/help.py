@@ -0,0 +1,6 @@
+"""
+Provide help messages for command line interface's names index commands.
+"""
+NAMES_PATH_HELP_MESSAGE = 'Path to the text file of names (e.g. registered accounts), one name per line.'
+INDEX_PATH_HELP_MESSAGE = 'Path to the names index file to be written.'
+BLOOM_FILTER_ERROR_RATE_HELP_MESSAGE = 'False positive rate of the Bloom filter compiled instead of the exact index.'
@@ -0,0 +1,105 @@
+"""
+Provide implementation of the command line interface's names server commands.
+"""
+import signal
+import sys
+
+import click
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NUMBERS_PROBABILITY,
+)
+from cli.names_server.help import (
+    HOST_HELP_MESSAGE,
+    NUM_HELP_MESSAGE,
+    NUMBERS_PROBABILITY_HELP_MESSAGE,
+    PORT_HELP_MESSAGE,
+    SEED_DATA_PATH_HELP_MESSAGE,
+    SOCKET_PATH_HELP_MESSAGE,
+)
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+from eos_name_generator.constants import (
+    NAMES_SERVER_HOST,
+    SEED_DATA_PATH,
+)
+
+
+@click.option('--socket-path', type=str, required=False, help=SOCKET_PATH_HELP_MESSAGE)
+@click.option('--host', type=str, required=False, help=HOST_HELP_MESSAGE, default=NAMES_SERVER_HOST)
+@click.option('--port', type=int, required=False, help=PORT_HELP_MESSAGE)
+@click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--numbers-probabilities', type=float, required=False, help=NUMBERS_PROBABILITY_HELP_MESSAGE,
+              default=NUMBERS_PROBABILITY)
+@click.command('serve')
+def serve_names(socket_path, host, port, seed_data_path, numbers_probabilities):
+    """
+    Serve names of the warm generator over the Unix domain socket or the TCP socket until interrupted.
+    """
+    from cli.names_server.forms import ServeForm
+    from eos_name_generator import RandomNameGenerator
+    from eos_name_generator.names_server import NamesServer
+
+    arguments, errors = ServeForm().load({
+        'socket_path': socket_path,
+        'host': host,
+        'port': port,
+        'seed_data_path': seed_data_path,
+        'numbers_probabilities': numbers_probabilities,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    try:
+        generator = RandomNameGenerator(
+            numbers_probabilities=arguments.get('numbers_probabilities'),
+            seed_data_path=arguments.get('seed_data_path'),
+        )
+        names_server = NamesServer(
+            generator=generator,
+            socket_path=arguments.get('socket_path'),
+            host=arguments.get('host'),
+            port=arguments.get('port'),
+        )
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    address = names_server.address
+    print_result(address if isinstance(address, str) else f'{address[0]}:{address[1]}')
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        names_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        names_server.close()
+
+
+@click.option('--socket-path', type=str, required=False, help=SOCKET_PATH_HELP_MESSAGE)
+@click.option('--host', type=str, required=False, help=HOST_HELP_MESSAGE, default=NAMES_SERVER_HOST)
+@click.option('--port', type=int, required=False, help=PORT_HELP_MESSAGE)
+@click.option('--num', '-n', type=click.IntRange(min=1), required=False, help=NUM_HELP_MESSAGE, default=1)
+@click.command('client')
+def request_names(socket_path, host, port, num):
+    """
+    Request names from the names server.
+    """
+    from eos_name_generator.names_server.client import NamesClient
+
+    try:
+        with NamesClient(socket_path=socket_path, host=host, port=port) as names_client:
+            names = names_client.generate_list(num)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result('\n'.join(names))
@@ -0,0 +1,34 @@
+"""
+Provide forms for command line interface's names server commands.
+"""
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+)
+
+
+class ServeForm(Schema):
+    """
+    Serve names form.
+    """
+
+    socket_path = fields.String(allow_none=True, required=False)
+    host = fields.String(required=True)
+    port = fields.Integer(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=0, max=65535, error='Port must be between 0 and 65535.'),
+        ],
+    )
+    seed_data_path = fields.String(required=True)
+    numbers_probabilities = fields.Float(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=0, max=1, error='Numbers probabilities must be between 0 and 1.'),
+        ],
+    )
@@ -0,0 +1,9 @@
+"""
+Provide help messages for command line interface's names server commands.
+"""
+SOCKET_PATH_HELP_MESSAGE = 'Path to the Unix domain socket of the names server.'
+HOST_HELP_MESSAGE = 'Host of the TCP socket of the names server.'
+PORT_HELP_MESSAGE = 'Port of the TCP socket of the names server, used instead of the Unix domain socket.'
+SEED_DATA_PATH_HELP_MESSAGE = 'Path to the data based on which the name will be generated.'
+NUMBERS_PROBABILITY_HELP_MESSAGE = 'The probability of occurrence of numbers in the generated word.'
+NUM_HELP_MESSAGE = 'Number of requested names.'
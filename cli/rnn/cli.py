@@ -0,0 +1,113 @@
+"""
+Provide implementation of the command line interface's recurrent neural network commands.
+"""
+import sys
+
+import click
+
+from cli.constants import FAILED_EXIT_FROM_COMMAND_CODE
+from cli.rnn.help import (
+    BATCH_SIZE_HELP_MESSAGE,
+    CHECKPOINT_PATH_HELP_MESSAGE,
+    HIDDEN_SIZE_HELP_MESSAGE,
+    LEARNING_RATE_HELP_MESSAGE,
+    SEED_DATA_PATH_HELP_MESSAGE,
+    SEED_HELP_MESSAGE,
+    SEQUENCE_LEN_HELP_MESSAGE,
+    STEPS_HELP_MESSAGE,
+    WEIGHTS_PATH_HELP_MESSAGE,
+)
+from cli.utils import (
+    print_errors,
+    print_result,
+)
+from eos_name_generator.constants import (
+    RNN_HIDDEN_SIZE,
+    RNN_LEARNING_RATE,
+    RNN_SEQUENCE_LEN,
+    RNN_TRAINING_BATCH_SIZE,
+    RNN_TRAINING_STEPS,
+    SEED_DATA_PATH,
+)
+
+
+@click.group('rnn')
+def rnn_commands():
+    """
+    Provide commands for working with recurrent neural network models.
+    """
+
+
+@click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--weights-path', '-o', type=str, required=True, help=WEIGHTS_PATH_HELP_MESSAGE)
+@click.option('--checkpoint-path', type=str, required=False, help=CHECKPOINT_PATH_HELP_MESSAGE)
+@click.option('--steps', type=int, required=False, help=STEPS_HELP_MESSAGE, default=RNN_TRAINING_STEPS)
+@click.option('--hidden-size', type=int, required=False, help=HIDDEN_SIZE_HELP_MESSAGE, default=RNN_HIDDEN_SIZE)
+@click.option(
+    '--batch-size', type=int, required=False, help=BATCH_SIZE_HELP_MESSAGE, default=RNN_TRAINING_BATCH_SIZE,
+)
+@click.option('--sequence-len', type=int, required=False, help=SEQUENCE_LEN_HELP_MESSAGE, default=RNN_SEQUENCE_LEN)
+@click.option(
+    '--learning-rate', type=float, required=False, help=LEARNING_RATE_HELP_MESSAGE, default=RNN_LEARNING_RATE,
+)
+@click.option('--seed', type=int, required=False, help=SEED_HELP_MESSAGE)
+@rnn_commands.command('train')
+def train_rnn(
+        seed_data_path,
+        weights_path,
+        checkpoint_path,
+        steps,
+        hidden_size,
+        batch_size,
+        sequence_len,
+        learning_rate,
+        seed,
+):
+    """
+    Train recurrent neural network model on seed data, report progress and save the model weights.
+    """
+    from cli.rnn.forms import TrainRNNForm
+    from eos_name_generator.rnn_generator.trainer import RNNTrainer
+
+    arguments, errors = TrainRNNForm().load({
+        'seed_data_path': seed_data_path,
+        'weights_path': weights_path,
+        'checkpoint_path': checkpoint_path,
+        'steps': steps,
+        'hidden_size': hidden_size,
+        'batch_size': batch_size,
+        'sequence_len': sequence_len,
+        'learning_rate': learning_rate,
+        'seed': seed,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    weights_path = arguments.pop('weights_path')
+    steps = arguments.pop('steps')
+
+    try:
+        trainer = RNNTrainer(**arguments)
+        model = trainer.train(steps=steps, report_callback=print_training_report)
+        model.save(weights_path)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(weights_path)
+
+
+def print_training_report(report):
+    """
+    Print training report to the terminal.
+
+    :param report: `TrainingReport` of the last steps.
+    """
+    report_message = f'step {report.step}, loss {report.loss:.4f}, {report.tokens_per_second:.0f} tokens/sec'
+    if report.max_rss_bytes is not None:
+        report_message += f', max memory {report.max_rss_bytes / 1024 / 1024:.1f} MiB'
+
+    print_result(report_message)
@@ -0,0 +1,54 @@
+"""
+Provide forms for command line interface's recurrent neural network commands.
+"""
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+)
+
+
+class TrainRNNForm(Schema):
+    """
+    Train recurrent neural network model form.
+    """
+
+    seed_data_path = fields.String(required=True)
+    weights_path = fields.String(required=True)
+    checkpoint_path = fields.String(allow_none=True, required=False)
+    steps = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Steps must be greater than 0.'),
+        ],
+    )
+    hidden_size = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Hidden size must be greater than 0.'),
+        ],
+    )
+    batch_size = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Batch size must be greater than 0.'),
+        ],
+    )
+    sequence_len = fields.Integer(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=1, error='Sequence length must be greater than 0.'),
+        ],
+    )
+    learning_rate = fields.Float(
+        strict=True,
+        required=True,
+        validate=[
+            validate.Range(min=0, error='Learning rate must not be negative.'),
+        ],
+    )
+    seed = fields.Integer(allow_none=True, strict=True, required=False)
@@ -0,0 +1,12 @@
+"""
+Provide help messages for command line interface's recurrent neural network commands.
+"""
+SEED_DATA_PATH_HELP_MESSAGE = 'Path to the seed data the model is trained on.'
+WEIGHTS_PATH_HELP_MESSAGE = 'Path to the `.npz` weights file of the trained model to be written.'
+CHECKPOINT_PATH_HELP_MESSAGE = 'Path to the training checkpoint, training is resumed if the checkpoint exists.'
+STEPS_HELP_MESSAGE = 'Total number of training steps, including steps done before the checkpoint.'
+HIDDEN_SIZE_HELP_MESSAGE = 'Hidden size of the model.'
+BATCH_SIZE_HELP_MESSAGE = 'Number of parallel streams trained at once.'
+SEQUENCE_LEN_HELP_MESSAGE = 'Number of characters the gradients are backpropagated through.'
+LEARNING_RATE_HELP_MESSAGE = 'Learning rate of Adam.'
+SEED_HELP_MESSAGE = 'Seed of the weights initialization and words shuffling.'
@@ -0,0 +1,113 @@
+"""
+Provide implementation of the command line interface's seed data commands.
+"""
+import sys
+
+import click
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    NUMBERS_PROBABILITY,
+)
+from cli.seed_data.help import (
+    CAPACITY_SEED_DATA_PATH_HELP_MESSAGE,
+    COMPILED_DATA_PATH_HELP_MESSAGE,
+    NUM_HELP_MESSAGE,
+    NUMBERS_PROBABILITY_HELP_MESSAGE,
+    SEED_DATA_PATH_HELP_MESSAGE,
+)
+from cli.utils import (
+    dict_to_pretty_json,
+    print_errors,
+    print_result,
+)
+from eos_name_generator.constants import SEED_DATA_PATH
+
+
+@click.group('seed_data')
+def seed_data_commands():
+    """
+    Provide commands for working with seed data.
+    """
+
+
+@click.option('--seed-data-path', type=str, required=False, help=SEED_DATA_PATH_HELP_MESSAGE, default=SEED_DATA_PATH)
+@click.option('--compiled-data-path', '-o', type=str, required=True, help=COMPILED_DATA_PATH_HELP_MESSAGE)
+@seed_data_commands.command('compile')
+def compile_seed_data(seed_data_path, compiled_data_path):
+    """
+    Compile seed data into the binary memory-mapped format.
+    """
+    from cli.seed_data.forms import CompileSeedDataForm
+    from eos_name_generator.random_generator.data_reader import DataReader
+
+    arguments, errors = CompileSeedDataForm().load({
+        'seed_data_path': seed_data_path,
+        'compiled_data_path': compiled_data_path,
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    seed_data_path = arguments.get('seed_data_path')
+    compiled_data_path = arguments.get('compiled_data_path')
+
+    try:
+        DataReader(data_path=seed_data_path).compile(compiled_data_path=compiled_data_path)
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(compiled_data_path)
+
+
+@click.option('--seed-data-path', type=str, required=False, help=CAPACITY_SEED_DATA_PATH_HELP_MESSAGE,
+              default=SEED_DATA_PATH)
+@click.option('--numbers-probabilities', type=float, required=False, help=NUMBERS_PROBABILITY_HELP_MESSAGE,
+              default=NUMBERS_PROBABILITY)
+@click.option('--num', '-n', 'nums', type=int, multiple=True, required=False, help=NUM_HELP_MESSAGE)
+@seed_data_commands.command('capacity')
+def seed_data_capacity(seed_data_path, numbers_probabilities, nums):
+    """
+    Estimate the upper bound of the number of distinct names and the expected number of duplicates of seed data.
+    """
+    from cli.seed_data.forms import SeedDataCapacityForm
+    from eos_name_generator import RandomNameGenerator
+
+    arguments, errors = SeedDataCapacityForm().load({
+        'seed_data_path': seed_data_path,
+        'numbers_probabilities': numbers_probabilities,
+        'nums': list(nums),
+    })
+
+    if errors:
+        print_errors(errors=errors)
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    seed_data_path = arguments.get('seed_data_path')
+    numbers_probabilities = arguments.get('numbers_probabilities')
+    nums = arguments.get('nums')
+
+    try:
+        names_space = RandomNameGenerator(
+            seed_data_path=seed_data_path,
+            numbers_probabilities=numbers_probabilities,
+        ).get_names_space()
+
+    except Exception as error:
+        print_errors(errors=str(error))
+        sys.exit(FAILED_EXIT_FROM_COMMAND_CODE)
+
+    print_result(dict_to_pretty_json({
+        'names_space_size_upper_bound': names_space.size_upper_bound,
+        'expected_duplicates': [
+            {
+                'num': num,
+                'expected_distinct_names_num': round(names_space.get_expected_distinct_names_num(num)),
+                'expected_duplicates_num': round(names_space.get_expected_duplicates_num(num)),
+                'expected_duplicates_rate': names_space.get_expected_duplicates_rate(num),
+            } for num in nums
+        ],
+    }))
@@ -0,0 +1,37 @@
+"""
+Provide forms for command line interface's seed data commands.
+"""
+from marshmallow import (
+    Schema,
+    fields,
+    validate,
+)
+
+
+class CompileSeedDataForm(Schema):
+    """
+    Compile seed data form.
+    """
+
+    seed_data_path = fields.String(required=True)
+    compiled_data_path = fields.String(required=True)
+
+
+class SeedDataCapacityForm(Schema):
+    """
+    Estimate capacity of seed data form.
+    """
+
+    seed_data_path = fields.String(required=True)
+    numbers_probabilities = fields.Float(
+        allow_none=True,
+        strict=True,
+        required=False,
+        validate=[
+            validate.Range(min=0, max=1, error='Numbers probabilities must be between 0 and 1.'),
+        ],
+    )
+    nums = fields.List(
+        fields.Integer(strict=True, validate=[validate.Range(min=1, error='Num must be greater than 0.')]),
+        required=False,
+    )
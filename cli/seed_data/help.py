@@ -0,0 +1,8 @@
+"""
+Provide help messages for command line interface's seed data commands.
+"""
+SEED_DATA_PATH_HELP_MESSAGE = 'Path to the text seed data to be compiled.'
+COMPILED_DATA_PATH_HELP_MESSAGE = 'Path to the compiled seed data file to be written.'
+NUMBERS_PROBABILITY_HELP_MESSAGE = 'The probability of occurrence of numbers in the generated word.'
+NUM_HELP_MESSAGE = 'Number of generated names to estimate the expected number of duplicates for, could be repeated.'
+CAPACITY_SEED_DATA_PATH_HELP_MESSAGE = 'Path to the seed data based on which names will be generated.'
@@ -34,6 +34,16 @@ def print_result(result):
     return click.echo(result)
 
 
+def print_stats(stats):
+    """
+    Print generation stats to the standard error, so they are not mixed with the result.
+
+    Arguments:
+        stats (GenerationStats): stats of the generation.
+    """
+    click.echo(dict_to_pretty_json(stats.to_dict()), err=True)
+
+
 def print_errors(errors):
     """
     Print error messages to the terminal.
@@ -44,3 +54,12 @@ def print_errors(errors):
         - https://click.palletsprojects.com/en/7.x/utils/#ansi-colors
     """
     click.secho(dict_to_pretty_json(errors), blink=True, bold=True, fg='red')
+
+
+def get_numpy_random_provider():
+    """
+    Get `numpy.random` random provider.
+    """
+    from numpy import random
+
+    return random
@@ -7,10 +7,52 @@ The module provides 3 methods to generate a name:
     - random name generation based in a ready-made data (word dictionary)
     - markov chain text generation
     - recurrent neural network text generation
+
+Generators are imported on the first access, so importing constants of the package does not import `numpy`.
 """
-from eos_name_generator.random_generator.generator import RandomNameGenerator
+import sys
+from importlib import import_module
+from types import ModuleType
+
+GENERATORS_MODULES = {
+    'MarkovChainNameGenerator': 'eos_name_generator.markov_chain_generator.generator',
+    'RandomNameGenerator': 'eos_name_generator.random_generator.generator',
+    'RNNNameGenerator': 'eos_name_generator.rnn_generator.generator',
+}
 
 __version__ = "0.1.0"
 __version_info__ = tuple(
     int(i) for i in __version__.split(".") if i.isdigit()
 )
+
+
+class _PackageModule(ModuleType):
+    """
+    Implementation of the package module which imports generators on the first access.
+    """
+
+    def __getattr__(self, name):
+        """
+        Lazily import the generator, it is called only for attributes which are not set yet.
+
+        :param name: name of the generator.
+        :return: generator class
+        """
+        if name not in GENERATORS_MODULES:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+        generator_class = getattr(import_module(GENERATORS_MODULES[name]), name)
+        setattr(self, name, generator_class)
+
+        return generator_class
+
+    def __dir__(self):
+        """
+        Get names of the module attributes including not imported generators.
+
+        :return: list of names
+        """
+        return sorted(set(super().__dir__()) | set(GENERATORS_MODULES))
+
+
+sys.modules[__name__].__class__ = _PackageModule
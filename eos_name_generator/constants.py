@@ -3,9 +3,32 @@ Provide constants for BaseGenerator interface.
 """
 from os.path import dirname
 
-from eos_name_generator.utils import FastRandomChoice
-
 EOS_NAME_LENGTH = 12
+EOS_NAME_ALPHABET = '.12345abcdefghijklmnopqrstuvwxyz'
 SEED_DATA_PATH = dirname(__file__) + '/' + 'random_generator/seed_data/nounlist.txt'
 NUMBERS_PROBABILITIES = 0.1
-RANDOM_PROVIDER_INSTANCE = FastRandomChoice()
+NUMBERS_BUFFER_SIZE = 4096
+ITER_NAMES_CHUNK_SIZE = 65_536
+DATA_READER_CHUNK_SIZE = 16 * 1024 * 1024
+SEED_DATA_CACHE_MAX_ENTRIES = 16
+SEED_DATA_CACHE_MAX_BYTES = 256 * 1024 * 1024
+UNIQUE_NAMES_EXACT_MAX_NUM = 10_000_000
+UNIQUE_NAMES_BLOOM_FILTER_ERROR_RATE = 0.001
+UNIQUE_NAMES_MAX_FRUITLESS_REDRAWS = 100
+UNIQUE_NAMES_MIN_REDRAW_NUM = 1024
+MARKOV_CHAIN_ORDER = 3
+MARKOV_CHAIN_MAX_ORDER = 3
+RNN_WEIGHTS_PATH = dirname(__file__) + '/' + 'rnn_generator/weights/nounlist.npz'
+RNN_TEMPERATURE = 1.0
+RNN_BATCH_SIZE = 4096
+RNN_HIDDEN_SIZE = 64
+RNN_TRAINING_BATCH_SIZE = 64
+RNN_SEQUENCE_LEN = 32
+RNN_LEARNING_RATE = 0.003
+RNN_GRADIENT_CLIP_NORM = 5.0
+RNN_CHECKPOINT_INTERVAL = 500
+RNN_REPORT_INTERVAL = 100
+RNN_TRAINING_STEPS = 5000
+NAMES_SERVER_HOST = '127.0.0.1'
+NAMES_SERVER_CHUNK_SIZE = 4096
+NAMES_SERVER_MAX_NAMES_NUM = 65_536
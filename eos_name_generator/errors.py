@@ -8,5 +8,51 @@ class ValidationDataError(Exception):
     Name generation data contains invalid characters or does not match the name length error.
     """
 
+    def __init__(self, message, invalid_lines=None):
+        self.message = message
+        self.invalid_lines = invalid_lines
+
+
+class CompiledDataError(Exception):
+    """
+    Compiled name generation data is truncated, has invalid header or does not match the checksum error.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class MarkovChainModelError(Exception):
+    """
+    Markov chain model file has invalid header, unsupported version or does not match the checksum error.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class RNNModelError(Exception):
+    """
+    Recurrent neural network model weights are missing or have inconsistent shapes error.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class NamesIndexError(Exception):
+    """
+    Names index file has invalid header, unsupported version or does not match the checksum error.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+class NamesServerError(Exception):
+    """
+    Names server responded with the error, closed the connection or is already listening on the socket error.
+    """
+
     def __init__(self, message):
         self.message = message
@@ -28,3 +28,14 @@ class BaseGeneratorInterface(ABC):
         :param num: number of generated names in list.
         :return: `EOS` name
         """
+
+    @abstractmethod
+    def iter_names(self, num: int = None, chunk_size: int = None, as_chunks: bool = False):
+        """
+        Lazily generate `EOS` names.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names generated at once.
+        :param as_chunks: yield `numpy` arrays of names as bytes instead of single names.
+        :return: iterator of `EOS` names
+        """
@@ -1,3 +1,423 @@
 """
 Provide an implementation of the MarkovChainGenerator interface.
 """
+from operator import attrgetter
+
+import numpy as np
+
+from eos_name_generator.constants import (
+    EOS_NAME_LENGTH,
+    ITER_NAMES_CHUNK_SIZE,
+    MARKOV_CHAIN_MAX_ORDER,
+    MARKOV_CHAIN_ORDER,
+    SEED_DATA_PATH,
+)
+from eos_name_generator.interfaces import BaseGeneratorInterface
+from eos_name_generator.markov_chain_generator.model import (
+    END_OF_WORD_SYMBOL,
+    SYMBOLS_BYTES,
+    MarkovChainModel,
+)
+from eos_name_generator.random_generator.data_reader import DataReader
+from eos_name_generator.utils import (
+    DEFAULT_RANDOM_PROVIDER,
+    encode_names,
+    get_random_provider_instance,
+)
+from eos_name_generator.utils.generation_stats import (
+    check_stats,
+    iter_counted_chunks,
+    time_stage,
+)
+from eos_name_generator.utils.names_index import (
+    create_unique_names_index,
+    iter_filtered_names_chunks,
+)
+
+
+class MarkovChainNameGenerator(BaseGeneratorInterface):
+    """
+    Implementation of the MarkovChainNameGenerator.
+
+    Character transitions of the order `order` are fitted on the seed data words. Name is generated
+    symbol by symbol, the chain returns to the start of a new word when the word ends, until the name
+    has `EOS_NAME_LENGTH` characters.
+
+    With `model_path`, the saved model is loaded instead of fitting the model on the seed data.
+    """
+
+    def __init__(
+            self,
+            seed_data_path=SEED_DATA_PATH,
+            order=MARKOV_CHAIN_ORDER,
+            random_provider_instance=DEFAULT_RANDOM_PROVIDER,
+            model_path=None,
+            stats=None,
+    ):
+        """
+        `MarkovChainNameGenerator` constructor.
+
+        :param seed_data_path: path to the data based on which the Markov chain will be fitted.
+        :param order: number of the previous characters the next character depends on.
+        :param random_provider_instance: the random provider instance, `get_random_provider_instance()` by default.
+        :param model_path: path to the saved Markov chain model, `seed_data_path` and `order` are not used if set.
+        :param stats: `GenerationStats` instance, stats are not recorded if `None`.
+        """
+        self.__model = None
+        self._seed_data_path = seed_data_path
+        self._order = order
+        self._model_path = model_path
+
+        if random_provider_instance is DEFAULT_RANDOM_PROVIDER:
+            random_provider_instance = get_random_provider_instance()
+
+        self.random_provider = random_provider_instance
+        self.stats = stats
+        self.data_provider = DataReader
+
+    def generate(self) -> str:
+        """
+        Generate `EOS` name method.
+
+        :return: `EOS` name str
+        """
+        names = self.__generate_batch(1)
+        if self._stats is not None:
+            self._stats.count('bytes_emitted', len(names[0]))
+
+        with time_stage(self._stats, 'string_building'):
+            return names[0].decode()
+
+    def generate_list(self, num: int, unique: bool = False, exclude=None, encoded: bool = False) -> list:
+        """
+        Generate list of `EOS` names method.
+
+        Names are generated by chunks of `ITER_NAMES_CHUNK_SIZE` names, so the arrays of the batch
+        engine stay small enough to be cache friendly.
+
+        :param num: number of generated names in list.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: return `numpy` array of names encoded into `uint64` values instead of the list.
+        :return: `EOS` name
+        """
+        names_chunks = self.__iter_chunks(num=num, chunk_size=ITER_NAMES_CHUNK_SIZE, unique=unique, exclude=exclude)
+        if encoded:
+            names_chunks = self.__iter_encoded_chunks(names_chunks)
+
+        if self._stats is not None:
+            names_chunks = iter_counted_chunks(
+                names_chunks, stats=self._stats, counter='bytes_emitted', get_num=attrgetter('nbytes'),
+            )
+
+        if encoded:
+            return np.concatenate([np.array([], dtype=np.uint64)] + list(names_chunks))
+
+        return list(self.__iter_names_from_chunks(names_chunks))
+
+    def iter_names(
+            self,
+            num: int = None,
+            chunk_size: int = ITER_NAMES_CHUNK_SIZE,
+            as_chunks: bool = False,
+            unique: bool = False,
+            exclude=None,
+            encoded: bool = False,
+    ):
+        """
+        Lazily generate `EOS` names method.
+
+        Names are generated by chunks of `chunk_size` names, so the memory usage does not depend on `num`,
+        unless `unique` is set, then already generated names are tracked as `uint64` values.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names generated at once.
+        :param as_chunks: yield `numpy` arrays of names as bytes instead of single names.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: generate names encoded into `uint64` values (see `encode_names`) instead of strings.
+        :return: iterator of `EOS` names
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be greater than 0.')
+
+        names_chunks = self.__iter_chunks(num=num, chunk_size=chunk_size, unique=unique, exclude=exclude)
+        if encoded:
+            names_chunks = self.__iter_encoded_chunks(names_chunks)
+
+        if self._stats is not None:
+            names_chunks = iter_counted_chunks(
+                names_chunks, stats=self._stats, counter='bytes_emitted', get_num=attrgetter('nbytes'),
+            )
+
+        if as_chunks:
+            return names_chunks
+
+        return self.__iter_names_from_chunks(names_chunks)
+
+    @property
+    def seed_data_path(self) -> str:
+        """
+        Get `seed_data_path` variable.
+
+        :return: `seed_data_path` string value
+        """
+        return self._seed_data_path
+
+    @seed_data_path.setter
+    def seed_data_path(self, value):
+        """
+        Set `seed_data_path` value and fit new Markov chain model, the saved model is not used anymore.
+
+        :param value: `seed_data_path` variable value
+        """
+        self._seed_data_path = value
+        self._model_path = None
+        self.data_provider.data_path = value
+        self.__update_model()
+
+    @property
+    def order(self) -> int:
+        """
+        Get `order` variable.
+
+        :return: `order` int value
+        """
+        return self._order
+
+    @order.setter
+    def order(self, value):
+        """
+        Set `order` value and fit new Markov chain model, the saved model is not used anymore.
+
+        :param value: `order` variable value
+        """
+        if not 1 <= value <= MARKOV_CHAIN_MAX_ORDER:
+            raise ValueError(f'The order of the Markov chain must be between 1 and {MARKOV_CHAIN_MAX_ORDER}.')
+
+        self._order = value
+        self._model_path = None
+        self.__update_model()
+
+    @property
+    def model_path(self) -> str:
+        """
+        Get `model_path` variable.
+
+        :return: `model_path` string value
+        """
+        return self._model_path
+
+    @model_path.setter
+    def model_path(self, value):
+        """
+        Set `model_path` value and load the saved Markov chain model.
+
+        :param value: `model_path` variable value
+        """
+        self._model_path = value
+        self.__update_model()
+
+    @property
+    def model(self) -> MarkovChainModel:
+        """
+        Get fitted Markov chain model.
+
+        :return: `MarkovChainModel` instance
+        """
+        return self.__model
+
+    @property
+    def stats(self):
+        """
+        Get `stats` variable.
+
+        :return: `stats` instance.
+        """
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        """
+        Set `stats` value.
+
+        :param value: `stats` instance, stats are not recorded if `None`.
+        """
+        check_stats(value)
+        self._stats = value
+
+    @property
+    def random_provider(self):
+        """
+        Get `random_provider` variable.
+
+        :return: `random_provider` instance.
+        """
+        return self._random_provider
+
+    @random_provider.setter
+    def random_provider(self, value):
+        """
+        Set `random_provider` value.
+
+        :param value: `random_provider` instance.
+        """
+        required_method = 'random_sample'
+
+        if required_method not in dir(value):
+
+            error_message = f'The interface `random_provider` does not contain {required_method} method.'
+            raise AttributeError(error_message)
+
+        self._random_provider = value
+
+    @property
+    def data_provider(self):
+        """
+        Get `data_provider` variable.
+
+        :return: `data_provider` instance.
+        """
+        return self._data_provider
+
+    @data_provider.setter
+    def data_provider(self, value):
+        """
+        Set `data_provider` variable.
+
+        :param value: `data_provider` variable value.
+        """
+        data_provider_dir = dir(value)
+        required_method = 'get_dictionary_by_word_len'
+
+        if required_method not in data_provider_dir:
+
+            error_message = f'The interface `data_provider` does not contain {required_method} method.'
+            raise AttributeError(error_message)
+
+        self._data_provider = value(self.seed_data_path)
+        self.__update_model()
+
+    def __update_model(self):
+        """
+        Load the saved Markov chain model or fit the model on the words from `data_provider`.
+        """
+        if self.model_path is not None:
+            self.__model = MarkovChainModel.load(self.model_path)
+            self._order = self.__model.order
+            return
+
+        self.__model = MarkovChainModel(order=self.order).fit(self.data_provider.get_dictionary_by_word_len())
+
+    def __iter_names_from_chunks(self, names_chunks):
+        """
+        Lazily split chunks of `EOS` names into names.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes or as `uint64` values.
+        :return: iterator of `EOS` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                if names_chunk.dtype.kind == 'S':
+                    names_chunk = names_chunk.astype(f'U{EOS_NAME_LENGTH}')
+
+                names = names_chunk.tolist()
+
+            yield from names
+
+    def __iter_encoded_chunks(self, names_chunks):
+        """
+        Lazily encode chunks of `EOS` names into `uint64` values.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes.
+        :return: iterator of `numpy` arrays of `uint64` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                encoded_names_chunk = encode_names(names_chunk)
+
+            yield encoded_names_chunk
+
+    def __iter_chunks(self, num, chunk_size, unique=False, exclude=None):
+        """
+        Lazily generate chunks of `EOS` names.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names in a chunk.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :return: iterator of `numpy` arrays of names as bytes
+        """
+        if exclude is not None and 'contains' not in dir(exclude):
+            raise AttributeError('The interface `exclude` does not contain contains method.')
+
+        names_chunks = self.__iter_new_chunks(num=num, chunk_size=chunk_size)
+        if not unique and exclude is None:
+            return names_chunks
+
+        return iter_filtered_names_chunks(
+            names_chunks=names_chunks,
+            generate_chunk=self.__generate_batch,
+            unique_names_index=create_unique_names_index(num) if unique else None,
+            excluded_names=exclude,
+            stats=self._stats,
+        )
+
+    def __iter_new_chunks(self, num, chunk_size):
+        """
+        Lazily generate chunks of `EOS` names, which may contain already generated names.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names in a chunk.
+        :return: iterator of `numpy` arrays of names as bytes
+        """
+        generated_names_num = 0
+        while num is None or generated_names_num < num:
+            names_chunk_size = chunk_size if num is None else min(chunk_size, num - generated_names_num)
+            generated_names_num += names_chunk_size
+
+            yield self.__generate_batch(names_chunk_size)
+
+    def __generate_batch(self, num) -> np.ndarray:
+        """
+        Generate batch of `EOS` names with `numpy` arrays.
+
+        Next symbols of all unfinished names are drawn at once, so the number of steps depends
+        on the name length and the number of words in a name, not on `num`.
+
+        :param num: number of generated names.
+        :return: `numpy` array of `EOS` names as bytes
+        """
+        stats = self._stats
+        if stats is not None:
+            stats.count('draws', num)
+
+        names = np.empty((num, EOS_NAME_LENGTH), dtype=np.uint8)
+        rows = np.arange(num)
+        states = np.zeros(num, dtype=np.intp)
+        positions = np.zeros(num, dtype=np.intp)
+
+        while rows.size:
+            with time_stage(stats, 'sampling'):
+                symbols = self.__model.draw_next_symbols(states, self.random_provider.random_sample(rows.size))
+                is_character = symbols != END_OF_WORD_SYMBOL
+
+            with time_stage(stats, 'string_building'):
+                names[rows[is_character], positions[is_character]] = SYMBOLS_BYTES[symbols[is_character]]
+                positions += is_character
+
+            with time_stage(stats, 'lookup'):
+                states = self.__model.get_next_states(states, symbols)
+
+            is_unfinished = positions < EOS_NAME_LENGTH
+            rows, states, positions = rows[is_unfinished], states[is_unfinished], positions[is_unfinished]
+
+        return names.view(f'S{EOS_NAME_LENGTH}').ravel()
+
+    def __repr__(self):
+        """
+        Debug `repr` method.
+
+        :return: `MarkovChainNameGenerator` object state
+        """
+        return f'<MarkovChainNameGenerator({self.seed_data_path}, {self.order}, {self.random_provider})>'
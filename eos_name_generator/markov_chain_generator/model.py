@@ -0,0 +1,204 @@
+"""
+Provide implementation of the MarkovChainModel.
+"""
+import numpy as np
+
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    MARKOV_CHAIN_MAX_ORDER,
+)
+from eos_name_generator.errors import MarkovChainModelError
+from eos_name_generator.markov_chain_generator.model_data import (
+    read_markov_chain_model,
+    write_markov_chain_model,
+)
+
+ALPHABET_LEN = len(EOS_NAME_ALPHABET)
+END_OF_WORD_SYMBOL = 0
+SYMBOLS_BYTES = np.frombuffer(EOS_NAME_ALPHABET.encode(), dtype=np.uint8)
+SYMBOLS_BY_BYTE = np.zeros(256, dtype=np.intp)
+SYMBOLS_BY_BYTE[SYMBOLS_BYTES] = np.arange(ALPHABET_LEN)
+SEARCH_STEPS = (16, 8, 4, 2, 1)
+
+
+class MarkovChainModel:
+    """
+    Implementation of the character Markov chain model over the `EOS` name alphabet.
+
+    State of the chain is the last `order` symbols encoded as the base-32 number, words are padded
+    with the end of word symbol (`.`) from the left, so the all-zeros state is the start of a word.
+    Transitions are stored as the dense matrix of counts and the dense matrix of cumulative probabilities
+    with one row per state and one column per symbol, so next symbols of the whole batch of states
+    are drawn at once.
+
+    Fitted model is saved to the memory-mappable file and loaded without copying tables, loaded model
+    could be fitted on new words, counts are added to the saved ones.
+    """
+
+    def __init__(self, order, transitions_counts=None, cumulative_probabilities=None):
+        """
+        `MarkovChainModel` constructor.
+
+        :param order: number of the previous symbols the next symbol depends on.
+        :param transitions_counts: matrix of transitions counts, the model is empty if `None`.
+        :param cumulative_probabilities: matrix of cumulative probabilities of `transitions_counts`,
+            it is computed from `transitions_counts` if `None`.
+        """
+        if not 1 <= order <= MARKOV_CHAIN_MAX_ORDER:
+            raise ValueError(f'The order of the Markov chain must be between 1 and {MARKOV_CHAIN_MAX_ORDER}.')
+
+        self.order = order
+        self.states_num = ALPHABET_LEN ** order
+
+        if transitions_counts is None:
+            transitions_counts = np.zeros((self.states_num, ALPHABET_LEN), dtype=np.uint64)
+
+        self.transitions_counts = transitions_counts
+        self.cumulative_probabilities = cumulative_probabilities
+
+        if cumulative_probabilities is None:
+            self.__update_cumulative_probabilities()
+
+    @classmethod
+    def load(cls, model_path, verify_checksum=False):
+        """
+        Load the model from the model file.
+
+        Tables of the model are read-only views of the memory-mapped file.
+
+        :param model_path: path to the model file.
+        :param verify_checksum: verify checksum of transitions tables, the whole file is read.
+        :return: the model
+        """
+        order, transitions_counts, cumulative_probabilities = read_markov_chain_model(
+            model_path, symbols_num=ALPHABET_LEN, verify_checksum=verify_checksum,
+        )
+
+        if not cls.has_start_transitions(transitions_counts):
+            raise MarkovChainModelError('Markov chain model is not fitted on any word')
+
+        return cls(
+            order=order, transitions_counts=transitions_counts, cumulative_probabilities=cumulative_probabilities,
+        )
+
+    def save(self, model_path):
+        """
+        Save the model to the model file.
+
+        :param model_path: path to the model file.
+        """
+        write_markov_chain_model(
+            model_path,
+            order=self.order,
+            transitions_counts=self.transitions_counts,
+            cumulative_probabilities=self.cumulative_probabilities,
+        )
+
+    def fit(self, words_by_word_len):
+        """
+        Count transitions of words and update cumulative probabilities.
+
+        Counts are added to the existing ones, so the model could be fitted on several corpora.
+        The model must have words after fitting, otherwise the chain never leaves the start of a word.
+
+        :param words_by_word_len: dictionary of `numpy` arrays of words as bytes (`S{word_len}` dtype) by word length.
+        :return: the model
+        """
+        transitions = []
+
+        for word_len, words in words_by_word_len.items():
+            words = np.asarray(words, dtype=f'S{word_len}')
+            if not words.size:
+                continue
+
+            words_symbols = np.zeros((len(words), self.order + word_len + 1), dtype=np.intp)
+            words_symbols[:, self.order:-1] = SYMBOLS_BY_BYTE[words.view(np.uint8).reshape(-1, word_len)]
+
+            for position in range(word_len + 1):
+                states = self.get_states(words_symbols[:, position:position + self.order])
+                transitions.append(states * ALPHABET_LEN + words_symbols[:, position + self.order])
+
+        transitions_counts = self.transitions_counts
+        if transitions:
+            new_transitions_counts = np.bincount(np.concatenate(transitions), minlength=transitions_counts.size)
+            new_transitions_counts = new_transitions_counts.astype(np.uint64).reshape(self.states_num, ALPHABET_LEN)
+            # tables of the loaded model are read-only, counts are added into the new matrix
+            transitions_counts = transitions_counts + new_transitions_counts
+
+        if not self.has_start_transitions(transitions_counts):
+            raise ValueError('Unable to fit the Markov chain model, there are no words to fit on.')
+
+        self.transitions_counts = transitions_counts
+        self.__update_cumulative_probabilities()
+
+        return self
+
+    @staticmethod
+    def has_start_transitions(transitions_counts) -> bool:
+        """
+        Check the start of a word has transitions to symbols other than the end of word symbol.
+
+        :param transitions_counts: matrix of transitions counts.
+        :return: `True` if the chain could generate a non-empty word
+        """
+        return bool(transitions_counts[0, END_OF_WORD_SYMBOL + 1:].any())
+
+    @staticmethod
+    def get_states(symbols) -> np.ndarray:
+        """
+        Encode sequences of symbols into states.
+
+        :param symbols: `numpy` matrix of symbols, one row per sequence.
+        :return: `numpy` array of states
+        """
+        states = np.zeros(len(symbols), dtype=np.intp)
+        for column in range(symbols.shape[1]):
+            states = states * ALPHABET_LEN + symbols[:, column]
+
+        return states
+
+    def get_next_states(self, states, symbols) -> np.ndarray:
+        """
+        Get states after the symbols, the end of word symbol returns the chain to the start of a word.
+
+        :param states: `numpy` array of states.
+        :param symbols: `numpy` array of next symbols.
+        :return: `numpy` array of next states
+        """
+        next_states = (states * ALPHABET_LEN + symbols) % self.states_num
+        return np.where(symbols == END_OF_WORD_SYMBOL, 0, next_states)
+
+    def draw_next_symbols(self, states, random_floats) -> np.ndarray:
+        """
+        Draw next symbols of states.
+
+        Symbol is the number of cumulative probabilities of the state not greater than the random float,
+        it is found by the binary search over the row of the state, which is vectorized over all states.
+
+        :param states: `numpy` array of states.
+        :param random_floats: `numpy` array of random floats from `[0.0, 1.0)`, one per state.
+        :return: `numpy` array of symbols
+        """
+        cumulative_probabilities = self.cumulative_probabilities.ravel()
+        rows_offsets = states * ALPHABET_LEN
+        symbols = np.zeros(len(states), dtype=np.intp)
+
+        for step in SEARCH_STEPS:
+            symbols += step * (cumulative_probabilities[rows_offsets + symbols + step - 1] <= random_floats)
+
+        return symbols
+
+    def __update_cumulative_probabilities(self):
+        """
+        Normalize transitions counts into cumulative probabilities.
+
+        States without transitions end the word.
+        """
+        counts = self.transitions_counts.astype(np.float64)
+        counts[counts.sum(axis=1) == 0, END_OF_WORD_SYMBOL] = 1
+
+        cumulative_counts = np.cumsum(counts, axis=1)
+        states_counts = cumulative_counts[:, -1:]
+
+        self.cumulative_probabilities = cumulative_counts / states_counts
+        self.cumulative_probabilities[cumulative_counts == states_counts] = 1
@@ -0,0 +1,66 @@
+"""
+Provide implementation of the Markov chain model file format.
+
+Markov chain model file is a binary file with dense transitions tables of the model:
+    - header: magic bytes, format version, order of the model and `crc32` checksum of the rest of the file
+    - transitions counts: `uint64` matrix with one row per state and one column per symbol
+    - cumulative probabilities: `float64` matrix of the same shape
+
+The file is memory-mapped by `MappedFileFormat`, so tables of large orders are loaded without copying.
+"""
+import numpy as np
+
+from eos_name_generator.errors import MarkovChainModelError
+from eos_name_generator.utils.mapped_file import MappedFileFormat
+
+MARKOV_CHAIN_MODEL_MAGIC = b'EOSNGMC\x00'
+MARKOV_CHAIN_MODEL_VERSION = 1
+
+MARKOV_CHAIN_MODEL_FORMAT = MappedFileFormat(
+    name='Markov chain model',
+    magic=MARKOV_CHAIN_MODEL_MAGIC,
+    version=MARKOV_CHAIN_MODEL_VERSION,
+    fields_format='H',
+    error=MarkovChainModelError,
+)
+
+
+def write_markov_chain_model(model_path, order, transitions_counts, cumulative_probabilities):
+    """
+    Write transitions tables to the Markov chain model file.
+
+    :param model_path: path to the model file.
+    :param order: order of the model.
+    :param transitions_counts: `numpy` matrix of transitions counts.
+    :param cumulative_probabilities: `numpy` matrix of cumulative probabilities.
+    """
+    body = np.ascontiguousarray(transitions_counts, dtype='<u8').tobytes() + \
+        np.ascontiguousarray(cumulative_probabilities, dtype='<f8').tobytes()
+    MARKOV_CHAIN_MODEL_FORMAT.write(model_path, fields=(order,), body=body)
+
+
+def read_markov_chain_model(model_path, symbols_num, verify_checksum=False) -> tuple:
+    """
+    Read transitions tables from the Markov chain model file.
+
+    Tables are read-only views of the memory-mapped file, nothing is copied.
+
+    :param model_path: path to the model file.
+    :param symbols_num: number of symbols of the model, the model has `symbols_num ** order` states.
+    :param verify_checksum: verify `crc32` checksum of transitions tables.
+    :return: tuple of the model order, transitions counts and cumulative probabilities
+    """
+    (order,), model_data = MARKOV_CHAIN_MODEL_FORMAT.read(model_path, verify_checksum=verify_checksum)
+    header_size = MARKOV_CHAIN_MODEL_FORMAT.header_size
+
+    shape = (symbols_num ** order, symbols_num)
+    table_size = shape[0] * shape[1] * 8
+    if len(model_data) != header_size + 2 * table_size:
+        raise MarkovChainModelError('Markov chain model size does not match the order')
+
+    transitions_counts = np.frombuffer(model_data, dtype='<u8', count=table_size // 8, offset=header_size)
+    cumulative_probabilities = np.frombuffer(
+        model_data, dtype='<f8', count=table_size // 8, offset=header_size + table_size,
+    )
+
+    return order, transitions_counts.reshape(shape), cumulative_probabilities.reshape(shape)
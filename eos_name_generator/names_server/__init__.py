@@ -0,0 +1,2 @@
+from eos_name_generator.names_server.client import NamesClient
+from eos_name_generator.names_server.server import NamesServer
@@ -0,0 +1,123 @@
+"""
+Provide implementation of the NamesClient.
+"""
+import socket
+
+from eos_name_generator.constants import (
+    NAMES_SERVER_HOST,
+    NAMES_SERVER_MAX_NAMES_NUM,
+)
+from eos_name_generator.errors import NamesServerError
+from eos_name_generator.names_server.protocol import (
+    LINE_END,
+    NAME_COMMAND,
+    NAMES_COMMAND,
+    OK_STATUS,
+    PING_COMMAND,
+)
+
+
+class NamesClient:
+    """
+    Implementation of the NamesClient.
+
+    Client keeps one connection to the names server, requests are sent one by one over the connection.
+    Client imports neither generators nor `numpy`, so it starts fast.
+    """
+
+    def __init__(self, socket_path=None, host=NAMES_SERVER_HOST, port=None, timeout=None):
+        """
+        `NamesClient` constructor.
+
+        :param socket_path: path to the Unix domain socket of the server, TCP socket is used if `None`.
+        :param host: host of the TCP socket of the server.
+        :param port: port of the TCP socket of the server.
+        :param timeout: timeout of socket operations in seconds, operations are blocking if `None`.
+        """
+        if (socket_path is None) == (port is None):
+            raise ValueError('Either the socket path or the port must be set.')
+
+        if socket_path is not None:
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.settimeout(timeout)
+            try:
+                self.__socket.connect(socket_path)
+            except OSError:
+                self.__socket.close()
+                raise
+        else:
+            self.__socket = socket.create_connection((host, port), timeout=timeout)
+            self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.__file = self.__socket.makefile('rwb')
+
+    def generate(self) -> str:
+        """
+        Request `EOS` name.
+
+        :return: `EOS` name str
+        """
+        return self.__request(NAME_COMMAND)[0]
+
+    def generate_list(self, num: int) -> list:
+        """
+        Request list of `EOS` names.
+
+        Names are requested by at most `NAMES_SERVER_MAX_NAMES_NUM` names per request.
+
+        :param num: number of names in list.
+        :return: list of `EOS` names
+        """
+        names = []
+        while len(names) < num:
+            names_num = min(num - len(names), NAMES_SERVER_MAX_NAMES_NUM)
+            names.extend(self.__request(NAMES_COMMAND + b' ' + str(names_num).encode()))
+
+        return names
+
+    def ping(self):
+        """
+        Check that the server answers requests.
+        """
+        self.__request(PING_COMMAND)
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        self.__file.close()
+        self.__socket.close()
+
+    def __request(self, request) -> list:
+        """
+        Send the request line and read the response line.
+
+        :param request: request line as bytes without the line end.
+        :return: list of words of the successful response
+        """
+        self.__file.write(request + LINE_END)
+        self.__file.flush()
+
+        response = self.__file.readline()
+        if not response:
+            raise NamesServerError('Names server closed the connection.')
+
+        status, _, words = response.rstrip(LINE_END).partition(b' ')
+        if status != OK_STATUS:
+            raise NamesServerError(words.decode())
+
+        return words.decode().split()
+
+    def __enter__(self):
+        """
+        Enter the context of the client.
+
+        :return: the client
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the connection on exit of the context.
+        """
+        self.close()
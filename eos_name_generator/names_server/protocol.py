@@ -0,0 +1,19 @@
+"""
+Provide the line protocol of the names server.
+
+Every request and every response is a line of `ASCII` text, words are separated by spaces:
+    - `name` request is responded with `OK <name>`
+    - `names <num>` request is responded with `OK <name> <name> ...` of `num` names
+    - `ping` request is responded with `OK`
+    - invalid request is responded with `ERROR <message>`
+    - request longer than `MAX_REQUEST_LEN` bytes with the line end is responded with the single `ERROR <message>`
+"""
+NAME_COMMAND = b'name'
+NAMES_COMMAND = b'names'
+PING_COMMAND = b'ping'
+
+OK_STATUS = b'OK'
+ERROR_STATUS = b'ERROR'
+
+LINE_END = b'\n'
+MAX_REQUEST_LEN = 64
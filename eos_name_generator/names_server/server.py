@@ -0,0 +1,256 @@
+"""
+Provide implementation of the NamesServer.
+"""
+import os
+import socket
+import socketserver
+import stat
+import threading
+from itertools import (
+    chain,
+    islice,
+)
+
+from eos_name_generator.constants import (
+    NAMES_SERVER_CHUNK_SIZE,
+    NAMES_SERVER_HOST,
+    NAMES_SERVER_MAX_NAMES_NUM,
+)
+from eos_name_generator.errors import NamesServerError
+from eos_name_generator.names_server.protocol import (
+    ERROR_STATUS,
+    LINE_END,
+    MAX_REQUEST_LEN,
+    NAME_COMMAND,
+    NAMES_COMMAND,
+    OK_STATUS,
+    PING_COMMAND,
+)
+
+
+class NamesServer:
+    """
+    Implementation of the NamesServer.
+
+    Server keeps the warm generator in memory and answers requests of the line protocol (see `protocol`)
+    over the Unix domain socket or the TCP socket. Every client connection is served by its own thread,
+    names of all connections are taken from one lazy stream of names of the generator, which is
+    generated by chunks of `chunk_size` names, so the name request costs a slice of the already generated chunk.
+    """
+
+    def __init__(
+            self,
+            generator,
+            socket_path=None,
+            host=NAMES_SERVER_HOST,
+            port=None,
+            chunk_size=NAMES_SERVER_CHUNK_SIZE,
+    ):
+        """
+        `NamesServer` constructor.
+
+        :param generator: generator with `iter_names` method.
+        :param socket_path: path to the Unix domain socket, TCP socket is used if `None`.
+        :param host: host of the TCP socket.
+        :param port: port of the TCP socket, the port is chosen by the system if `0`.
+        :param chunk_size: number of names generated at once.
+        """
+        if (socket_path is None) == (port is None):
+            raise ValueError('Either the socket path or the port must be set.')
+
+        if 'iter_names' not in dir(generator):
+            raise AttributeError('The interface `generator` does not contain iter_names method.')
+
+        self.generator = generator
+        self.socket_path = socket_path
+
+        self.__names = chain.from_iterable(
+            names_chunk.tolist() for names_chunk in generator.iter_names(chunk_size=chunk_size, as_chunks=True)
+        )
+        self.__names_lock = threading.Lock()
+
+        if socket_path is not None:
+            _remove_stale_socket(socket_path)
+            self.__server = _ThreadingUnixStreamServer(socket_path, _NamesRequestHandler)
+        else:
+            self.__server = _ThreadingTCPServer((host, port), _NamesRequestHandler)
+
+        self.__server.names_server = self
+
+    @property
+    def address(self):
+        """
+        Get the address the server is listening on.
+
+        :return: path to the Unix domain socket or tuple of the host and the port
+        """
+        return self.__server.server_address
+
+    def serve_forever(self):
+        """
+        Serve requests until `shutdown` is called.
+        """
+        self.__server.serve_forever()
+
+    def shutdown(self):
+        """
+        Stop `serve_forever` loop, should be called from another thread.
+        """
+        self.__server.shutdown()
+
+    def close(self):
+        """
+        Close the listening socket and remove the Unix domain socket file.
+        """
+        self.__server.server_close()
+
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def get_response(self, request) -> bytes:
+        """
+        Get the response line to the request line.
+
+        :param request: request line as bytes.
+        :return: response line as bytes
+        """
+        command, *arguments = request.split() or [b'']
+
+        if command == NAME_COMMAND and not arguments:
+            names = self.__get_names(1)
+
+        elif command == NAMES_COMMAND and len(arguments) == 1 and arguments[0].isdigit():
+            num = int(arguments[0])
+            if not 1 <= num <= NAMES_SERVER_MAX_NAMES_NUM:
+                return _get_error_response(f'Num must be between 1 and {NAMES_SERVER_MAX_NAMES_NUM}.')
+
+            names = self.__get_names(num)
+
+        elif command == PING_COMMAND and not arguments:
+            names = []
+
+        else:
+            return _get_error_response(f'Unknown request `{request.strip().decode(errors="replace")}`.')
+
+        return b' '.join([OK_STATUS, *names]) + LINE_END
+
+    def __get_names(self, num) -> list:
+        """
+        Take names from the stream of generated names.
+
+        :param num: number of names.
+        :return: list of names as bytes
+        """
+        with self.__names_lock:
+            return list(islice(self.__names, num))
+
+    def __enter__(self):
+        """
+        Enter the context of the server.
+
+        :return: the server
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the server on exit of the context.
+        """
+        self.close()
+
+    def __repr__(self):
+        """
+        Debug `repr` method.
+
+        :return: `NamesServer` object state
+        """
+        return f'<NamesServer({self.address}, {self.generator})>'
+
+
+class _NamesRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler of the client connection, answers request lines until the client closes the connection.
+    """
+
+    def setup(self):
+        """
+        Disable the Nagle algorithm of TCP connections, so short responses are sent without delay.
+        """
+        self.disable_nagle_algorithm = self.request.family != socket.AF_UNIX
+        super().setup()
+
+    def handle(self):
+        """
+        Answer request lines of the connection.
+
+        Request line longer than `MAX_REQUEST_LEN` bytes is read to the end and answered with the single error.
+        """
+        while True:
+            request = self.rfile.readline(MAX_REQUEST_LEN)
+            if not request:
+                break
+
+            if len(request) == MAX_REQUEST_LEN and not request.endswith(LINE_END):
+                self.__skip_line()
+                self.wfile.write(_get_error_response(f'Request is longer than {MAX_REQUEST_LEN} bytes.'))
+                continue
+
+            self.wfile.write(self.server.names_server.get_response(request))
+
+    def __skip_line(self):
+        """
+        Discard the rest of the request line, it is read by `MAX_REQUEST_LEN` bytes.
+        """
+        while True:
+            line_tail = self.rfile.readline(MAX_REQUEST_LEN)
+            if not line_tail or line_tail.endswith(LINE_END):
+                break
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    """
+    TCP server which serves every connection by the daemon thread.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Unix domain socket server which serves every connection by the daemon thread.
+    """
+
+    daemon_threads = True
+
+
+def _get_error_response(message) -> bytes:
+    """
+    Get the error response line.
+
+    :param message: error message.
+    :return: response line as bytes
+    """
+    return ERROR_STATUS + b' ' + message.encode() + LINE_END
+
+
+def _remove_stale_socket(socket_path):
+    """
+    Remove the Unix domain socket file left by the stopped server.
+
+    :param socket_path: path to the Unix domain socket.
+    """
+    if not os.path.exists(socket_path):
+        return
+
+    if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        raise NamesServerError(f'{socket_path} is not a socket.')
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+        try:
+            stale_socket.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+
+    raise NamesServerError(f'Names server is already listening on {socket_path}.')
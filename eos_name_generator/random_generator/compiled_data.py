@@ -0,0 +1,120 @@
+"""
+Provide implementation of the compiled seed data format.
+
+Compiled seed data is a binary file with validated words bucketed by the word length:
+    - header: magic bytes, format version, number of buckets and `crc32` checksum of the rest of the file
+    - buckets table: word length, number of words, data offset and word length probability of every bucket
+    - data: words of every bucket as contiguous fixed-width bytes aligned to 8 bytes
+
+The file is memory-mapped by `MappedFileFormat`, so words of the corpus are not copied on reading.
+"""
+import struct
+
+import numpy as np
+
+from eos_name_generator.errors import CompiledDataError
+from eos_name_generator.utils.mapped_file import MappedFileFormat
+
+COMPILED_DATA_MAGIC = b'EOSNGSD\x00'
+COMPILED_DATA_VERSION = 1
+COMPILED_DATA_ALIGNMENT = 8
+
+COMPILED_DATA_FORMAT = MappedFileFormat(
+    name='Compiled data',
+    magic=COMPILED_DATA_MAGIC,
+    version=COMPILED_DATA_VERSION,
+    fields_format='H',
+    error=CompiledDataError,
+)
+BUCKET_STRUCT = struct.Struct('<IQQd')
+
+
+def is_compiled_data(data_path) -> bool:
+    """
+    Check if the data file is compiled seed data.
+
+    :param data_path: path to the data file.
+    :return: `True` if the file starts with the compiled seed data magic bytes
+    """
+    with open(data_path, 'rb') as f:
+        magic = f.read(len(COMPILED_DATA_MAGIC))
+
+    return magic == COMPILED_DATA_MAGIC
+
+
+def write_compiled_data(compiled_data_path, data_dictionary_by_word_len, probabilities_by_word_len=None):
+    """
+    Write seed data dictionary to the compiled seed data file.
+
+    :param compiled_data_path: path to the compiled data file.
+    :param data_dictionary_by_word_len: dictionary where the key is the word length
+        and the value is `numpy` array of fixed-width bytes.
+    :param probabilities_by_word_len: dictionary of word length probabilities,
+        they are computed from numbers of words of `data_dictionary_by_word_len` if `None`.
+    """
+    if probabilities_by_word_len is None:
+        words_num = sum(len(words) for words in data_dictionary_by_word_len.values())
+        probabilities_by_word_len = {
+            word_len: len(words) / words_num for word_len, words in data_dictionary_by_word_len.items()
+        }
+
+    data_offset = _align_size(COMPILED_DATA_FORMAT.header_size + BUCKET_STRUCT.size * len(data_dictionary_by_word_len))
+
+    buckets_table = b''
+    data = b''
+    for word_len, words in sorted(data_dictionary_by_word_len.items()):
+        words_data = np.asarray(words, dtype=f'S{word_len}').tobytes()
+        probability = probabilities_by_word_len[word_len]
+
+        buckets_table += BUCKET_STRUCT.pack(word_len, len(words), data_offset + len(data), probability)
+        data += words_data + b'\x00' * (_align_size(len(words_data)) - len(words_data))
+
+    padding = b'\x00' * (data_offset - COMPILED_DATA_FORMAT.header_size - len(buckets_table))
+    COMPILED_DATA_FORMAT.write(
+        compiled_data_path, fields=(len(data_dictionary_by_word_len),), body=buckets_table + padding + data,
+    )
+
+
+def read_compiled_data(compiled_data_path, verify_checksum=False) -> tuple:
+    """
+    Read seed data dictionary from the compiled seed data file.
+
+    Words arrays are read-only views of the memory-mapped file, nothing is copied.
+
+    :param compiled_data_path: path to the compiled data file.
+    :param verify_checksum: verify `crc32` checksum of words and the buckets table.
+    :return: tuple of the seed data dictionary and the dictionary of word length probabilities
+    """
+    (buckets_num,), compiled_data = COMPILED_DATA_FORMAT.read(compiled_data_path, verify_checksum=verify_checksum)
+
+    if len(compiled_data) < COMPILED_DATA_FORMAT.header_size + buckets_num * BUCKET_STRUCT.size:
+        raise CompiledDataError('Compiled data buckets table is truncated')
+
+    data_dictionary_by_word_len = {}
+    probabilities_by_word_len = {}
+    for bucket_index in range(buckets_num):
+        bucket_offset = COMPILED_DATA_FORMAT.header_size + bucket_index * BUCKET_STRUCT.size
+        word_len, words_num, data_offset, probability = BUCKET_STRUCT.unpack_from(compiled_data, bucket_offset)
+
+        if not word_len:
+            raise CompiledDataError('Compiled data buckets table is invalid')
+
+        if len(compiled_data) < data_offset + words_num * word_len:
+            raise CompiledDataError(f'Compiled data of words of length {word_len} is truncated')
+
+        data_dictionary_by_word_len[word_len] = np.frombuffer(
+            compiled_data, dtype=f'S{word_len}', count=words_num, offset=data_offset,
+        )
+        probabilities_by_word_len[word_len] = probability
+
+    return data_dictionary_by_word_len, probabilities_by_word_len
+
+
+def _align_size(size) -> int:
+    """
+    Align size to `COMPILED_DATA_ALIGNMENT` bytes.
+
+    :param size: size in bytes.
+    :return: aligned size
+    """
+    return -(-size // COMPILED_DATA_ALIGNMENT) * COMPILED_DATA_ALIGNMENT
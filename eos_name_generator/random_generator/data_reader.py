@@ -3,46 +3,292 @@ Provide implementation of the DataReader.
 """
 from collections import defaultdict
 
-from eos_name_generator.constants import EOS_NAME_LENGTH
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from eos_name_generator.constants import (
+    DATA_READER_CHUNK_SIZE,
+    EOS_NAME_LENGTH,
+)
 from eos_name_generator.errors import ValidationDataError
+from eos_name_generator.random_generator.compiled_data import (
+    is_compiled_data,
+    read_compiled_data,
+    write_compiled_data,
+)
+from eos_name_generator.random_generator.seed_data_cache import SEED_DATA_CACHE
+from eos_name_generator.random_generator.words_reservoir import WordsReservoir
+
+LINE_FEED = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+INVALID_LINES_IN_ERROR_MESSAGE = 10
 
 
 class DataReader:
     """
     Implementation of the DataReader.
+
+    Seed data is either a text file with one word per line or a compiled seed data file
+    (see `DataReader.compile`), which is memory-mapped instead of parsing and validation.
     """
 
-    def __init__(self, data_path):
+    def __init__(
+            self,
+            data_path,
+            seed_data_cache=SEED_DATA_CACHE,
+            skip_invalid=False,
+            chunk_size=DATA_READER_CHUNK_SIZE,
+            reservoir_size=None,
+            reservoir_seed=None,
+    ):
+        """
+        `DataReader` constructor.
+
+        Text seed data is read by chunks of `chunk_size` bytes, words are bucketed by the word length
+        as chunks are read. With `reservoir_size`, only a uniform sample of at most `reservoir_size` words
+        of each length is kept, so the memory usage does not depend on the seed data size.
+
+        :param data_path: path to the seed data.
+        :param seed_data_cache: cache of the parsed seed data shared by readers, cache is not used if `None`.
+        :param skip_invalid: skip invalid words instead of raising `ValidationDataError`.
+        :param chunk_size: size of the read data chunk in bytes.
+        :param reservoir_size: maximum number of kept words of each length, all words are kept if `None`.
+        :param reservoir_seed: seed of the reservoir sampling.
+        """
         self.data_path = data_path
+        self.seed_data_cache = seed_data_cache
+        self.skip_invalid = skip_invalid
+        self.chunk_size = chunk_size
+        self.reservoir_size = reservoir_size
+        self.reservoir_seed = reservoir_seed
 
-    def get_dictionary_by_word_len(self) -> defaultdict:
+    def get_dictionary_by_word_len(self) -> dict:
         """
         Read data from `seed_data_path`.
 
         Read data from `seed_data_path` and transform it into `dictionary` object
-        where the key is the word length.
+        where the key is the word length and the value is read-only `numpy` array of fixed-width bytes
+        (`S{word_len}` dtype), so words of the same length are stored in one contiguous buffer.
+        Keys are sorted by the word length.
+        """
+        data_dictionary_by_word_len, _ = self.__read_data()
+        return dict(data_dictionary_by_word_len)
+
+    def get_probabilities_by_word_len(self) -> dict:
+        """
+        Get probabilities of the word length based on word frequency in `seed_data_path`.
+
+        Probabilities are based on all valid words, even if only the reservoir sample of words is kept.
+
+        :return: dictionary where the key is the word length and the value is the probability
+        """
+        _, probabilities_by_word_len = self.__read_data()
+        return dict(probabilities_by_word_len)
+
+    def compile(self, compiled_data_path):
+        """
+        Compile validated data from `seed_data_path` into the binary compiled seed data file.
+
+        Compiled seed data file contains words bucketed by the word length, word length probabilities
+        and checksum, it could be used as `seed_data_path` to skip reading and validation of the text data.
+        Word length probabilities are based on all valid words, even if only the reservoir sample of words is kept.
+
+        :param compiled_data_path: path to the compiled data file.
+        """
+        data_dictionary_by_word_len, probabilities_by_word_len = self.__read_data()
+        write_compiled_data(compiled_data_path, data_dictionary_by_word_len, probabilities_by_word_len)
+
+    def __read_data(self) -> tuple:
+        """
+        Read data from `seed_data_path` or get it from the seed data cache.
+
+        :return: tuple of the seed data dictionary and the dictionary of word length probabilities
+        """
+        is_random_sample = self.reservoir_size is not None and self.reservoir_seed is None
+        if self.seed_data_cache is None or is_random_sample:
+            return self.__parse_data()
+
+        cache_key = self.seed_data_cache.get_key(
+            self.data_path, self.skip_invalid, self.reservoir_size, self.reservoir_seed,
+        )
+        seed_data = self.seed_data_cache.get(cache_key)
+
+        if seed_data is None:
+            seed_data = self.__parse_data()
+            data_dictionary_by_word_len, _ = seed_data
+            seed_data_bytes = sum(words.nbytes for words in data_dictionary_by_word_len.values())
+            self.seed_data_cache.put(cache_key, seed_data, seed_data_bytes)
+
+        return seed_data
+
+    def __parse_data(self) -> tuple:
+        """
+        Parse data from `seed_data_path`.
+
+        :return: tuple of the seed data dictionary and the dictionary of word length probabilities
+        """
+        if is_compiled_data(self.data_path):
+            return read_compiled_data(self.data_path)
+
+        words_chunks_by_word_len = defaultdict(list)
+        reservoirs_by_word_len = {}
+        words_num_by_word_len = defaultdict(int)
+        reservoir_random_generator = np.random.default_rng(self.reservoir_seed)
+        invalid_lines = []
+        lines_num = 0
+
+        for data in self.__iter_data_chunks():
+            words_by_word_len, chunk_invalid_lines, chunk_lines_num = self.__parse_data_chunk(data)
+            invalid_lines.extend((chunk_invalid_lines + lines_num + 1).tolist())
+            lines_num += chunk_lines_num
+
+            if invalid_lines:
+                continue
+
+            for word_len, words in words_by_word_len.items():
+                words_num_by_word_len[word_len] += len(words)
+
+                if self.reservoir_size is None:
+                    words_chunks_by_word_len[word_len].append(words)
+                    continue
+
+                if word_len not in reservoirs_by_word_len:
+                    reservoirs_by_word_len[word_len] = WordsReservoir(
+                        size=self.reservoir_size, word_len=word_len, random_generator=reservoir_random_generator,
+                    )
+
+                reservoirs_by_word_len[word_len].add(words)
+
+        if invalid_lines:
+            raise ValidationDataError(self.__get_validation_error_message(invalid_lines), invalid_lines=invalid_lines)
+
+        words_num = sum(words_num_by_word_len.values())
+        data_dictionary_by_word_len = {}
+        probabilities_by_word_len = {}
+        for word_len in sorted(words_num_by_word_len):
+            if self.reservoir_size is None:
+                words = np.concatenate(words_chunks_by_word_len.pop(word_len))
+            else:
+                words = reservoirs_by_word_len.pop(word_len).words
+
+            words.flags.writeable = False
+
+            data_dictionary_by_word_len[word_len] = words
+            probabilities_by_word_len[word_len] = words_num_by_word_len[word_len] / words_num
+
+        return data_dictionary_by_word_len, probabilities_by_word_len
+
+    def __iter_data_chunks(self):
+        """
+        Lazily read data from `seed_data_path` by chunks of whole lines.
+
+        :return: iterator of `numpy` arrays of data bytes
+        """
+        with open(self.data_path, 'rb') as f:
+            rest_data = b''
+
+            for chunk in iter(lambda: f.read(self.chunk_size), b''):
+                data = rest_data + chunk
+                last_line_break = data.rfind(b'\n')
+
+                if last_line_break == -1:
+                    rest_data = data
+                    continue
+
+                rest_data = data[last_line_break + 1:]
+                yield np.frombuffer(data[:last_line_break + 1], dtype=np.uint8)
+
+            if rest_data:
+                yield np.frombuffer(rest_data, dtype=np.uint8)
+
+    def __parse_data_chunk(self, data) -> tuple:
+        """
+        Parse chunk of whole lines from `seed_data_path`.
+
+        :param data: `numpy` array of data bytes.
+        :return: tuple of the dictionary of the chunk valid words by word length, `numpy` array
+            of the invalid lines indices (empty in skip invalid mode) and the number of lines in the chunk
+        """
+        line_breaks = np.flatnonzero(data == LINE_FEED)
+        lines_starts, lines_ends = self.__split_lines(data, line_breaks)
+        lines_lens = lines_ends - lines_starts
+        is_valid_line = self.__validate_lines(data, line_breaks, lines_starts, lines_ends)
+
+        invalid_lines = np.array([], dtype=np.intp)
+        if not self.skip_invalid:
+            invalid_lines = np.flatnonzero(~is_valid_line)
+
+        words_by_word_len = {}
+        for word_len in np.unique(lines_lens[is_valid_line]).tolist():
+            words_starts = lines_starts[is_valid_line & (lines_lens == word_len)]
+            words_windows = as_strided(data, shape=(len(data) - word_len + 1, word_len), strides=(1, 1))
+
+            words_by_word_len[word_len] = words_windows[words_starts].view(f'S{word_len}').ravel()
+
+        return words_by_word_len, invalid_lines, len(lines_starts)
+
+    @staticmethod
+    def __split_lines(data, line_breaks) -> tuple:
         """
-        with open(self.data_path) as f:
-            data = f.read().splitlines()
+        Split data buffer into lines.
+
+        Lines are separated by line feed or carriage return and line feed, the last line break is optional.
+
+        :param data: `numpy` array of data bytes.
+        :param line_breaks: `numpy` array of line feeds positions in the data buffer.
+        :return: tuple of `numpy` arrays of lines starts and ends (exclusive) in the data buffer
+        """
+        lines_starts = np.concatenate(([0], line_breaks + 1))
+        lines_ends = np.concatenate((line_breaks, [len(data)]))
+
+        if lines_starts[-1] == len(data):
+            lines_starts, lines_ends = lines_starts[:-1], lines_ends[:-1]
 
-        self.__validate_data(data)
-        data_dictionary_by_word_len = defaultdict(list)
-        for word in data:
-            word_len = len(word)
-            data_dictionary_by_word_len[word_len].append(word)
+        is_carriage_return = (lines_ends > lines_starts) & (data[np.maximum(lines_ends - 1, 0)] == CARRIAGE_RETURN)
+        lines_ends = lines_ends - is_carriage_return
 
-        return data_dictionary_by_word_len
+        return lines_starts, lines_ends
 
     @staticmethod
-    def __validate_data(data: list):
+    def __validate_lines(data, line_breaks, lines_starts, lines_ends) -> np.ndarray:
         """
         Seed data validation to generate the correct `eos` name.
 
-        :param data: data to be validated
+        Every line must be a word of lowercase latin letters not longer than the `eos` name.
+        The whole data buffer is checked at once: bytes out of the `a-z` range, except line breaks,
+        are mapped to their lines.
+
+        :param data: `numpy` array of data bytes.
+        :param line_breaks: `numpy` array of line feeds positions in the data buffer.
+        :param lines_starts: `numpy` array of lines starts in the data buffer.
+        :param lines_ends: `numpy` array of lines ends (exclusive) in the data buffer.
+        :return: `numpy` array of lines validity
+        """
+        is_invalid_character = (data - np.uint8(ord('a'))) > ord('z') - ord('a')
+        is_invalid_character[line_breaks] = False
+        is_invalid_character[lines_ends[lines_ends < len(data)]] = False
+
+        invalid_characters_lines = np.searchsorted(line_breaks, np.flatnonzero(is_invalid_character))
+        lines_lens = lines_ends - lines_starts
+
+        is_valid_line = (lines_lens > 0) & (lines_lens <= EOS_NAME_LENGTH)
+        is_valid_line[invalid_characters_lines] = False
+
+        return is_valid_line
+
+    @staticmethod
+    def __get_validation_error_message(invalid_lines) -> str:
+        """
+        Get validation error message with invalid lines numbers.
+
+        :param invalid_lines: list of invalid lines numbers.
+        :return: error message
         """
-        for word in data:
-            is_valid_word_len = (len(word) <= EOS_NAME_LENGTH)
-            is_valid_word = word.isalpha() and word.islower() and is_valid_word_len
+        invalid_lines_str = ', '.join(str(line) for line in invalid_lines[:INVALID_LINES_IN_ERROR_MESSAGE])
+        if len(invalid_lines) > INVALID_LINES_IN_ERROR_MESSAGE:
+            invalid_lines_str += f' and {len(invalid_lines) - INVALID_LINES_IN_ERROR_MESSAGE} more'
 
-            if not is_valid_word:
-                raise ValidationDataError("Data contains invalid characters or does not match the name length error")
+        return (
+            'Data contains invalid characters or does not match the name length error '
+            f'on lines: {invalid_lines_str}'
+        )
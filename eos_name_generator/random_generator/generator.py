@@ -1,14 +1,46 @@
 """
 Provide an implementation of the RandomNameGenerator interface.
 """
+from collections import namedtuple
+from operator import attrgetter
+
+import numpy as np
+
 from eos_name_generator.constants import (
     EOS_NAME_LENGTH,
+    ITER_NAMES_CHUNK_SIZE,
+    NUMBERS_BUFFER_SIZE,
     NUMBERS_PROBABILITIES,
-    RANDOM_PROVIDER_INSTANCE,
     SEED_DATA_PATH,
 )
 from eos_name_generator.interfaces import BaseGeneratorInterface
 from eos_name_generator.random_generator.data_reader import DataReader
+from eos_name_generator.random_generator.names_space import NamesSpace
+from eos_name_generator.utils import (
+    DEFAULT_RANDOM_PROVIDER,
+    ProviderChoice,
+    encode_names,
+    get_random_provider_instance,
+)
+from eos_name_generator.utils.generation_stats import (
+    check_stats,
+    iter_counted_chunks,
+    time_stage,
+)
+from eos_name_generator.utils.names_index import (
+    create_unique_names_index,
+    iter_filtered_names_chunks,
+)
+from eos_name_generator.utils.parallel_generation import iter_parallel_names_chunks
+
+BaseWordPartners = namedtuple('BaseWordPartners', [
+    'base_words',
+    'base_matrix',
+    'additional_alphabet_words',
+    'additional_alphabet_matrix',
+    'additional_word_len',
+    'additional_word_choice',
+])
 
 
 class RandomNameGenerator(BaseGeneratorInterface):
@@ -20,17 +52,25 @@ class RandomNameGenerator(BaseGeneratorInterface):
             self,
             seed_data_path=SEED_DATA_PATH,
             numbers_probabilities=NUMBERS_PROBABILITIES,
-            random_provider_instance=RANDOM_PROVIDER_INSTANCE,
+            random_provider_instance=DEFAULT_RANDOM_PROVIDER,
+            stats=None,
     ):
         """
         `RandomNameGenerator` constructor.
 
         :param seed_data_path: path to the data based on which the name will be generated.
         :param numbers_probabilities: the probability of occurrence of numbers in the generated word.
-        :param random_provider_instance: the random provider instance.
+        :param random_provider_instance: the random provider instance, `get_random_provider_instance()` by default.
+        :param stats: `GenerationStats` instance, stats are not recorded if `None`.
         """
+        self.__base_dict = {}
+        self.stats = stats
         self._seed_data_path = seed_data_path
         self.numbers_probabilities = numbers_probabilities
+
+        if random_provider_instance is DEFAULT_RANDOM_PROVIDER:
+            random_provider_instance = get_random_provider_instance()
+
         self.random_provider = random_provider_instance
         self.data_provider = DataReader
 
@@ -40,26 +80,50 @@ class RandomNameGenerator(BaseGeneratorInterface):
 
         :return: `EOS` name str
         """
-        base_dict_keys = list(self.__base_dict.keys())
-        base_word_len = self.random_provider.choice(base_dict_keys, p=self.__probabilities_len_base_word)
-        additional_word_len = EOS_NAME_LENGTH - base_word_len
-
-        base_words = self.__base_dict.get(base_word_len)
-        additional_alphabet_words = []
-        if additional_word_len in self.__base_dict:
-            additional_alphabet_words = self.__base_dict.get(additional_word_len)
-
-        name = self.__get_random_name(base_words, additional_alphabet_words)
+        name = self.__generate_name()
+        if self._stats is not None:
+            self._stats.count('bytes_emitted', len(name))
 
         return name
 
-    def generate_list(self, num: int) -> list:
+    def generate_list(
+            self,
+            num: int,
+            workers: int = None,
+            unique: bool = False,
+            exclude=None,
+            encoded: bool = False,
+    ) -> list:
         """
         Generate list of `EOS` names method.
 
+        If the random provider is able to draw arrays of random floats (`random_sample` method),
+        all names are generated by the batch engine, otherwise `generate` is called `num` times.
+
         :param num: number of generated names in list.
+        :param workers: number of worker processes, names are generated in the current process if `None`.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: return `numpy` array of names encoded into `uint64` values instead of the list.
         :return: `EOS` name
         """
+        if workers is not None or unique or exclude is not None or encoded:
+            names_chunks = list(self.iter_names(
+                num=num, as_chunks=True, workers=workers, unique=unique, exclude=exclude, encoded=encoded,
+            ))
+            names_dtype = np.uint64 if encoded else f'S{EOS_NAME_LENGTH}'
+            with time_stage(self._stats, 'string_building'):
+                names = np.concatenate(names_chunks) if names_chunks else np.array([], dtype=names_dtype)
+                return names if encoded else names.astype(f'U{EOS_NAME_LENGTH}').tolist()
+
+        if self.__is_batch_random_provider():
+            names = self.__generate_batch(num)
+            if self._stats is not None:
+                self._stats.count('bytes_emitted', names.nbytes)
+
+            with time_stage(self._stats, 'string_building'):
+                return names.astype(f'U{EOS_NAME_LENGTH}').tolist()
+
         generated_list = []
         for _ in range(num):
             name = self.generate()
@@ -67,6 +131,119 @@ class RandomNameGenerator(BaseGeneratorInterface):
 
         return generated_list
 
+    def iter_names(
+            self,
+            num: int = None,
+            chunk_size: int = ITER_NAMES_CHUNK_SIZE,
+            as_chunks: bool = False,
+            workers: int = None,
+            unique: bool = False,
+            exclude=None,
+            encoded: bool = False,
+    ):
+        """
+        Lazily generate `EOS` names method.
+
+        Names are generated by chunks of `chunk_size` names, so the memory usage does not depend on `num`.
+        With `workers`, chunks are generated by the process pool, every worker loads seed data once
+        and generates every chunk with its own random provider spawned from `random_provider`.
+
+        With `unique`, already generated names are tracked encoded into `uint64` values, in the exact set
+        up to `UNIQUE_NAMES_EXACT_MAX_NUM` names and in the Bloom filter of the bounded size above it,
+        so the memory usage grows with `num`. Names found in `exclude` (e.g. memory-mapped `SortedNamesArray`
+        of registered accounts) are rejected. Duplicates and excluded names are redrawn in the current process.
+
+        With `stats`, names generated by worker processes are counted as draws, but their words and timings
+        are not recorded.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names generated at once.
+        :param as_chunks: yield `numpy` arrays of names as bytes instead of single names.
+        :param workers: number of worker processes, names are generated in the current process if `None`.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: generate names encoded into `uint64` values (see `encode_names`) instead of strings.
+        :return: iterator of `EOS` names
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be greater than 0.')
+
+        if workers is not None and workers < 1:
+            raise ValueError('The number of workers must be greater than 0.')
+
+        if exclude is not None and 'contains' not in dir(exclude):
+            raise AttributeError('The interface `exclude` does not contain contains method.')
+
+        if unique and num is not None:
+            names_space_size_upper_bound = self.get_names_space_size_upper_bound()
+            if num > names_space_size_upper_bound:
+                raise ValueError(
+                    f'Unable to generate {num} unique names, at most {names_space_size_upper_bound} names exist.',
+                )
+
+        names_chunks = self.__iter_chunks(num=num, chunk_size=chunk_size)
+        if workers is not None:
+            if 'spawn' not in dir(self.random_provider):
+                raise AttributeError('The interface `random_provider` does not contain spawn method.')
+
+            names_chunks = iter_parallel_names_chunks(
+                generator_class=self.__class__,
+                generator_kwargs={
+                    'seed_data_path': self.seed_data_path,
+                    'numbers_probabilities': self.numbers_probabilities,
+                },
+                random_provider=self.random_provider,
+                num=num,
+                chunk_size=chunk_size,
+                workers=workers,
+            )
+            if self._stats is not None:
+                names_chunks = iter_counted_chunks(names_chunks, stats=self._stats, counter='draws')
+
+        if unique or exclude is not None:
+            names_chunks = iter_filtered_names_chunks(
+                names_chunks=names_chunks,
+                generate_chunk=self.__generate_chunk,
+                unique_names_index=create_unique_names_index(num) if unique else None,
+                excluded_names=exclude,
+                stats=self._stats,
+            )
+
+        if encoded:
+            names_chunks = self.__iter_encoded_chunks(names_chunks)
+
+        if self._stats is not None:
+            names_chunks = iter_counted_chunks(
+                names_chunks, stats=self._stats, counter='bytes_emitted', get_num=attrgetter('nbytes'),
+            )
+
+        if as_chunks:
+            return names_chunks
+
+        return self.__iter_names_from_chunks(names_chunks)
+
+    def get_names_space(self) -> NamesSpace:
+        """
+        Get the space of names the generator is able to generate.
+
+        :return: `NamesSpace` instance
+        """
+        return NamesSpace.from_words(
+            words_by_word_len=self.__base_dict,
+            probabilities_by_word_len=dict(zip(self.__base_dict, self.__probabilities_len_base_word)),
+            numbers_probabilities=self.numbers_probabilities,
+        )
+
+    def get_names_space_size_upper_bound(self) -> int:
+        """
+        Get the upper bound of the number of distinct names the generator is able to generate.
+
+        Combinations of words could make the same name, so fewer distinct names could exist.
+
+        :return: number of combinations of words
+        """
+        return self.get_names_space().size_upper_bound
+
     @property
     def seed_data_path(self) -> str:
         """
@@ -85,8 +262,7 @@ class RandomNameGenerator(BaseGeneratorInterface):
         """
         self._seed_data_path = value
         self.data_provider.data_path = value
-        self.__base_dict = self.data_provider.get_dictionary_by_word_len()
-        self.__probabilities_len_base_word = self.__get_probabilities_len_base_word()
+        self.__update_base_dict()
 
     @property
     def numbers_probabilities(self) -> int:
@@ -109,6 +285,9 @@ class RandomNameGenerator(BaseGeneratorInterface):
 
         self._numbers_probabilities = value
 
+        if self.__base_dict:
+            self.__prepare_choices()
+
     @property
     def random_provider(self):
         """
@@ -136,6 +315,28 @@ class RandomNameGenerator(BaseGeneratorInterface):
 
         self._random_provider = value
 
+        if self.__base_dict:
+            self.__prepare_choices()
+
+    @property
+    def stats(self):
+        """
+        Get `stats` variable.
+
+        :return: `stats` instance.
+        """
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        """
+        Set `stats` value.
+
+        :param value: `stats` instance, stats are not recorded if `None`.
+        """
+        check_stats(value)
+        self._stats = value
+
     @property
     def data_provider(self):
         """
@@ -161,37 +362,330 @@ class RandomNameGenerator(BaseGeneratorInterface):
             raise AttributeError(error_message)
 
         self._data_provider = value(self.seed_data_path)
-        self.__base_dict = self.data_provider.get_dictionary_by_word_len()
+        self.__update_base_dict()
+
+    def __update_base_dict(self):
+        """
+        Read basic dictionary from `data_provider` and prepare it for the scalar and the batch generation.
+
+        Words of each length are stored as `numpy` array of fixed-width bytes (`S{word_len}` dtype)
+        and as byte matrix view of the array (one row per word) to gather words of the whole batch
+        with fancy indexing.
+        """
+        self.__base_dict = {
+            word_len: np.asarray(words, dtype=f'S{word_len}')
+            for word_len, words in self.data_provider.get_dictionary_by_word_len().items()
+        }
         self.__probabilities_len_base_word = self.__get_probabilities_len_base_word()
 
-    def __get_random_name(self, base_words, additional_alphabet_words) -> str:
+        self.__base_word_lengths = np.array(list(self.__base_dict.keys()), dtype=np.intp)
+        self.__prepare_choices()
+
+    def __prepare_choices(self):
+        """
+        Prepare random choices of the base word length and the partners table of base word lengths.
+
+        Choices are validated once and reused by every generated name. Additional word type choices
+        are keyed by existence of the alphabet additional words.
+
+        The partners table is indexed by the base word length, every entry holds base words, additional alphabet
+        words of the complement length and the prepared choice of the additional word type, so both the scalar
+        and the batch generation only index the table per name. Numbers drawn by the previous random provider
+        are dropped.
+        """
+        self.__base_word_len_choice = self.__prepare_choice(
+            list(self.__base_dict.keys()), p=self.__probabilities_len_base_word,
+        )
+
+        additional_word_choices = {}
+        for is_additional_alphabet_words in (True, False):
+            additional_word_alphabet_probability = self.__get_probability_alphabet_additional_word(
+                int(is_additional_alphabet_words),
+            )
+            numbers_probabilities = self.numbers_probabilities if additional_word_alphabet_probability else 1
+            additional_words_probabilities = [additional_word_alphabet_probability, numbers_probabilities]
+
+            additional_word_choices[is_additional_alphabet_words] = self.__prepare_choice(
+                [True, False], p=additional_words_probabilities,
+            )
+
+        self.__numbers_buffer = ''
+        self.__numbers_buffer_position = 0
+
+        self.__partners_table = [None] * (EOS_NAME_LENGTH + 1)
+        for base_word_len, base_words in self.__base_dict.items():
+            additional_word_len = EOS_NAME_LENGTH - base_word_len
+            additional_alphabet_words = self.__base_dict.get(additional_word_len) if additional_word_len else None
+
+            additional_alphabet_matrix = None
+            if additional_alphabet_words is not None:
+                additional_alphabet_matrix = additional_alphabet_words.view(np.uint8).reshape(-1, additional_word_len)
+
+            self.__partners_table[base_word_len] = BaseWordPartners(
+                base_words=base_words,
+                base_matrix=base_words.view(np.uint8).reshape(-1, base_word_len),
+                additional_alphabet_words=additional_alphabet_words,
+                additional_alphabet_matrix=additional_alphabet_matrix,
+                additional_word_len=additional_word_len,
+                additional_word_choice=additional_word_choices[additional_alphabet_words is not None],
+            )
+
+    def __prepare_choice(self, seq, p):
+        """
+        Prepare random choice with the random provider.
+
+        If the random provider is not able to prepare choices (`prepare` method), every draw is
+        delegated to its `choice` method.
+
+        :param seq: non-empty sequence.
+        :param p: probabilities according to sequence.
+        :return: prepared choice with `draw` and `draw_many` methods
+        """
+        if 'prepare' in dir(self.random_provider):
+            return self.random_provider.prepare(seq, p)
+
+        return ProviderChoice(random_provider=self.random_provider, seq=seq, p=p)
+
+    def __is_batch_random_provider(self) -> bool:
+        """
+        Check if the random provider is able to draw arrays of random floats (`random_sample` method).
+
+        :return: `True` if names could be generated by the batch engine
         """
-        Generate random name based on `base_words` and `additional_alphabet_words`.
+        return 'random_sample' in dir(self.random_provider)
 
-        :param base_words: list of words on the basis of which the name will be created
-        :param additional_alphabet_words: additional words to be added to the base word
+    def __iter_names_from_chunks(self, names_chunks):
+        """
+        Lazily split chunks of `EOS` names into names.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes or as `uint64` values.
+        :return: iterator of `EOS` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                if names_chunk.dtype.kind == 'S':
+                    names_chunk = names_chunk.astype(f'U{EOS_NAME_LENGTH}')
+
+                names = names_chunk.tolist()
+
+            yield from names
+
+    def __iter_encoded_chunks(self, names_chunks):
+        """
+        Lazily encode chunks of `EOS` names into `uint64` values.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes.
+        :return: iterator of `numpy` arrays of `uint64` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                encoded_names_chunk = encode_names(names_chunk)
+
+            yield encoded_names_chunk
+
+    def __iter_chunks(self, num, chunk_size):
+        """
+        Lazily generate chunks of `EOS` names in the current process.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names in a chunk.
+        :return: iterator of `numpy` arrays of names as bytes
+        """
+        generated_names_num = 0
+        while num is None or generated_names_num < num:
+            names_chunk_size = chunk_size if num is None else min(chunk_size, num - generated_names_num)
+            generated_names_num += names_chunk_size
+
+            yield self.__generate_chunk(names_chunk_size)
+
+    def __generate_chunk(self, num) -> np.ndarray:
+        """
+        Generate chunk of `EOS` names with the batch engine or name by name, if batch engine is not supported.
+
+        :param num: number of generated names.
+        :return: `numpy` array of `EOS` names as bytes
+        """
+        if self.__is_batch_random_provider():
+            return self.__generate_batch(num)
+
+        names = [self.__generate_name() for _ in range(num)]
+        return np.array(names, dtype=f'S{EOS_NAME_LENGTH}')
+
+    def __generate_batch(self, num) -> np.ndarray:
+        """
+        Generate batch of `EOS` names with `numpy` arrays.
+
+        Base word lengths, word indices, alphabet-vs-numbers decisions and numbers are drawn for the
+        whole batch at once. Weighted choices are drawn with the same prepared choices as `generate`
+        uses, so the batch has the same distribution as `generate` with the same random provider.
+        Numbers of the whole batch are drawn as one matrix of digits characters, the number of every name
+        is the slice of its row after the base word.
+
+        :param num: number of generated names.
+        :return: `numpy` array of `EOS` names as bytes
+        """
+        stats = self._stats
+        if stats is not None:
+            stats.count('draws', num)
+            stats.count('base_words', num)
+
+        names = np.empty((num, EOS_NAME_LENGTH), dtype=np.uint8)
+        with time_stage(stats, 'sampling'):
+            base_words_lens = self.__base_word_len_choice.draw_many(num)
+            base_word_random, additional_word_random = self.random_provider.random_sample((2, num))
+        numbers_rows_by_base_word_len = []
+
+        for base_word_len in self.__base_word_lengths:
+            rows = np.flatnonzero(base_words_lens == base_word_len)
+            if not rows.size:
+                continue
+
+            base_word_partners = self.__partners_table[base_word_len]
+            base_words = base_word_partners.base_matrix
+            with time_stage(stats, 'lookup'):
+                base_words_indices = self.__get_random_indices(base_word_random[rows], len(base_words))
+                names[rows, :base_word_len] = base_words[base_words_indices]
+
+            additional_word_len = base_word_partners.additional_word_len
+            if not additional_word_len:
+                continue
+
+            with time_stage(stats, 'sampling'):
+                is_additional_alphabet_word = base_word_partners.additional_word_choice.draw_many(rows.size)
+            alphabet_rows = rows[is_additional_alphabet_word]
+            numbers_rows = rows[~is_additional_alphabet_word]
+
+            if alphabet_rows.size:
+                additional_alphabet_words = base_word_partners.additional_alphabet_matrix
+                with time_stage(stats, 'lookup'):
+                    additional_word_indices = self.__get_random_indices(
+                        additional_word_random[alphabet_rows], len(additional_alphabet_words),
+                    )
+                    names[alphabet_rows, base_word_len:] = additional_alphabet_words[additional_word_indices]
+
+            if numbers_rows.size:
+                numbers_rows_by_base_word_len.append((numbers_rows, base_word_len))
+
+            if stats is not None:
+                stats.count('additional_words', alphabet_rows.size)
+                stats.count('digit_suffixes', numbers_rows.size)
+
+        if not numbers_rows_by_base_word_len:
+            return names.view(f'S{EOS_NAME_LENGTH}').ravel()
+
+        with time_stage(stats, 'sampling'):
+            numbers = self.__draw_numbers(
+                num=sum(rows.size for rows, _ in numbers_rows_by_base_word_len),
+                numbers_len=EOS_NAME_LENGTH - min(base_word_len for _, base_word_len in numbers_rows_by_base_word_len),
+            )
+
+        with time_stage(stats, 'string_building'):
+            numbers_start = 0
+            for numbers_rows, base_word_len in numbers_rows_by_base_word_len:
+                numbers_end = numbers_start + numbers_rows.size
+                numbers_len = EOS_NAME_LENGTH - base_word_len
+                names[numbers_rows, base_word_len:] = numbers[numbers_start:numbers_end, :numbers_len]
+                numbers_start = numbers_end
+
+        return names.view(f'S{EOS_NAME_LENGTH}').ravel()
+
+    def __draw_numbers_string(self, numbers_len) -> str:
+        """
+        Draw number of digits from `1` to `5` for the scalar generation.
+
+        Digits are drawn by `NUMBERS_BUFFER_SIZE` digits at once into the buffer string, every number is
+        the slice of the buffer, so the number costs neither a random provider call per digit nor a string
+        concatenation.
+
+        :param numbers_len: number of digits.
+        :return: number string
+        """
+        numbers_start = self.__numbers_buffer_position
+        if numbers_start + numbers_len > len(self.__numbers_buffer):
+            self.__numbers_buffer = self.__draw_numbers(1, max(NUMBERS_BUFFER_SIZE, numbers_len)).tobytes().decode()
+            numbers_start = 0
+
+        self.__numbers_buffer_position = numbers_start + numbers_len
+        return self.__numbers_buffer[numbers_start:self.__numbers_buffer_position]
+
+    def __draw_numbers(self, num, numbers_len) -> np.ndarray:
+        """
+        Draw numbers of digits from `1` to `5` as the matrix of `ASCII` bytes.
+
+        Digits are drawn as `uint8` integers at once (`integers` method) if the random provider is able to,
+        otherwise they are transformed from random floats (`random_sample` method) or drawn one by one.
+
+        :param num: number of numbers.
+        :param numbers_len: number of digits of every number.
+        :return: `numpy` matrix of `uint8` digits characters, one row per number
+        """
+        random_provider_dir = dir(self.random_provider)
+
+        if 'integers' in random_provider_dir:
+            digits = self.random_provider.integers(1, 6, size=(num, numbers_len), dtype=np.uint8)
+        elif 'random_sample' in random_provider_dir:
+            digits = (self.random_provider.random_sample((num, numbers_len)) * 5).astype(np.uint8) + 1
+        else:
+            digits = np.array(
+                [self.random_provider.randint(1, 5) for _ in range(num * numbers_len)], dtype=np.uint8,
+            ).reshape(num, numbers_len)
+
+        digits += ord('0')
+        return digits
+
+    @staticmethod
+    def __get_random_indices(random_floats, sequence_len) -> np.ndarray:
+        """
+        Transform random floats from `[0.0, 1.0)` into uniformly distributed sequence indices.
+
+        :param random_floats: `numpy` array of random floats.
+        :param sequence_len: length of the sequence.
+        :return: `numpy` array of indices
+        """
+        indices = (random_floats * sequence_len).astype(np.intp)
+        return np.minimum(indices, sequence_len - 1)
+
+    def __generate_name(self) -> str:
+        """
+        Generate `EOS` name without counting emitted bytes.
+
+        :return: `EOS` name str
+        """
+        base_word_partners = self.__partners_table[self.__base_word_len_choice.draw()]
+        name = self.__get_random_name(base_word_partners)
+
+        return name
+
+    def __get_random_name(self, base_word_partners) -> str:
+        """
+        Generate random name based on the entry of the partners table.
+
+        :param base_word_partners: `BaseWordPartners` entry of the base word length.
         :return: random name string
         """
+        base_words = base_word_partners.base_words
         base_word_random_index = self.random_provider.randint(0, len(base_words) - 1)
-        base_word = base_words[base_word_random_index]
-        additional_alphabet_words_len = len(additional_alphabet_words)
-        additional_word_alphabet_probability = self.__get_probability_alphabet_additional_word(
-            additional_alphabet_words_len,
-        )
+        base_word = base_words[base_word_random_index].decode()
+
+        stats = self._stats
+        if stats is not None:
+            stats.count('draws')
+            stats.count('base_words')
+
+        if not base_word_partners.additional_word_len:
+            return base_word
 
-        numbers_probabilities = self.numbers_probabilities if additional_word_alphabet_probability else 1
-        additional_words_probabilities = [additional_word_alphabet_probability, numbers_probabilities]
-        is_additional_alphabet_word = self.random_provider.choice([True, False], p=additional_words_probabilities)
+        is_additional_alphabet_word = base_word_partners.additional_word_choice.draw()
 
-        additional_word = ''
         if is_additional_alphabet_word:
-            additional_word_random_index = self.random_provider.randint(0, additional_alphabet_words_len - 1)
-            additional_word = additional_alphabet_words[additional_word_random_index]
+            additional_alphabet_words = base_word_partners.additional_alphabet_words
+            additional_word_random_index = self.random_provider.randint(0, len(additional_alphabet_words) - 1)
+            additional_word = additional_alphabet_words[additional_word_random_index].decode()
         else:
-            additional_numbers_len = EOS_NAME_LENGTH - len(base_word)
-            for _ in range(additional_numbers_len):
-                additional_char = str(self.random_provider.randint(1, 5))
-                additional_word += additional_char
+            additional_word = self.__draw_numbers_string(base_word_partners.additional_word_len)
+
+        if stats is not None:
+            stats.count('additional_words' if is_additional_alphabet_word else 'digit_suffixes')
 
         random_name = base_word + additional_word
         return random_name
@@ -200,8 +694,15 @@ class RandomNameGenerator(BaseGeneratorInterface):
         """
         Get probabilities list of the base word length based on word frequency.
 
+        Probabilities of `data_provider` are used if it provides them, as the basic dictionary
+        may contain only a sample of the seed data words.
+
         :return: probabilities list
         """
+        if 'get_probabilities_by_word_len' in dir(self.data_provider):
+            probabilities_by_word_len = self.data_provider.get_probabilities_by_word_len()
+            return [probabilities_by_word_len.get(key) for key in self.__base_dict]
+
         probabilities = []
         base_dict_len = 0
 
@@ -0,0 +1,142 @@
+"""
+Provide implementation of the NamesSpace.
+"""
+import numpy as np
+
+from eos_name_generator.constants import EOS_NAME_LENGTH
+
+DIGITS_NUM = 5
+
+
+class NamesSpace:
+    """
+    Implementation of the space of names the RandomNameGenerator is able to generate.
+
+    Name is the base word followed by the additional alphabet word or the number of the complement length,
+    so names are split into groups of names with the same probability, one group per combination of
+    the base word length, multiplicity of the base word in the seed data and multiplicity of the additional word.
+    The upper bound of the size of the space and the expected number of distinct names of `num` draws are computed
+    in closed form over groups, so the time depends on the number of groups, not on the number of names.
+
+    Names of different combinations of words are assumed to be distinct, while they could collide
+    (e.g. `bookcase` + `card` and `book` + `casecard`), so the exact number of distinct names is not computed:
+    it takes a pass over all names. The number of distinct names is at most `size_upper_bound`.
+    """
+
+    def __init__(self, groups_sizes, groups_probabilities):
+        """
+        `NamesSpace` constructor.
+
+        :param groups_sizes: `numpy` array of numbers of names in groups.
+        :param groups_probabilities: `numpy` array of probabilities of every name of the group.
+        """
+        self.groups_sizes = groups_sizes
+        self.groups_probabilities = groups_probabilities
+
+    @classmethod
+    def from_words(cls, words_by_word_len, probabilities_by_word_len, numbers_probabilities):
+        """
+        Create the space of names from the basic dictionary.
+
+        :param words_by_word_len: dictionary of `numpy` arrays of words by word length.
+        :param probabilities_by_word_len: dictionary of probabilities of the base word length by word length.
+        :param numbers_probabilities: the probability of occurrence of numbers in the generated word.
+        :return: the space of names
+        """
+        groups_sizes, groups_probabilities = [], []
+
+        for base_word_len, base_words in words_by_word_len.items():
+            base_groups_sizes, base_groups_probabilities = _get_words_groups(base_words)
+            base_groups_probabilities = base_groups_probabilities * probabilities_by_word_len[base_word_len]
+
+            additional_word_len = EOS_NAME_LENGTH - base_word_len
+            additional_groups_sizes, additional_groups_probabilities = _get_additional_words_groups(
+                words_by_word_len.get(additional_word_len), additional_word_len, numbers_probabilities,
+            )
+
+            groups_sizes.append(np.outer(base_groups_sizes, additional_groups_sizes).ravel())
+            groups_probabilities.append(np.outer(base_groups_probabilities, additional_groups_probabilities).ravel())
+
+        groups_sizes = np.concatenate([np.array([], dtype=np.int64)] + groups_sizes)
+        groups_probabilities = np.concatenate([np.array([], dtype=np.float64)] + groups_probabilities)
+        is_possible = groups_probabilities > 0
+
+        return cls(groups_sizes=groups_sizes[is_possible], groups_probabilities=groups_probabilities[is_possible])
+
+    @property
+    def size_upper_bound(self) -> int:
+        """
+        Get the upper bound of the number of distinct names, names are counted once per combination of words.
+
+        :return: number of combinations of words
+        """
+        return int(self.groups_sizes.sum())
+
+    def get_expected_distinct_names_num(self, num) -> float:
+        """
+        Get the expected number of distinct names of `num` independently generated names.
+
+        Every name of the group of probability `p` is generated at least once with the probability
+        `1 - (1 - p) ** num`.
+
+        :param num: number of generated names.
+        :return: expected number of distinct names
+        """
+        return float(np.sum(self.groups_sizes * -np.expm1(num * np.log1p(-self.groups_probabilities))))
+
+    def get_expected_duplicates_num(self, num) -> float:
+        """
+        Get the expected number of duplicates of `num` independently generated names.
+
+        :param num: number of generated names.
+        :return: expected number of names which repeat already generated names
+        """
+        return num - self.get_expected_distinct_names_num(num)
+
+    def get_expected_duplicates_rate(self, num) -> float:
+        """
+        Get the expected fraction of duplicates of `num` independently generated names.
+
+        :param num: number of generated names.
+        :return: expected fraction of names which repeat already generated names
+        """
+        return self.get_expected_duplicates_num(num) / num if num else 0.0
+
+
+def _get_words_groups(words) -> tuple:
+    """
+    Split distinct words into groups of words with the same multiplicity.
+
+    :param words: `numpy` array of words.
+    :return: tuple of `numpy` arrays of numbers of words in groups and probabilities of every word of the group
+    """
+    _, words_counts = np.unique(words, return_counts=True)
+    multiplicities, groups_sizes = np.unique(words_counts, return_counts=True)
+
+    return groups_sizes, multiplicities / len(words)
+
+
+def _get_additional_words_groups(additional_alphabet_words, additional_word_len, numbers_probabilities) -> tuple:
+    """
+    Split additional words of the length into groups of words with the same probability.
+
+    :param additional_alphabet_words: `numpy` array of additional alphabet words, `None` if there are no words.
+    :param additional_word_len: length of the additional word.
+    :param numbers_probabilities: the probability of occurrence of numbers in the generated word.
+    :return: tuple of `numpy` arrays of numbers of words in groups and probabilities of every word of the group
+    """
+    if not additional_word_len:
+        return np.array([1]), np.array([1.0])
+
+    numbers_num = DIGITS_NUM ** additional_word_len
+    if additional_alphabet_words is None:
+        return np.array([numbers_num]), np.array([1 / numbers_num])
+
+    alphabet_groups_sizes, alphabet_groups_probabilities = _get_words_groups(additional_alphabet_words)
+
+    groups_sizes = np.append(alphabet_groups_sizes, numbers_num)
+    groups_probabilities = np.append(
+        alphabet_groups_probabilities * (1 - numbers_probabilities), numbers_probabilities / numbers_num,
+    )
+
+    return groups_sizes, groups_probabilities
@@ -0,0 +1,114 @@
+"""
+Provide implementation of the SeedDataCache.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from eos_name_generator.constants import (
+    SEED_DATA_CACHE_MAX_BYTES,
+    SEED_DATA_CACHE_MAX_ENTRIES,
+)
+
+
+class SeedDataCache:
+    """
+    Implementation of the thread-safe least recently used cache of the parsed seed data.
+
+    Entries are keyed by the seed data path, size and modification time, so modified files are parsed again.
+    The cache is limited both by the number of entries and by the total size of cached arrays.
+    """
+
+    def __init__(self, max_entries=SEED_DATA_CACHE_MAX_ENTRIES, max_bytes=SEED_DATA_CACHE_MAX_BYTES):
+        """
+        `SeedDataCache` constructor.
+
+        :param max_entries: maximum number of cached entries.
+        :param max_bytes: maximum total size of cached arrays in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._entries_bytes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Get number of cached entries.
+
+        :return: number of entries
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(data_path, *options) -> tuple:
+        """
+        Get cache key of the seed data file.
+
+        :param data_path: path to the seed data file.
+        :param options: reading options which affect the parsed seed data.
+        :return: tuple of the real path, size and modification time of the file and reading options
+        """
+        data_stat = os.stat(data_path)
+        return (os.path.realpath(data_path), data_stat.st_size, data_stat.st_mtime_ns) + options
+
+    def get(self, key):
+        """
+        Get cached entry and mark it as the most recently used.
+
+        :param key: cache key.
+        :return: cached entry or `None` if there is no entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key, entry, entry_bytes):
+        """
+        Put entry to the cache and evict the least recently used entries beyond the limits.
+
+        Entries larger than `max_bytes` are not cached.
+
+        :param key: cache key.
+        :param entry: cached entry.
+        :param entry_bytes: size of the entry in bytes.
+        """
+        if entry_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.__evict(key)
+
+            self._entries[key] = entry
+            self._entries_bytes[key] = entry_bytes
+            self._bytes += entry_bytes
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self.__evict(next(iter(self._entries)))
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._entries_bytes.clear()
+            self._bytes = 0
+
+    def __evict(self, key):
+        """
+        Remove entry from the cache, the lock must be acquired by the caller.
+
+        :param key: cache key.
+        """
+        del self._entries[key]
+        self._bytes -= self._entries_bytes.pop(key)
+
+
+SEED_DATA_CACHE = SeedDataCache()
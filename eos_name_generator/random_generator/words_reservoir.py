@@ -0,0 +1,63 @@
+"""
+Provide implementation of the WordsReservoir.
+"""
+import numpy as np
+
+
+class WordsReservoir:
+    """
+    Implementation of the uniform reservoir sample of words with the same length.
+
+    Words are added by chunks, every chunk is sampled at once with the vectorized Algorithm R,
+    so the reservoir contains a uniform sample of all added words in bounded memory.
+
+    References:
+        - https://en.wikipedia.org/wiki/Reservoir_sampling#Simple_algorithm
+    """
+
+    def __init__(self, size, word_len, random_generator):
+        """
+        `WordsReservoir` constructor.
+
+        :param size: maximum number of words in the reservoir.
+        :param word_len: length of words in the reservoir.
+        :param random_generator: `numpy.random.Generator` instance.
+        """
+        self.size = size
+        self.seen_words_num = 0
+
+        self._words = np.empty(size, dtype=f'S{word_len}')
+        self._random_generator = random_generator
+
+    def add(self, words):
+        """
+        Add chunk of words to the reservoir.
+
+        :param words: `numpy` array of words.
+        """
+        fill_words_num = min(max(self.size - self.seen_words_num, 0), len(words))
+        self._words[self.seen_words_num:self.seen_words_num + fill_words_num] = words[:fill_words_num]
+
+        rest_words = words[fill_words_num:]
+        if len(rest_words):
+            words_positions = self.seen_words_num + fill_words_num + np.arange(len(rest_words))
+            replaced_indices = self._random_generator.integers(0, words_positions + 1)
+            is_kept_word = replaced_indices < self.size
+
+            # the later word replaces the earlier one if both of them are drawn to the same index
+            reversed_replaced_indices = replaced_indices[is_kept_word][::-1]
+            replaced_indices, reversed_words_indices = np.unique(reversed_replaced_indices, return_index=True)
+            kept_words = rest_words[is_kept_word]
+
+            self._words[replaced_indices] = kept_words[len(kept_words) - 1 - reversed_words_indices]
+
+        self.seen_words_num += len(words)
+
+    @property
+    def words(self) -> np.ndarray:
+        """
+        Get words in the reservoir.
+
+        :return: `numpy` array of words
+        """
+        return self._words[:min(self.seen_words_num, self.size)]
@@ -1,3 +1,413 @@
 """
 Provide an implementation of the RNNGenerator interface.
 """
+from operator import attrgetter
+
+import numpy as np
+
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    EOS_NAME_LENGTH,
+    ITER_NAMES_CHUNK_SIZE,
+    RNN_BATCH_SIZE,
+    RNN_TEMPERATURE,
+    RNN_WEIGHTS_PATH,
+)
+from eos_name_generator.interfaces import BaseGeneratorInterface
+from eos_name_generator.rnn_generator.model import GRUModel
+from eos_name_generator.utils import (
+    DEFAULT_RANDOM_PROVIDER,
+    encode_names,
+    get_random_provider_instance,
+)
+from eos_name_generator.utils.generation_stats import (
+    check_stats,
+    iter_counted_chunks,
+    time_stage,
+)
+from eos_name_generator.utils.names_index import (
+    create_unique_names_index,
+    iter_filtered_names_chunks,
+)
+
+END_OF_WORD_SYMBOL = 0
+SYMBOLS_BYTES = np.frombuffer(EOS_NAME_ALPHABET.encode(), dtype=np.uint8)
+FIRST_SYMBOLS_MASK = np.array([not character.isalpha() for character in EOS_NAME_ALPHABET])
+
+
+class RNNNameGenerator(BaseGeneratorInterface):
+    """
+    Implementation of the RNNNameGenerator.
+
+    Name is generated symbol by symbol by the GRU model fitted on the seed data words separated by
+    the end of word symbol (`.`), until the name has `EOS_NAME_LENGTH` characters. The end of word symbol
+    is not added to the name, the first character of the name is always a letter.
+    """
+
+    def __init__(
+            self,
+            weights_path=RNN_WEIGHTS_PATH,
+            temperature=RNN_TEMPERATURE,
+            batch_size=RNN_BATCH_SIZE,
+            random_provider_instance=DEFAULT_RANDOM_PROVIDER,
+            stats=None,
+    ):
+        """
+        `RNNNameGenerator` constructor.
+
+        :param weights_path: path to the `.npz` weights of the GRU model, trained on the default seed data by default.
+        :param temperature: sampling temperature, lower temperature makes names more likely and less diverse.
+        :param batch_size: number of names advanced in lock-step, the memory usage grows with the batch size.
+        :param random_provider_instance: the random provider instance, `get_random_provider_instance()` by default.
+        :param stats: `GenerationStats` instance, stats are not recorded if `None`.
+        """
+        self.weights_path = weights_path
+        self.temperature = temperature
+        self.batch_size = batch_size
+
+        if random_provider_instance is DEFAULT_RANDOM_PROVIDER:
+            random_provider_instance = get_random_provider_instance()
+
+        self.random_provider = random_provider_instance
+        self.stats = stats
+
+    def generate(self) -> str:
+        """
+        Generate `EOS` name method.
+
+        :return: `EOS` name str
+        """
+        names = self.__generate_batch(1)
+        if self._stats is not None:
+            self._stats.count('bytes_emitted', len(names[0]))
+
+        with time_stage(self._stats, 'string_building'):
+            return names[0].decode()
+
+    def generate_list(self, num: int, unique: bool = False, exclude=None, encoded: bool = False) -> list:
+        """
+        Generate list of `EOS` names method.
+
+        :param num: number of generated names in list.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: return `numpy` array of names encoded into `uint64` values instead of the list.
+        :return: `EOS` name
+        """
+        names_chunks = self.__iter_chunks(num=num, chunk_size=self.batch_size, unique=unique, exclude=exclude)
+        if encoded:
+            names_chunks = self.__iter_encoded_chunks(names_chunks)
+
+        if self._stats is not None:
+            names_chunks = iter_counted_chunks(
+                names_chunks, stats=self._stats, counter='bytes_emitted', get_num=attrgetter('nbytes'),
+            )
+
+        if encoded:
+            return np.concatenate([np.array([], dtype=np.uint64)] + list(names_chunks))
+
+        return list(self.__iter_names_from_chunks(names_chunks))
+
+    def iter_names(
+            self,
+            num: int = None,
+            chunk_size: int = ITER_NAMES_CHUNK_SIZE,
+            as_chunks: bool = False,
+            unique: bool = False,
+            exclude=None,
+            encoded: bool = False,
+    ):
+        """
+        Lazily generate `EOS` names method.
+
+        Names are generated by chunks of `chunk_size` names, so the memory usage does not depend on `num`,
+        unless `unique` is set, then already generated names are tracked as `uint64` values.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names generated at once.
+        :param as_chunks: yield `numpy` arrays of names as bytes instead of single names.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :param encoded: generate names encoded into `uint64` values (see `encode_names`) instead of strings.
+        :return: iterator of `EOS` names
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be greater than 0.')
+
+        names_chunks = self.__iter_chunks(num=num, chunk_size=chunk_size, unique=unique, exclude=exclude)
+        if encoded:
+            names_chunks = self.__iter_encoded_chunks(names_chunks)
+
+        if self._stats is not None:
+            names_chunks = iter_counted_chunks(
+                names_chunks, stats=self._stats, counter='bytes_emitted', get_num=attrgetter('nbytes'),
+            )
+
+        if as_chunks:
+            return names_chunks
+
+        return self.__iter_names_from_chunks(names_chunks)
+
+    @property
+    def weights_path(self) -> str:
+        """
+        Get `weights_path` variable.
+
+        :return: `weights_path` string value
+        """
+        return self._weights_path
+
+    @weights_path.setter
+    def weights_path(self, value):
+        """
+        Set `weights_path` value and load the GRU model.
+
+        :param value: `weights_path` variable value
+        """
+        self.__model = GRUModel.load(value)
+        self._weights_path = value
+
+    @property
+    def model(self) -> GRUModel:
+        """
+        Get loaded GRU model.
+
+        :return: `GRUModel` instance
+        """
+        return self.__model
+
+    @property
+    def temperature(self) -> float:
+        """
+        Get `temperature` variable.
+
+        :return: `temperature` float value
+        """
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value):
+        """
+        Set `temperature` value.
+
+        :param value: `temperature` variable value
+        """
+        if value <= 0:
+            raise ValueError('The temperature must be greater than 0.')
+
+        self._temperature = value
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Get `batch_size` variable.
+
+        :return: `batch_size` int value
+        """
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value):
+        """
+        Set `batch_size` value.
+
+        :param value: `batch_size` variable value
+        """
+        if value < 1:
+            raise ValueError('The batch size must be greater than 0.')
+
+        self._batch_size = value
+
+    @property
+    def stats(self):
+        """
+        Get `stats` variable.
+
+        :return: `stats` instance.
+        """
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        """
+        Set `stats` value.
+
+        :param value: `stats` instance, stats are not recorded if `None`.
+        """
+        check_stats(value)
+        self._stats = value
+
+    @property
+    def random_provider(self):
+        """
+        Get `random_provider` variable.
+
+        :return: `random_provider` instance.
+        """
+        return self._random_provider
+
+    @random_provider.setter
+    def random_provider(self, value):
+        """
+        Set `random_provider` value.
+
+        :param value: `random_provider` instance.
+        """
+        required_method = 'random_sample'
+
+        if required_method not in dir(value):
+
+            error_message = f'The interface `random_provider` does not contain {required_method} method.'
+            raise AttributeError(error_message)
+
+        self._random_provider = value
+
+    def __iter_names_from_chunks(self, names_chunks):
+        """
+        Lazily split chunks of `EOS` names into names.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes or as `uint64` values.
+        :return: iterator of `EOS` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                if names_chunk.dtype.kind == 'S':
+                    names_chunk = names_chunk.astype(f'U{EOS_NAME_LENGTH}')
+
+                names = names_chunk.tolist()
+
+            yield from names
+
+    def __iter_encoded_chunks(self, names_chunks):
+        """
+        Lazily encode chunks of `EOS` names into `uint64` values.
+
+        :param names_chunks: iterator of `numpy` arrays of names as bytes.
+        :return: iterator of `numpy` arrays of `uint64` names
+        """
+        for names_chunk in names_chunks:
+            with time_stage(self._stats, 'string_building'):
+                encoded_names_chunk = encode_names(names_chunk)
+
+            yield encoded_names_chunk
+
+    def __iter_chunks(self, num, chunk_size, unique=False, exclude=None):
+        """
+        Lazily generate chunks of `EOS` names.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names in a chunk.
+        :param unique: generate every name at most once, already generated names are redrawn.
+        :param exclude: index of excluded names with `contains` method, excluded names are redrawn.
+        :return: iterator of `numpy` arrays of names as bytes
+        """
+        if exclude is not None and 'contains' not in dir(exclude):
+            raise AttributeError('The interface `exclude` does not contain contains method.')
+
+        names_chunks = self.__iter_new_chunks(num=num, chunk_size=chunk_size)
+        if not unique and exclude is None:
+            return names_chunks
+
+        return iter_filtered_names_chunks(
+            names_chunks=names_chunks,
+            generate_chunk=self.__generate_chunk,
+            unique_names_index=create_unique_names_index(num) if unique else None,
+            excluded_names=exclude,
+            stats=self._stats,
+        )
+
+    def __iter_new_chunks(self, num, chunk_size):
+        """
+        Lazily generate chunks of `EOS` names, which may contain already generated names.
+
+        :param num: number of generated names, names are generated infinitely if `num` is `None`.
+        :param chunk_size: number of names in a chunk.
+        :return: iterator of `numpy` arrays of names as bytes
+        """
+        generated_names_num = 0
+        while num is None or generated_names_num < num:
+            names_chunk_size = chunk_size if num is None else min(chunk_size, num - generated_names_num)
+            generated_names_num += names_chunk_size
+
+            yield self.__generate_chunk(names_chunk_size)
+
+    def __generate_chunk(self, num) -> np.ndarray:
+        """
+        Generate chunk of `EOS` names by batches of `batch_size` names.
+
+        :param num: number of generated names.
+        :return: `numpy` array of `EOS` names as bytes
+        """
+        if num <= self.batch_size:
+            return self.__generate_batch(num)
+
+        return np.concatenate([
+            self.__generate_batch(min(self.batch_size, num - batch_start))
+            for batch_start in range(0, num, self.batch_size)
+        ])
+
+    def __generate_batch(self, num) -> np.ndarray:
+        """
+        Generate batch of `EOS` names with `numpy` arrays.
+
+        Hidden states of all unfinished names are advanced in lock-step, finished names are dropped
+        from the batch, so the batch shrinks as names are finished.
+
+        :param num: number of generated names.
+        :return: `numpy` array of `EOS` names as bytes
+        """
+        stats = self._stats
+        if stats is not None:
+            stats.count('draws', num)
+
+        names = np.empty((num, EOS_NAME_LENGTH), dtype=np.uint8)
+        rows = np.arange(num)
+        positions = np.zeros(num, dtype=np.intp)
+        symbols = np.full(num, END_OF_WORD_SYMBOL, dtype=np.intp)
+        hidden_states, hidden_projections = self.__model.get_initial_states(num)
+
+        while rows.size:
+            with time_stage(stats, 'lookup'):
+                hidden_states, hidden_projections, logits = self.__model.step(
+                    symbols, hidden_states, hidden_projections,
+                )
+
+            with time_stage(stats, 'sampling'):
+                logits = logits / self.temperature
+                logits[positions == 0] = np.where(FIRST_SYMBOLS_MASK, -np.inf, logits[positions == 0])
+                symbols = self.__draw_symbols(logits, self.random_provider.random_sample(rows.size))
+
+            with time_stage(stats, 'string_building'):
+                is_character = symbols != END_OF_WORD_SYMBOL
+                names[rows[is_character], positions[is_character]] = SYMBOLS_BYTES[symbols[is_character]]
+                positions += is_character
+
+            is_unfinished = positions < EOS_NAME_LENGTH
+            rows, positions, symbols = rows[is_unfinished], positions[is_unfinished], symbols[is_unfinished]
+            hidden_states, hidden_projections = hidden_states[is_unfinished], hidden_projections[is_unfinished]
+
+        return names.view(f'S{EOS_NAME_LENGTH}').ravel()
+
+    @staticmethod
+    def __draw_symbols(logits, random_floats) -> np.ndarray:
+        """
+        Draw symbols from the softmax distributions of logits.
+
+        :param logits: `numpy` matrix of logits, one row per distribution.
+        :param random_floats: `numpy` array of random floats from `[0.0, 1.0)`, one per distribution.
+        :return: `numpy` array of symbols
+        """
+        probabilities = np.exp(logits - logits.max(axis=1, keepdims=True))
+        cumulative_probabilities = np.cumsum(probabilities, axis=1)
+        thresholds = random_floats * cumulative_probabilities[:, -1]
+
+        symbols = (cumulative_probabilities <= thresholds[:, np.newaxis]).sum(axis=1)
+        return np.minimum(symbols, logits.shape[1] - 1)
+
+    def __repr__(self):
+        """
+        Debug `repr` method.
+
+        :return: `RNNNameGenerator` object state
+        """
+        return f'<RNNNameGenerator({self.weights_path}, {self.temperature}, {self.random_provider})>'
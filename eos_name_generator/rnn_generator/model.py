@@ -0,0 +1,152 @@
+"""
+Provide implementation of the GRUModel.
+"""
+import numpy as np
+
+from eos_name_generator.constants import EOS_NAME_ALPHABET
+from eos_name_generator.errors import RNNModelError
+
+ALPHABET_LEN = len(EOS_NAME_ALPHABET)
+WEIGHTS_NAMES = (
+    'input_weights',
+    'hidden_weights',
+    'input_bias',
+    'hidden_bias',
+    'output_weights',
+    'output_bias',
+)
+
+
+class GRUModel:
+    """
+    Implementation of the single layer GRU character model over the `EOS` name alphabet.
+
+    Input symbols are one-hot encoded, so the input projection is the row of `input_weights`.
+    Gates are ordered as reset, update and new gate, the same as in `torch.nn.GRU`:
+        - r = sigmoid(x W_r + b_ir + h U_r + b_hr)
+        - z = sigmoid(x W_z + b_iz + h U_z + b_hz)
+        - n = tanh(x W_n + b_in + r * (h U_n + b_hn))
+        - h' = (1 - z) * n + z * h
+
+    Hidden and output weights are concatenated, so the hidden projection of the next step and output
+    logits of the batch of hidden states are computed with one matrix multiplication per step.
+    """
+
+    def __init__(
+            self,
+            input_weights,
+            hidden_weights,
+            input_bias,
+            hidden_bias,
+            output_weights,
+            output_bias,
+    ):
+        """
+        `GRUModel` constructor.
+
+        :param input_weights: matrix of the input weights of shape `(alphabet_len, 3 * hidden_size)`.
+        :param hidden_weights: matrix of the hidden weights of shape `(hidden_size, 3 * hidden_size)`.
+        :param input_bias: vector of the input bias of shape `(3 * hidden_size,)`.
+        :param hidden_bias: vector of the hidden bias of shape `(3 * hidden_size,)`.
+        :param output_weights: matrix of the output weights of shape `(hidden_size, alphabet_len)`.
+        :param output_bias: vector of the output bias of shape `(alphabet_len,)`.
+        """
+        self.input_weights = np.asarray(input_weights, dtype=np.float32)
+        self.hidden_weights = np.asarray(hidden_weights, dtype=np.float32)
+        self.input_bias = np.asarray(input_bias, dtype=np.float32)
+        self.hidden_bias = np.asarray(hidden_bias, dtype=np.float32)
+        self.output_weights = np.asarray(output_weights, dtype=np.float32)
+        self.output_bias = np.asarray(output_bias, dtype=np.float32)
+
+        self.hidden_size = self.hidden_weights.shape[0]
+        self.__validate_shapes()
+
+        self.__input_projections = self.input_weights + self.input_bias
+        self.__step_weights = np.concatenate([self.hidden_weights, self.output_weights], axis=1)
+        self.__step_bias = np.concatenate([self.hidden_bias, self.output_bias])
+
+    @classmethod
+    def load(cls, weights_path):
+        """
+        Load the model from the `.npz` weights file.
+
+        :param weights_path: path to the weights file.
+        :return: the model
+        """
+        with np.load(weights_path, allow_pickle=False) as weights:
+            missing_weights_names = [name for name in WEIGHTS_NAMES if name not in weights]
+            if missing_weights_names:
+                raise RNNModelError(f'RNN model weights do not contain {", ".join(missing_weights_names)}')
+
+            return cls(**{name: weights[name] for name in WEIGHTS_NAMES})
+
+    def save(self, weights_path):
+        """
+        Save the model to the `.npz` weights file.
+
+        :param weights_path: path to the weights file.
+        """
+        np.savez(weights_path, **self.get_weights())
+
+    def get_weights(self) -> dict:
+        """
+        Get weights of the model.
+
+        :return: dictionary of weights by name
+        """
+        return {name: getattr(self, name) for name in WEIGHTS_NAMES}
+
+    def get_initial_states(self, num) -> tuple:
+        """
+        Get zero hidden states and their hidden projections.
+
+        :param num: number of states.
+        :return: tuple of hidden states and hidden projections
+        """
+        hidden_states = np.zeros((num, self.hidden_size), dtype=np.float32)
+        hidden_projections = np.broadcast_to(self.hidden_bias, (num, 3 * self.hidden_size))
+
+        return hidden_states, hidden_projections
+
+    def step(self, symbols, hidden_states, hidden_projections) -> tuple:
+        """
+        Advance the batch of hidden states by input symbols.
+
+        :param symbols: `numpy` array of input symbols.
+        :param hidden_states: `numpy` matrix of hidden states, one row per state.
+        :param hidden_projections: `numpy` matrix of hidden projections of hidden states.
+        :return: tuple of next hidden states, their hidden projections and output logits
+        """
+        hidden_size = self.hidden_size
+        input_projections = self.__input_projections[symbols]
+
+        gates = input_projections[:, :2 * hidden_size] + hidden_projections[:, :2 * hidden_size]
+        gates = 1 / (1 + np.exp(-gates))
+        reset_gates, update_gates = gates[:, :hidden_size], gates[:, hidden_size:]
+
+        new_gates = input_projections[:, 2 * hidden_size:] + reset_gates * hidden_projections[:, 2 * hidden_size:]
+        new_gates = np.tanh(new_gates)
+        hidden_states = new_gates + update_gates * (hidden_states - new_gates)
+
+        projections = hidden_states @ self.__step_weights + self.__step_bias
+
+        return hidden_states, projections[:, :3 * hidden_size], projections[:, 3 * hidden_size:]
+
+    def __validate_shapes(self):
+        """
+        Validate that shapes of weights are consistent with the hidden size and the alphabet length.
+        """
+        gates_size = 3 * self.hidden_size
+        expected_shapes = {
+            'input_weights': (ALPHABET_LEN, gates_size),
+            'hidden_weights': (self.hidden_size, gates_size),
+            'input_bias': (gates_size,),
+            'hidden_bias': (gates_size,),
+            'output_weights': (self.hidden_size, ALPHABET_LEN),
+            'output_bias': (ALPHABET_LEN,),
+        }
+
+        for name, expected_shape in expected_shapes.items():
+            shape = getattr(self, name).shape
+            if shape != expected_shape:
+                raise RNNModelError(f'RNN model weights {name} shape {shape} does not match {expected_shape}')
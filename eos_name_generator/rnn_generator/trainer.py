@@ -0,0 +1,429 @@
+"""
+Provide implementation of the RNNTrainer.
+"""
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    RNN_CHECKPOINT_INTERVAL,
+    RNN_GRADIENT_CLIP_NORM,
+    RNN_HIDDEN_SIZE,
+    RNN_LEARNING_RATE,
+    RNN_REPORT_INTERVAL,
+    RNN_SEQUENCE_LEN,
+    RNN_TRAINING_BATCH_SIZE,
+    SEED_DATA_PATH,
+)
+from eos_name_generator.random_generator.data_reader import DataReader
+from eos_name_generator.rnn_generator.model import (
+    ALPHABET_LEN,
+    WEIGHTS_NAMES,
+    GRUModel,
+)
+
+END_OF_WORD_BYTE = ord(EOS_NAME_ALPHABET[0])
+SYMBOLS_BY_BYTE = np.zeros(256, dtype=np.uint8)
+SYMBOLS_BY_BYTE[np.frombuffer(EOS_NAME_ALPHABET.encode(), dtype=np.uint8)] = np.arange(ALPHABET_LEN)
+ADAM_BETAS = (0.9, 0.999)
+ADAM_EPSILON = 1e-8
+
+TrainingReport = namedtuple('TrainingReport', ['step', 'loss', 'tokens_per_second', 'max_rss_bytes'])
+
+
+def get_max_rss_bytes():
+    """
+    Get the peak resident set size of the current process.
+
+    The `resource` module is Unix only, `ru_maxrss` is reported in kilobytes on Linux and in bytes on macOS.
+
+    :return: peak resident set size in bytes, `None` if it is not available on the platform
+    """
+    if sys.platform == 'win32':
+        return None
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class RNNTrainer:
+    """
+    Implementation of the offline trainer of the GRU model.
+
+    The model is trained on the seed data words shuffled every epoch and joined by the end of word symbol (`.`).
+    The joined words are split into `batch_size` parallel streams, every step trains on the next window
+    of `sequence_len` symbols of each stream with the truncated backpropagation through time, the hidden
+    states are carried over from the previous window. Parameters are updated with Adam.
+
+    With `checkpoint_path`, the training state (weights, Adam moments, hidden states and the step) is saved
+    every `checkpoint_interval` steps, and the trainer created with the existing checkpoint resumes training
+    from it with hyperparameters of the checkpoint.
+    """
+
+    def __init__(
+            self,
+            seed_data_path=SEED_DATA_PATH,
+            checkpoint_path=None,
+            hidden_size=RNN_HIDDEN_SIZE,
+            batch_size=RNN_TRAINING_BATCH_SIZE,
+            sequence_len=RNN_SEQUENCE_LEN,
+            learning_rate=RNN_LEARNING_RATE,
+            seed=None,
+    ):
+        """
+        `RNNTrainer` constructor.
+
+        :param seed_data_path: path to the data based on which the model will be trained.
+        :param checkpoint_path: path to the training checkpoint, training is resumed if the checkpoint exists.
+        :param hidden_size: hidden size of the model.
+        :param batch_size: number of parallel streams trained at once.
+        :param sequence_len: number of symbols the gradients are backpropagated through.
+        :param learning_rate: learning rate of Adam.
+        :param seed: seed of the weights initialization and words shuffling, random if `None`.
+        """
+        self.seed_data_path = seed_data_path
+        self.checkpoint_path = checkpoint_path
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self.__load_checkpoint()
+        else:
+            self.__initialize(hidden_size, batch_size, sequence_len, learning_rate, seed)
+
+        self.__words = DataReader(data_path=seed_data_path).get_dictionary_by_word_len()
+        self.__streams = None
+        self.__streams_epoch = None
+
+    @property
+    def model(self) -> GRUModel:
+        """
+        Get the trained model.
+
+        :return: `GRUModel` instance
+        """
+        return GRUModel(**self.__weights)
+
+    @property
+    def steps_per_epoch(self) -> int:
+        """
+        Get number of steps in the epoch.
+
+        :return: number of steps
+        """
+        symbols_num = sum((word_len + 1) * len(words) for word_len, words in self.__words.items())
+        steps_per_epoch = symbols_num // self.batch_size // self.sequence_len
+
+        if not steps_per_epoch:
+            raise ValueError('The seed data is too small for the batch size and the sequence length.')
+
+        return steps_per_epoch
+
+    def train(
+            self,
+            steps,
+            checkpoint_interval=RNN_CHECKPOINT_INTERVAL,
+            report_interval=RNN_REPORT_INTERVAL,
+            report_callback=None,
+    ) -> GRUModel:
+        """
+        Train the model until the step `steps`.
+
+        :param steps: total number of training steps, including steps done before the checkpoint.
+        :param checkpoint_interval: number of steps between saving checkpoints.
+        :param report_interval: number of steps between reports.
+        :param report_callback: function called with `TrainingReport` of the last `report_interval` steps.
+        :return: the trained model
+        """
+        losses = []
+        report_start_time = time.perf_counter()
+        report_start_step = self.step
+
+        while self.step < steps:
+            losses.append(self.__train_step())
+            self.step += 1
+
+            if self.checkpoint_path is not None and self.step % checkpoint_interval == 0:
+                self.__save_checkpoint()
+
+            if report_callback is not None and (self.step % report_interval == 0 or self.step == steps):
+                elapsed_time = time.perf_counter() - report_start_time
+                tokens_num = (self.step - report_start_step) * self.batch_size * self.sequence_len
+
+                report_callback(TrainingReport(
+                    step=self.step,
+                    loss=float(np.mean(losses)),
+                    tokens_per_second=tokens_num / elapsed_time,
+                    max_rss_bytes=get_max_rss_bytes(),
+                ))
+
+                losses = []
+                report_start_time = time.perf_counter()
+                report_start_step = self.step
+
+        if self.checkpoint_path is not None:
+            self.__save_checkpoint()
+
+        return self.model
+
+    def __train_step(self) -> float:
+        """
+        Train the model on the next window of streams.
+
+        :return: loss of the window
+        """
+        inputs, targets = self.__get_window()
+        loss, gradients, self.__hidden_states = get_loss_and_gradients(
+            self.__weights, inputs, targets, self.__hidden_states,
+        )
+
+        gradients_norm = np.sqrt(sum(float(np.sum(gradient ** 2)) for gradient in gradients.values()))
+        gradients_scale = min(1.0, RNN_GRADIENT_CLIP_NORM / (gradients_norm + ADAM_EPSILON))
+
+        first_beta, second_beta = ADAM_BETAS
+        update_num = self.step + 1
+        step_size = self.learning_rate * np.sqrt(1 - second_beta ** update_num) / (1 - first_beta ** update_num)
+
+        for name, gradient in gradients.items():
+            gradient = (gradient * gradients_scale).astype(np.float32)
+            self.__first_moments[name] = first_beta * self.__first_moments[name] + (1 - first_beta) * gradient
+            self.__second_moments[name] = second_beta * self.__second_moments[name] + (1 - second_beta) * gradient ** 2
+            self.__weights[name] -= step_size * self.__first_moments[name] / (
+                np.sqrt(self.__second_moments[name]) + ADAM_EPSILON
+            )
+
+        return loss
+
+    def __get_window(self) -> tuple:
+        """
+        Get input and target symbols of the window of the current step.
+
+        Hidden states are reset at the start of every epoch.
+
+        :return: tuple of `numpy` matrices of input and target symbols of shape `(sequence_len, batch_size)`
+        """
+        inputs, targets = self.__streams_of_epoch(self.step // self.steps_per_epoch)
+        window_start = self.step % self.steps_per_epoch * self.sequence_len
+        window = slice(window_start, window_start + self.sequence_len)
+
+        if window_start == 0:
+            self.__hidden_states = np.zeros((self.batch_size, self.hidden_size), dtype=np.float32)
+
+        return inputs[:, window].T, targets[:, window].T
+
+    def __streams_of_epoch(self, epoch) -> tuple:
+        """
+        Get input and target streams of the epoch, words are shuffled with the seed and the epoch.
+
+        :param epoch: number of the epoch.
+        :return: tuple of `numpy` matrices of input and target symbols of shape `(batch_size, stream_len)`
+        """
+        if self.__streams_epoch == epoch:
+            return self.__streams
+
+        words_data = []
+        words_starts = []
+        words_lens = []
+        data_len = 0
+        for word_len, words in self.__words.items():
+            words_matrix = np.full((len(words), word_len + 1), END_OF_WORD_BYTE, dtype=np.uint8)
+            words_matrix[:, :word_len] = np.asarray(words, dtype=f'S{word_len}').view(np.uint8).reshape(-1, word_len)
+
+            words_data.append(words_matrix.ravel())
+            words_starts.append(data_len + np.arange(len(words)) * (word_len + 1))
+            words_lens.append(np.full(len(words), word_len + 1))
+            data_len += words_matrix.size
+
+        words_order = np.random.default_rng([self.seed, epoch]).permutation(sum(map(len, words_lens)))
+        words_starts = np.concatenate(words_starts)[words_order]
+        words_lens = np.concatenate(words_lens)[words_order]
+
+        shuffled_words_starts = np.cumsum(words_lens) - words_lens
+        data_indices = np.repeat(words_starts - shuffled_words_starts, words_lens) + np.arange(data_len)
+        stream = np.concatenate([[END_OF_WORD_BYTE], np.concatenate(words_data)[data_indices]]).astype(np.uint8)
+        stream = SYMBOLS_BY_BYTE[stream]
+
+        stream_len = self.steps_per_epoch * self.sequence_len
+        streams_len = self.batch_size * stream_len
+        self.__streams = (stream[:streams_len].reshape(self.batch_size, stream_len),
+                          stream[1:streams_len + 1].reshape(self.batch_size, stream_len))
+        self.__streams_epoch = epoch
+
+        return self.__streams
+
+    def __initialize(self, hidden_size, batch_size, sequence_len, learning_rate, seed):
+        """
+        Initialize the training state.
+
+        Weights are drawn uniformly from `[-1 / sqrt(hidden_size), 1 / sqrt(hidden_size)]`.
+
+        :param hidden_size: hidden size of the model.
+        :param batch_size: number of parallel streams trained at once.
+        :param sequence_len: number of symbols the gradients are backpropagated through.
+        :param learning_rate: learning rate of Adam.
+        :param seed: seed of the weights initialization and words shuffling, random if `None`.
+        """
+        self.hidden_size = hidden_size
+        self.batch_size = batch_size
+        self.sequence_len = sequence_len
+        self.learning_rate = learning_rate
+        self.seed = int(np.random.SeedSequence().generate_state(1)[0]) if seed is None else seed
+        self.step = 0
+
+        weights_shapes = {
+            'input_weights': (ALPHABET_LEN, 3 * hidden_size),
+            'hidden_weights': (hidden_size, 3 * hidden_size),
+            'input_bias': (3 * hidden_size,),
+            'hidden_bias': (3 * hidden_size,),
+            'output_weights': (hidden_size, ALPHABET_LEN),
+            'output_bias': (ALPHABET_LEN,),
+        }
+        random_generator = np.random.default_rng(self.seed)
+        weights_bound = 1 / np.sqrt(hidden_size)
+
+        self.__weights = {
+            name: random_generator.uniform(-weights_bound, weights_bound, weights_shapes[name]).astype(np.float32)
+            for name in WEIGHTS_NAMES
+        }
+        self.__first_moments = {name: np.zeros_like(weights) for name, weights in self.__weights.items()}
+        self.__second_moments = {name: np.zeros_like(weights) for name, weights in self.__weights.items()}
+        self.__hidden_states = np.zeros((batch_size, hidden_size), dtype=np.float32)
+
+    def __load_checkpoint(self):
+        """
+        Load the training state from the checkpoint.
+        """
+        with np.load(self.checkpoint_path, allow_pickle=False) as checkpoint:
+            self.hidden_size = int(checkpoint['hidden_size'])
+            self.batch_size = int(checkpoint['batch_size'])
+            self.sequence_len = int(checkpoint['sequence_len'])
+            self.learning_rate = float(checkpoint['learning_rate'])
+            self.seed = int(checkpoint['seed'])
+            self.step = int(checkpoint['step'])
+
+            self.__weights = {name: checkpoint[f'weights_{name}'] for name in WEIGHTS_NAMES}
+            self.__first_moments = {name: checkpoint[f'first_moments_{name}'] for name in WEIGHTS_NAMES}
+            self.__second_moments = {name: checkpoint[f'second_moments_{name}'] for name in WEIGHTS_NAMES}
+            self.__hidden_states = checkpoint['hidden_states']
+
+    def __save_checkpoint(self):
+        """
+        Save the training state to the checkpoint.
+
+        The checkpoint is written next to `checkpoint_path` and atomically replaces it, so the interrupted
+        training does not damage the previous checkpoint.
+        """
+        checkpoint = {
+            'hidden_size': self.hidden_size,
+            'batch_size': self.batch_size,
+            'sequence_len': self.sequence_len,
+            'learning_rate': self.learning_rate,
+            'seed': self.seed,
+            'step': self.step,
+            'hidden_states': self.__hidden_states,
+        }
+        for name in WEIGHTS_NAMES:
+            checkpoint[f'weights_{name}'] = self.__weights[name]
+            checkpoint[f'first_moments_{name}'] = self.__first_moments[name]
+            checkpoint[f'second_moments_{name}'] = self.__second_moments[name]
+
+        temporary_checkpoint_path = f'{self.checkpoint_path}.{os.getpid()}.tmp.npz'
+        np.savez(temporary_checkpoint_path, **checkpoint)
+        os.replace(temporary_checkpoint_path, self.checkpoint_path)
+
+
+def get_loss_and_gradients(weights, inputs, targets, hidden_states) -> tuple:
+    """
+    Get the mean cross-entropy loss of the window and its gradients by the backpropagation through time.
+
+    Gates are computed as in `GRUModel.step`. Gradients of the input, hidden and output weights are
+    accumulated over the whole window with one matrix multiplication each.
+
+    :param weights: dictionary of weights by name.
+    :param inputs: `numpy` matrix of input symbols of shape `(sequence_len, batch_size)`.
+    :param targets: `numpy` matrix of target symbols of shape `(sequence_len, batch_size)`.
+    :param hidden_states: `numpy` matrix of hidden states before the window.
+    :return: tuple of the loss, dictionary of gradients by weights name and hidden states after the window
+    """
+    sequence_len, batch_size = inputs.shape
+    hidden_size = hidden_states.shape[1]
+    hidden_weights = weights['hidden_weights']
+    output_weights = weights['output_weights']
+
+    input_projections = weights['input_weights'][inputs] + weights['input_bias']
+    previous_hidden_states = np.empty((sequence_len, batch_size, hidden_size), dtype=hidden_states.dtype)
+    next_hidden_states = np.empty_like(previous_hidden_states)
+    new_hidden_projections = np.empty_like(previous_hidden_states)
+    reset_gates = np.empty_like(previous_hidden_states)
+    update_gates = np.empty_like(previous_hidden_states)
+    new_gates = np.empty_like(previous_hidden_states)
+
+    for position in range(sequence_len):
+        previous_hidden_states[position] = hidden_states
+        hidden_projections = hidden_states @ hidden_weights + weights['hidden_bias']
+        input_projection = input_projections[position]
+
+        gates = 1 / (1 + np.exp(-(input_projection[:, :2 * hidden_size] + hidden_projections[:, :2 * hidden_size])))
+        reset_gates[position], update_gates[position] = gates[:, :hidden_size], gates[:, hidden_size:]
+        new_hidden_projections[position] = hidden_projections[:, 2 * hidden_size:]
+        new_gates[position] = np.tanh(
+            input_projection[:, 2 * hidden_size:] + reset_gates[position] * new_hidden_projections[position],
+        )
+
+        hidden_states = new_gates[position] + update_gates[position] * (hidden_states - new_gates[position])
+        next_hidden_states[position] = hidden_states
+
+    flat_targets = targets.ravel()
+    flat_indices = np.arange(flat_targets.size)
+    logits = next_hidden_states.reshape(-1, hidden_size) @ output_weights + weights['output_bias']
+    probabilities = np.exp(logits - logits.max(axis=1, keepdims=True))
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    loss = float(-np.mean(np.log(probabilities[flat_indices, flat_targets] + 1e-12)))
+
+    output_gradients = probabilities
+    output_gradients[flat_indices, flat_targets] -= 1
+    output_gradients /= flat_targets.size
+    hidden_states_gradients = (output_gradients @ output_weights.T).reshape(sequence_len, batch_size, hidden_size)
+
+    input_projections_gradients = np.empty_like(input_projections)
+    hidden_projections_gradients = np.empty_like(input_projections)
+    hidden_state_gradient = np.zeros_like(hidden_states)
+
+    for position in reversed(range(sequence_len)):
+        reset_gate, update_gate, new_gate = reset_gates[position], update_gates[position], new_gates[position]
+        hidden_state_gradient = hidden_state_gradient + hidden_states_gradients[position]
+
+        new_gate_gradient = hidden_state_gradient * (1 - update_gate) * (1 - new_gate ** 2)
+        update_gate_gradient = hidden_state_gradient * (previous_hidden_states[position] - new_gate)
+        reset_gate_gradient = new_gate_gradient * new_hidden_projections[position]
+
+        input_projection_gradient = input_projections_gradients[position]
+        input_projection_gradient[:, :hidden_size] = reset_gate_gradient * reset_gate * (1 - reset_gate)
+        input_projection_gradient[:, hidden_size:2 * hidden_size] = \
+            update_gate_gradient * update_gate * (1 - update_gate)
+        input_projection_gradient[:, 2 * hidden_size:] = new_gate_gradient
+
+        hidden_projection_gradient = hidden_projections_gradients[position]
+        hidden_projection_gradient[:, :2 * hidden_size] = input_projection_gradient[:, :2 * hidden_size]
+        hidden_projection_gradient[:, 2 * hidden_size:] = new_gate_gradient * reset_gate
+
+        hidden_state_gradient = hidden_state_gradient * update_gate + hidden_projection_gradient @ hidden_weights.T
+
+    input_projections_gradients = input_projections_gradients.reshape(-1, 3 * hidden_size)
+    hidden_projections_gradients = hidden_projections_gradients.reshape(-1, 3 * hidden_size)
+    one_hot_inputs = np.eye(ALPHABET_LEN, dtype=input_projections.dtype)[inputs.ravel()]
+
+    gradients = {
+        'input_weights': one_hot_inputs.T @ input_projections_gradients,
+        'hidden_weights': previous_hidden_states.reshape(-1, hidden_size).T @ hidden_projections_gradients,
+        'input_bias': input_projections_gradients.sum(axis=0),
+        'hidden_bias': hidden_projections_gradients.sum(axis=0),
+        'output_weights': next_hidden_states.reshape(-1, hidden_size).T @ output_gradients,
+        'output_bias': output_gradients.sum(axis=0),
+    }
+
+    return loss, gradients, hidden_states
@@ -1 +1,13 @@
-from eos_name_generator.utils.fast_random_choice import FastRandomChoice
+from eos_name_generator.utils.fast_random_choice import (
+    DEFAULT_RANDOM_PROVIDER,
+    AliasTable,
+    FastRandomChoice,
+    PreparedChoice,
+    ProviderChoice,
+    get_random_provider_instance,
+)
+from eos_name_generator.utils.generation_stats import GenerationStats
+from eos_name_generator.utils.name_encoding import (
+    decode_names,
+    encode_names,
+)
@@ -1 +1,10 @@
-from eos_name_generator.utils.fast_random_choice.fast_random_choice import FastRandomChoice
+from eos_name_generator.utils.fast_random_choice.alias_table import AliasTable
+from eos_name_generator.utils.fast_random_choice.fast_random_choice import (
+    DEFAULT_RANDOM_PROVIDER,
+    FastRandomChoice,
+    get_random_provider_instance,
+)
+from eos_name_generator.utils.fast_random_choice.prepared_choice import (
+    PreparedChoice,
+    ProviderChoice,
+)
@@ -0,0 +1,84 @@
+"""
+Provide an implementation of the AliasTable.
+"""
+import numpy as np
+
+
+class AliasTable:
+    """
+    Implementation of the Walker's alias table built with the Vose's algorithm.
+
+    The table is built once per probabilities list in O(n) time, after that any number of elements
+    is drawn in O(1) time per element.
+
+    References:
+        - https://www.keithschwarz.com/darts-dice-coins/
+    """
+
+    def __init__(self, probabilities):
+        """
+        `AliasTable` constructor.
+
+        :param probabilities: non-negative probabilities list, it is normalized to sum 1.
+        """
+        probabilities_len = len(probabilities)
+        probabilities_sum = float(sum(probabilities))
+        scaled_probabilities = [probability * probabilities_len / probabilities_sum for probability in probabilities]
+
+        self._probabilities = [1.0] * probabilities_len
+        self._aliases = list(range(probabilities_len))
+
+        small = [index for index, probability in enumerate(scaled_probabilities) if probability < 1]
+        large = [index for index, probability in enumerate(scaled_probabilities) if probability >= 1]
+
+        while small and large:
+            small_index = small.pop()
+            large_index = large.pop()
+
+            self._probabilities[small_index] = scaled_probabilities[small_index]
+            self._aliases[small_index] = large_index
+
+            scaled_probabilities[large_index] += scaled_probabilities[small_index] - 1
+            if scaled_probabilities[large_index] < 1:
+                small.append(large_index)
+            else:
+                large.append(large_index)
+
+        self._probabilities_array = np.array(self._probabilities, dtype=np.float64)
+        self._aliases_array = np.array(self._aliases, dtype=np.intp)
+
+    def __len__(self):
+        """
+        Get number of elements in the table.
+
+        :return: number of elements
+        """
+        return len(self._probabilities)
+
+    def draw(self, random_float) -> int:
+        """
+        Draw an index from the table.
+
+        :param random_float: random float from the half-open interval `[0.0, 1.0)`.
+        :return: drawn index.
+        """
+        scaled_random = random_float * len(self._probabilities)
+        index = int(scaled_random)
+
+        if scaled_random - index < self._probabilities[index]:
+            return index
+
+        return self._aliases[index]
+
+    def draw_many(self, random_floats) -> np.ndarray:
+        """
+        Draw an index from the table for every random float.
+
+        :param random_floats: `numpy` array of random floats from the half-open interval `[0.0, 1.0)`.
+        :return: `numpy` array of drawn indices.
+        """
+        scaled_random = np.asarray(random_floats) * len(self._probabilities)
+        indices = scaled_random.astype(np.intp)
+        is_alias = (scaled_random - indices) >= self._probabilities_array[indices]
+
+        return np.where(is_alias, self._aliases_array[indices], indices)
@@ -2,24 +2,132 @@
 Provide an implementation of the FastRandomChoice interface.
 """
 import random
+from functools import lru_cache
 
 import numpy as np
 
+from eos_name_generator.utils.fast_random_choice.alias_table import AliasTable
 from eos_name_generator.utils.fast_random_choice.interfaces import FastRandomChoiceInterface
+from eos_name_generator.utils.fast_random_choice.prepared_choice import PreparedChoice
+
+ALIAS_TABLES_CACHE_SIZE = 128
+DEFAULT_RANDOM_PROVIDER = object()
 
 
 class FastRandomChoice(random.Random, FastRandomChoiceInterface):
     """
     Implementation of the FastRandomChoice.
+
+    Elements are drawn with alias tables (`AliasTable`), which are built once per probabilities list
+    and cached on the instance. Besides the `random.Random` state, every instance owns `numpy` random
+    generator (`numpy_generator`) for the batch draws, both of them are seeded from the instance seed.
     """
 
-    def choice(self, seq, p):
+    def __init__(self, x=None):
+        """
+        `FastRandomChoice` constructor.
+
+        :param x: initial seed value, `numpy.random.SeedSequence` instances are accepted as well.
+        """
+        self._alias_tables = {}
+        super().__init__(x)
+
+    def seed(self, a=None, version=2):
+        """
+        Initialize internal state from the seed.
+
+        `numpy` random generator is seeded with a seed sequence derived from the same seed.
+
+        :param a: seed value, `numpy.random.SeedSequence` instances are accepted as well.
+        :param version: `random.Random` seeding version.
+        """
+        if isinstance(a, np.random.SeedSequence):
+            seed_sequence = a
+            seed_state = seed_sequence.generate_state(4, dtype=np.uint32)
+            super().seed(int.from_bytes(seed_state.tobytes(), 'little'), version)
+        else:
+            super().seed(a, version)
+            seed_sequence = np.random.SeedSequence(self.getrandbits(128))
+
+        self._seed_sequence = seed_sequence
+        self.numpy_generator = np.random.Generator(np.random.PCG64(seed_sequence))
+
+    def spawn(self, n) -> list:
+        """
+        Spawn independent child random providers.
+
+        Children are seeded from the spawned seed sequences, so they produce deterministic
+        non-overlapping random streams for the same parent seed.
+
+        :param n: number of child random providers.
+        :return: list of `FastRandomChoice` instances
+        """
+        return [self.__class__(seed_sequence) for seed_sequence in self._seed_sequence.spawn(n)]
+
+    def getstate(self):
+        """
+        Get internal state of the `random.Random` and `numpy` random generator.
+
+        :return: internal state
+        """
+        return super().getstate(), self.numpy_generator.bit_generator.state, self._seed_sequence
+
+    def setstate(self, state):
+        """
+        Restore internal state of the `random.Random` and `numpy` random generator.
+
+        :param state: internal state returned by `getstate`.
+        """
+        random_state, numpy_generator_state, self._seed_sequence = state
+        super().setstate(random_state)
+
+        self.numpy_generator = np.random.Generator(np.random.PCG64())
+        self.numpy_generator.bit_generator.state = numpy_generator_state
+
+    def choice(self, seq, p, size=None):
         """
         Choose a random element from a non-empty sequence with probabilities list.
 
         :param seq: non-empty sequence.
         :param p: probabilities according to sequence.
-        :return: random element from sequence
+        :param size: number of chosen elements, a single element is returned if `size` is `None`.
+        :return: random element from sequence or `numpy` array of random elements
+        """
+        self.__validate_choice(seq=seq, p=p)
+        alias_table = self.__get_alias_table(probabilities=p)
+
+        if size is not None:
+            elements_indices = alias_table.draw_many(self.random_sample(size))
+            return np.asarray(seq)[elements_indices]
+
+        element_index = alias_table.draw(self.random())
+        random_element = seq[element_index]
+
+        return random_element
+
+    def prepare(self, seq, p) -> PreparedChoice:
+        """
+        Prepare a random choice from a non-empty sequence with probabilities list.
+
+        Sequence and probabilities are validated once, so the prepared choice is the fastest way
+        to choose elements from the same sequence many times.
+
+        :param seq: non-empty sequence.
+        :param p: probabilities according to sequence.
+        :return: prepared choice with `draw` and `draw_many` methods
+        """
+        self.__validate_choice(seq=seq, p=p)
+        alias_table = self.__get_alias_table(probabilities=p)
+
+        return PreparedChoice(random_provider=self, seq=seq, alias_table=alias_table)
+
+    @staticmethod
+    def __validate_choice(seq, p):
+        """
+        Validate a non-empty sequence and probabilities list.
+
+        :param seq: non-empty sequence.
+        :param p: probabilities according to sequence.
         """
         sequence_len = len(seq)
         if not sequence_len:
@@ -36,28 +144,84 @@ class FastRandomChoice(random.Random, FastRandomChoiceInterface):
         if 0.99 > probabilities_sum < 1.01:
             raise ValueError('Probabilities do not sum to 1')
 
-        element_index = self.multidimensional_shifting(probabilities=p)
-        random_element = seq[element_index]
+    def __get_alias_table(self, probabilities) -> AliasTable:
+        """
+        Get cached alias table of the probabilities list or build a new one.
 
-        return random_element
+        :param probabilities: probabilities list.
+        :return: alias table.
+        """
+        alias_table_key = tuple(probabilities)
+        alias_table = self._alias_tables.get(alias_table_key)
 
-    @staticmethod
-    def multidimensional_shifting(probabilities: list) -> int:
+        if alias_table is None:
+            if len(self._alias_tables) >= ALIAS_TABLES_CACHE_SIZE:
+                del self._alias_tables[next(iter(self._alias_tables))]
+
+            alias_table = AliasTable(probabilities=probabilities)
+            self._alias_tables[alias_table_key] = alias_table
+
+        return alias_table
+
+    def random_sample(self, size=None):
+        """
+        Get random floats in the half-open interval `[0.0, 1.0)`.
+
+        The method has the same signature as `numpy.random.random_sample`, so both providers
+        could be used for the batch name generation.
+        :param size: output shape, a single float is returned if `size` is `None`.
+        :return: random float or `numpy` array of random floats.
+        """
+        return self.numpy_generator.random(size)
+
+    def integers(self, low, high, size=None, dtype=np.int64):
+        """
+        Get random integers in the half-open interval `[low, high)`.
+
+        The method has the same signature as `numpy.random.Generator.integers`, small integers are drawn
+        as `uint8` directly without intermediate floats.
+        :param low: the lowest integer.
+        :param high: one above the highest integer.
+        :param size: output shape, a single integer is returned if `size` is `None`.
+        :param dtype: `numpy` dtype of integers.
+        :return: random integer or `numpy` array of random integers.
+        """
+        return self.numpy_generator.integers(low, high, size=size, dtype=dtype)
+
+    def multidimensional_shifting(self, probabilities: list, num_samples=None):
         """
         Get the most probable element from probabilities sequence.
 
         This method is a direct replacement for slow cycle python loops.
+        Random shifts are drawn from `numpy_generator`, so they are reproducible with the instance seed.
         :param probabilities: probabilities list.
-        :return: probability index.
+        :param num_samples: number of samples, a single index is returned if `num_samples` is `None`.
+        :return: probability index or `numpy` array of probability indices.
         """
         # replicate probabilities as many times
-        replicated_probabilities = np.tile(probabilities, (1, 1))
+        replicated_probabilities = np.tile(probabilities, (num_samples or 1, 1))
         # get random shifting numbers & scale them correctly
-        random_shifts = np.random.random(replicated_probabilities.shape)
+        random_shifts = self.numpy_generator.random(replicated_probabilities.shape)
         random_shifts /= random_shifts.sum(axis=1)[:, np.newaxis]
         # shift by numbers & find largest (by finding the smallest of the negative)
         shifted_probabilities = random_shifts - replicated_probabilities
-        index_list = np.argpartition(shifted_probabilities, 1, axis=1)[:, :1]
+        index_list = np.argpartition(shifted_probabilities, 1, axis=1)[:, 0]
+
+        if num_samples is not None:
+            return index_list
 
-        index = int(index_list)
+        index = int(index_list[0])
         return index
+
+
+@lru_cache(maxsize=None)
+def get_random_provider_instance() -> FastRandomChoice:
+    """
+    Get the default random provider instance shared by generators.
+
+    Generators use it if `DEFAULT_RANDOM_PROVIDER` is passed as the random provider. The instance is created
+    on the first call, so the constants of the package do not depend on the random provider.
+
+    :return: `FastRandomChoice` instance
+    """
+    return FastRandomChoice()
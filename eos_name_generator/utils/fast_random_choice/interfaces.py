@@ -13,11 +13,52 @@ class FastRandomChoiceInterface(ABC):
     """
 
     @abstractmethod
-    def choice(self, seq, p):
+    def choice(self, seq, p, size=None):
         """
         Choose a random element from a non-empty sequence with probabilities list.
 
         :param seq: non-empty sequence.
         :param p: probabilities according to sequence.
-        :return: random element from sequence
+        :param size: number of chosen elements, a single element is returned if `size` is `None`.
+        :return: random element from sequence or `numpy` array of random elements
+        """
+
+    @abstractmethod
+    def prepare(self, seq, p):
+        """
+        Prepare a random choice from a non-empty sequence with probabilities list.
+
+        :param seq: non-empty sequence.
+        :param p: probabilities according to sequence.
+        :return: prepared choice with `draw` and `draw_many` methods
+        """
+
+    @abstractmethod
+    def random_sample(self, size=None):
+        """
+        Get random floats in the half-open interval `[0.0, 1.0)`.
+
+        :param size: output shape, a single float is returned if `size` is `None`.
+        :return: random float or `numpy` array of random floats.
+        """
+
+    @abstractmethod
+    def integers(self, low, high, size=None, dtype=None):
+        """
+        Get random integers in the half-open interval `[low, high)`.
+
+        :param low: the lowest integer.
+        :param high: one above the highest integer.
+        :param size: output shape, a single integer is returned if `size` is `None`.
+        :param dtype: `numpy` dtype of integers.
+        :return: random integer or `numpy` array of random integers.
+        """
+
+    @abstractmethod
+    def spawn(self, n):
+        """
+        Spawn independent child random providers.
+
+        :param n: number of child random providers.
+        :return: list of random providers
         """
@@ -0,0 +1,82 @@
+"""
+Provide an implementation of the PreparedChoice and ProviderChoice.
+"""
+import numpy as np
+
+
+class PreparedChoice:
+    """
+    Implementation of the PreparedChoice.
+
+    Sequence and probabilities are validated once and drawn with the alias table, so every draw
+    costs O(1) without repeated validation.
+    """
+
+    def __init__(self, random_provider, seq, alias_table):
+        """
+        `PreparedChoice` constructor.
+
+        :param random_provider: random provider instance with `random` and `random_sample` methods.
+        :param seq: validated non-empty sequence.
+        :param alias_table: alias table of the sequence probabilities.
+        """
+        self._random_provider = random_provider
+        self._seq = seq
+        self._seq_array = np.asarray(seq)
+        self._alias_table = alias_table
+
+    def draw(self):
+        """
+        Choose a random element from the sequence.
+
+        :return: random element from sequence
+        """
+        element_index = self._alias_table.draw(self._random_provider.random())
+        return self._seq[element_index]
+
+    def draw_many(self, size) -> np.ndarray:
+        """
+        Choose random elements from the sequence.
+
+        :param size: number of chosen elements.
+        :return: `numpy` array of random elements
+        """
+        elements_indices = self._alias_table.draw_many(self._random_provider.random_sample(size))
+        return self._seq_array[elements_indices]
+
+
+class ProviderChoice:
+    """
+    Implementation of the ProviderChoice.
+
+    Adapt any random provider with `choice` method (e.g. `numpy.random`) to the `PreparedChoice` interface.
+    """
+
+    def __init__(self, random_provider, seq, p):
+        """
+        `ProviderChoice` constructor.
+
+        :param random_provider: random provider instance with `choice` method.
+        :param seq: non-empty sequence.
+        :param p: probabilities according to sequence.
+        """
+        self._random_provider = random_provider
+        self._seq = seq
+        self._p = p
+
+    def draw(self):
+        """
+        Choose a random element from the sequence.
+
+        :return: random element from sequence
+        """
+        return self._random_provider.choice(self._seq, p=self._p)
+
+    def draw_many(self, size) -> np.ndarray:
+        """
+        Choose random elements from the sequence.
+
+        :param size: number of chosen elements.
+        :return: `numpy` array of random elements
+        """
+        return self._random_provider.choice(self._seq, p=self._p, size=size)
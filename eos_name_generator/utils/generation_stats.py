@@ -0,0 +1,166 @@
+"""
+Provide implementation of the GenerationStats.
+"""
+from contextlib import contextmanager
+from time import perf_counter
+
+STATS_COUNTERS = (
+    'draws',
+    'redraws',
+    'base_words',
+    'additional_words',
+    'digit_suffixes',
+    'bytes_emitted',
+)
+STATS_STAGES = (
+    'sampling',
+    'lookup',
+    'string_building',
+    'filtering',
+)
+STATS_METHODS = (
+    'count',
+    'time',
+)
+
+
+class GenerationStats:
+    """
+    Implementation of the GenerationStats.
+
+    Stats are counters and cumulative timings in seconds of generation stages:
+        - draws: generated names, including redrawn names.
+        - redraws: names redrawn instead of duplicates and excluded names.
+        - base_words, additional_words, digit_suffixes: chosen base words, additional alphabet words and numbers,
+          they are recorded by `RandomNameGenerator` only.
+        - bytes_emitted: bytes of names returned by the generator.
+        - sampling: drawing random values and drawing symbols from their distributions.
+        - lookup: gathering chosen words from the basic dictionary, advancing states of the Markov chain
+          or of the GRU model.
+        - string_building: assembling names, decoding them into strings or encoding them into `uint64` values.
+        - filtering: lookups of names in indexes of generated and excluded names.
+
+    Generators record stats only if the stats instance is set, so generation without stats costs
+    a `None` check per name or per stage of the chunk.
+    """
+
+    def __init__(self):
+        """
+        `GenerationStats` constructor.
+        """
+        self.counters = dict.fromkeys(STATS_COUNTERS, 0)
+        self.timings = dict.fromkeys(STATS_STAGES, 0.0)
+
+    def count(self, counter, num=1):
+        """
+        Increase the counter.
+
+        :param counter: name of the counter.
+        :param num: increment of the counter.
+        """
+        self.counters[counter] += int(num)
+
+    @contextmanager
+    def time(self, stage):
+        """
+        Add the time of the `with` block to the timing of the stage.
+
+        :param stage: name of the stage.
+        """
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] += perf_counter() - start_time
+
+    def reset(self):
+        """
+        Reset counters and timings to zero.
+        """
+        self.counters = dict.fromkeys(STATS_COUNTERS, 0)
+        self.timings = dict.fromkeys(STATS_STAGES, 0.0)
+
+    def to_dict(self) -> dict:
+        """
+        Get counters and timings.
+
+        :return: dictionary of counters and timings by name
+        """
+        return {
+            'counters': dict(self.counters),
+            'timings': dict(self.timings),
+        }
+
+    def __repr__(self):
+        """
+        Debug `repr` method.
+
+        :return: `GenerationStats` object state
+        """
+        return f'<GenerationStats({self.counters}, {self.timings})>'
+
+
+class NullTimer:
+    """
+    Implementation of the timer which records nothing, used when stats are not recorded.
+    """
+
+    def __enter__(self):
+        """
+        Enter the timed block.
+        """
+
+    def __exit__(self, *exc_info):
+        """
+        Exit the timed block, exceptions are not suppressed.
+        """
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+def check_stats(stats):
+    """
+    Check the stats instance has methods of `GenerationStats`.
+
+    :param stats: `GenerationStats` instance, stats are not recorded if `None`.
+    """
+    if stats is None:
+        return
+
+    stats_dir = dir(stats)
+    for method_name in STATS_METHODS:
+        if method_name not in stats_dir:
+
+            error_message = f'The interface `stats` does not contain {method_name} method.'
+            raise AttributeError(error_message)
+
+
+def time_stage(stats, stage):
+    """
+    Get the context manager which times the stage if stats are recorded.
+
+    :param stats: `GenerationStats` instance, stats are not recorded if `None`.
+    :param stage: name of the stage.
+    :return: context manager
+    """
+    if stats is None:
+        return NULL_TIMER
+
+    return stats.time(stage)
+
+
+def iter_counted_chunks(names_chunks, stats, counter, get_num=len):
+    """
+    Lazily count chunks of names.
+
+    :param names_chunks: iterator of `numpy` arrays of names.
+    :param stats: `GenerationStats` instance.
+    :param counter: name of the counter.
+    :param get_num: function which gets the increment of the counter from the chunk, number of names by default.
+    :return: iterator of chunks of names
+    """
+    for names_chunk in names_chunks:
+        stats.count(counter, get_num(names_chunk))
+        yield names_chunk
@@ -0,0 +1,98 @@
+"""
+Provide implementation of the memory-mapped binary file formats.
+
+Models, names indices and compiled seed data are binary files of the same layout:
+    - header: magic bytes, format version, fields of the format and `crc32` checksum of the rest of the file
+    - body: `numpy` arrays of the format
+
+The file is opened with `mmap`, so reading takes constant time regardless of the file size
+and the memory pages are shared read-only between processes. The file is written next to its path
+and atomically replaces it, so processes which have mapped the previous file keep reading it.
+"""
+import mmap
+import os
+import struct
+import zlib
+
+MAGIC_FORMAT = '8s'
+VERSION_FORMAT = 'H'
+CHECKSUM_FORMAT = 'I'
+
+
+class MappedFileFormat:
+    """
+    Implementation of the memory-mapped binary file format.
+
+    Format defines only its header fields, the magic bytes, the version and the checksum are written
+    and validated here, errors are raised as the `error` exception of the format.
+    """
+
+    def __init__(self, name, magic, version, fields_format, error, padding=0):
+        """
+        `MappedFileFormat` constructor.
+
+        :param name: name of the format in error messages.
+        :param magic: magic bytes of the format, 8 bytes.
+        :param version: version of the format.
+        :param fields_format: `struct` format of header fields between the version and the checksum.
+        :param error: exception class of the format, it is created with the error message.
+        :param padding: number of zero bytes after the checksum.
+        """
+        self.name = name
+        self.magic = magic
+        self.version = version
+        self.error = error
+        self.header_struct = struct.Struct(
+            f'<{MAGIC_FORMAT}{VERSION_FORMAT}{fields_format}{CHECKSUM_FORMAT}{padding}x',
+        )
+
+    @property
+    def header_size(self) -> int:
+        """
+        Get size of the header in bytes, the body starts at this offset.
+
+        :return: size of the header
+        """
+        return self.header_struct.size
+
+    def write(self, path, fields, body):
+        """
+        Write the file of the format.
+
+        :param path: path to the file.
+        :param fields: tuple of header fields of the format.
+        :param body: body of the file as bytes.
+        """
+        header = self.header_struct.pack(self.magic, self.version, *fields, zlib.crc32(body))
+
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'wb') as f:
+            f.write(header + body)
+
+        os.replace(temporary_path, path)
+
+    def read(self, path, verify_checksum=False) -> tuple:
+        """
+        Map the file of the format and validate its header.
+
+        :param path: path to the file.
+        :param verify_checksum: verify checksum of the body, it takes time proportional to the file size.
+        :return: tuple of header fields of the format and the read-only memory-mapped file
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.header_struct.size:
+                raise self.error(f'{self.name} header is invalid')
+
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, *fields, checksum = self.header_struct.unpack_from(data)
+        if magic != self.magic:
+            raise self.error(f'{self.name} header is invalid')
+
+        if version != self.version:
+            raise self.error(f'{self.name} version {version} is not supported')
+
+        if verify_checksum and zlib.crc32(memoryview(data)[self.header_struct.size:]) != checksum:
+            raise self.error(f'{self.name} does not match the checksum')
+
+        return tuple(fields), data
@@ -0,0 +1,73 @@
+"""
+Provide implementation of the `EOS` name encoding into `uint64` values.
+
+`EOS` name is the 64-bit integer, every character of the name is encoded by its index in the `EOS` name
+alphabet with 5 bits, the first character takes the highest bits, names shorter than 12 characters are padded
+with the `.` character (zero bits).
+"""
+import numpy as np
+
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    EOS_NAME_LENGTH,
+)
+
+SYMBOL_BITS = 5
+SYMBOLS_BY_BYTE = np.full(256, -1, dtype=np.int16)
+SYMBOLS_BY_BYTE[np.frombuffer(EOS_NAME_ALPHABET.encode(), dtype=np.uint8)] = np.arange(len(EOS_NAME_ALPHABET))
+SYMBOLS_BY_BYTE[0] = 0
+SYMBOLS_BYTES = np.frombuffer(EOS_NAME_ALPHABET.encode(), dtype=np.uint8)
+SYMBOLS_SHIFTS = np.array(
+    [64 - SYMBOL_BITS * (position + 1) for position in range(EOS_NAME_LENGTH)], dtype=np.uint64,
+)
+SYMBOL_MASK = np.uint64(len(EOS_NAME_ALPHABET) - 1)
+LAST_CHARACTER_MASK = np.uint64((1 << (64 - SYMBOL_BITS * EOS_NAME_LENGTH)) - 1)
+
+
+def encode_names(names) -> np.ndarray:
+    """
+    Encode names into `uint64` values.
+
+    :param names: sequence or `numpy` array of names as strings or bytes.
+    :return: `numpy` array of `uint64` values
+    """
+    names = np.asarray(names)
+    if not names.size:
+        return np.array([], dtype=np.uint64)
+
+    if names.dtype.kind == 'U':
+        names = np.char.encode(names, 'ascii')
+
+    if names.dtype.kind != 'S' or names.dtype.itemsize > EOS_NAME_LENGTH:
+        raise ValueError(f'Names must be strings or bytes of at most {EOS_NAME_LENGTH} characters.')
+
+    names = np.ascontiguousarray(names, dtype=f'S{EOS_NAME_LENGTH}').ravel()
+    symbols = SYMBOLS_BY_BYTE[names.view(np.uint8).reshape(-1, EOS_NAME_LENGTH)]
+
+    if (symbols < 0).any():
+        raise ValueError(f'Names must contain only `{EOS_NAME_ALPHABET}` characters.')
+
+    return np.bitwise_or.reduce(symbols.astype(np.uint64) << SYMBOLS_SHIFTS, axis=1)
+
+
+def decode_names(values) -> np.ndarray:
+    """
+    Decode `uint64` values into names.
+
+    Trailing `.` characters are the padding, so they are removed as in `EOS` names.
+
+    :param values: sequence or `numpy` array of `uint64` values.
+    :return: `numpy` array of names as bytes
+    """
+    values = np.asarray(values, dtype=np.uint64).ravel()
+    if (values & LAST_CHARACTER_MASK).any():
+        raise ValueError(f'Names of more than {EOS_NAME_LENGTH} characters are not supported.')
+
+    symbols = ((values[:, np.newaxis] >> SYMBOLS_SHIFTS) & SYMBOL_MASK).astype(np.intp)
+    names = SYMBOLS_BYTES[symbols]
+
+    names_lens = EOS_NAME_LENGTH - np.argmax(symbols[:, ::-1] != 0, axis=1)
+    names_lens[values == 0] = 0
+    names[np.arange(EOS_NAME_LENGTH) >= names_lens[:, np.newaxis]] = 0
+
+    return names.view(f'S{EOS_NAME_LENGTH}').ravel()
@@ -0,0 +1,481 @@
+"""
+Provide implementation of the indices of already generated and excluded names.
+
+Names are stored encoded into `uint64` values:
+    - `SortedNamesSet` is the exact set of names, 8 bytes per name, names could be added
+    - `SortedNamesArray` is the exact immutable set of names, which could be saved and memory-mapped
+    - `BloomFilter` is the probabilistic set of names with the bounded memory usage, new names are
+      rejected with the probability `error_rate`, but no name is accepted twice
+"""
+import math
+
+import numpy as np
+
+from eos_name_generator.constants import (
+    DATA_READER_CHUNK_SIZE,
+    EOS_NAME_LENGTH,
+    UNIQUE_NAMES_BLOOM_FILTER_ERROR_RATE,
+    UNIQUE_NAMES_EXACT_MAX_NUM,
+    UNIQUE_NAMES_MAX_FRUITLESS_REDRAWS,
+    UNIQUE_NAMES_MIN_REDRAW_NUM,
+)
+from eos_name_generator.errors import NamesIndexError
+from eos_name_generator.utils.generation_stats import time_stage
+from eos_name_generator.utils.name_encoding import encode_names
+from eos_name_generator.utils.names_index_data import (
+    BLOOM_FILTER_KIND,
+    SORTED_NAMES_KIND,
+    read_names_index,
+    write_names_index,
+)
+
+SPLITMIX64_INCREMENT = np.uint64(0x9E3779B97F4A7C15)
+SPLITMIX64_FIRST_MULTIPLIER = np.uint64(0xBF58476D1CE4E5B9)
+SPLITMIX64_SECOND_MULTIPLIER = np.uint64(0x94D049BB133111EB)
+SECOND_HASH_SEED = np.uint64(0x5851F42D4C957F2D)
+IS_WHITESPACE_BYTE = np.zeros(256, dtype=bool)
+IS_WHITESPACE_BYTE[np.frombuffer(b' \t\n\r\x0b\x0c', dtype=np.uint8)] = True
+
+
+class SortedNamesSet:
+    """
+    Implementation of the exact set of encoded names.
+
+    Names are stored as sorted runs like in the log-structured merge-tree: new names of every batch are
+    added as a new run, runs of similar size are merged, so there are `O(log n)` runs and membership
+    of the whole batch is checked with one `numpy.searchsorted` call per run.
+    """
+
+    def __init__(self):
+        """
+        `SortedNamesSet` constructor.
+        """
+        self.__runs = []
+
+    def __len__(self):
+        """
+        Get number of names in the set.
+
+        :return: number of names
+        """
+        return sum(len(run) for run in self.__runs)
+
+    def contains(self, names) -> np.ndarray:
+        """
+        Check if encoded names are in the set.
+
+        :param names: `numpy` array of `uint64` names.
+        :return: `numpy` array of booleans
+        """
+        names = np.asarray(names, dtype=np.uint64)
+        is_found = np.zeros(len(names), dtype=bool)
+
+        for run in self.__runs:
+            is_found |= _contains_sorted(run, names)
+
+        return is_found
+
+    def add(self, names):
+        """
+        Add encoded names which are not in the set yet.
+
+        :param names: `numpy` array of distinct `uint64` names, which are not in the set.
+        """
+        if len(names):
+            self.__add_run(np.sort(np.asarray(names, dtype=np.uint64)))
+
+    def __add_run(self, run):
+        """
+        Add sorted run of names and merge runs of similar size.
+
+        :param run: sorted `numpy` array of `uint64` names.
+        """
+        self.__runs.append(run)
+
+        while len(self.__runs) > 1 and len(self.__runs[-2]) <= 2 * len(self.__runs[-1]):
+            last_run = self.__runs.pop()
+            self.__runs[-1] = np.sort(np.concatenate([self.__runs[-1], last_run]))
+
+
+class SortedNamesArray:
+    """
+    Implementation of the exact immutable set of encoded names.
+
+    Names are stored as one sorted `uint64` array, membership of the whole batch is checked with
+    one `numpy.searchsorted` call. The saved array is memory-mapped by `load`, so the multi-million names
+    array is not read into memory and its pages are shared between processes.
+    """
+
+    def __init__(self, names):
+        """
+        `SortedNamesArray` constructor.
+
+        :param names: sorted `numpy` array of distinct `uint64` names.
+        """
+        self.names = names
+
+    @classmethod
+    def from_names(cls, names):
+        """
+        Create the set of names.
+
+        :param names: sequence or `numpy` array of names as strings or bytes.
+        :return: the set of names
+        """
+        return cls(names=np.unique(encode_names(names)))
+
+    @classmethod
+    def load(cls, index_path, verify_checksum=False):
+        """
+        Load the set of names from the names index file.
+
+        :param index_path: path to the index file.
+        :param verify_checksum: verify checksum of names, the whole file is read.
+        :return: the set of names
+        """
+        return load_names_index(index_path, verify_checksum=verify_checksum, kind=SORTED_NAMES_KIND)
+
+    def save(self, index_path):
+        """
+        Save the set of names to the names index file.
+
+        :param index_path: path to the index file.
+        """
+        write_names_index(index_path, kind=SORTED_NAMES_KIND, size=len(self.names), body=self.names)
+
+    def __len__(self):
+        """
+        Get number of names in the set.
+
+        :return: number of names
+        """
+        return len(self.names)
+
+    def contains(self, names) -> np.ndarray:
+        """
+        Check if encoded names are in the set.
+
+        :param names: `numpy` array of `uint64` names.
+        :return: `numpy` array of booleans
+        """
+        return _contains_sorted(self.names, np.asarray(names, dtype=np.uint64))
+
+
+class BloomFilter:
+    """
+    Implementation of the Bloom filter of encoded names.
+
+    Bit positions of a name are derived from two `splitmix64` hashes of the name with double hashing.
+
+    References:
+        - https://en.wikipedia.org/wiki/Bloom_filter
+    """
+
+    def __init__(self, bits_num, hashes_num, bits=None):
+        """
+        `BloomFilter` constructor.
+
+        :param bits_num: number of bits of the filter.
+        :param hashes_num: number of bits set per name.
+        :param bits: `numpy` array of filter bytes, empty filter is created if `None`.
+        """
+        self.bits_num = bits_num
+        self.hashes_num = hashes_num
+        self.bits = np.zeros(-(-bits_num // 8), dtype=np.uint8) if bits is None else bits
+
+    @classmethod
+    def for_capacity(cls, capacity, error_rate):
+        """
+        Create empty Bloom filter with the optimal size for the number of names and the false positive rate.
+
+        :param capacity: expected number of names.
+        :param error_rate: false positive rate when the filter contains `capacity` names.
+        :return: the Bloom filter
+        """
+        bits_num = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes_num = max(1, round(bits_num / max(capacity, 1) * math.log(2)))
+
+        return cls(bits_num=bits_num, hashes_num=hashes_num)
+
+    @classmethod
+    def from_names(cls, names, error_rate):
+        """
+        Create the Bloom filter of names with the optimal size for the number of names.
+
+        :param names: sequence or `numpy` array of names as strings or bytes.
+        :param error_rate: false positive rate of the filter.
+        :return: the Bloom filter
+        """
+        names = np.unique(encode_names(names))
+
+        bloom_filter = cls.for_capacity(capacity=len(names), error_rate=error_rate)
+        bloom_filter.add(names)
+
+        return bloom_filter
+
+    @classmethod
+    def load(cls, index_path, verify_checksum=False):
+        """
+        Load the read-only Bloom filter from the names index file.
+
+        :param index_path: path to the index file.
+        :param verify_checksum: verify checksum of filter bits, the whole file is read.
+        :return: the Bloom filter
+        """
+        return load_names_index(index_path, verify_checksum=verify_checksum, kind=BLOOM_FILTER_KIND)
+
+    def save(self, index_path):
+        """
+        Save the Bloom filter to the names index file.
+
+        :param index_path: path to the index file.
+        """
+        write_names_index(
+            index_path, kind=BLOOM_FILTER_KIND, size=self.bits_num, body=self.bits, hashes_num=self.hashes_num,
+        )
+
+    def contains(self, names) -> np.ndarray:
+        """
+        Check if encoded names are probably in the filter.
+
+        :param names: `numpy` array of `uint64` names.
+        :return: `numpy` array of booleans, `True` if the name is probably in the filter
+        """
+        positions = self.__get_positions(np.asarray(names, dtype=np.uint64))
+        is_set = (self.bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+
+        return is_set.all(axis=0).astype(bool)
+
+    def add(self, names):
+        """
+        Add encoded names to the filter.
+
+        :param names: `numpy` array of `uint64` names.
+        """
+        positions = self.__get_positions(np.asarray(names, dtype=np.uint64)).ravel()
+        np.bitwise_or.at(self.bits, positions >> 3, np.left_shift(1, positions & 7).astype(np.uint8))
+
+    def __get_positions(self, names) -> np.ndarray:
+        """
+        Get bit positions of names.
+
+        :param names: `numpy` array of `uint64` names.
+        :return: `numpy` matrix of bit positions of shape `(hashes_num, len(names))`
+        """
+        first_hashes = _splitmix64(names)
+        second_hashes = _splitmix64(names ^ SECOND_HASH_SEED) | np.uint64(1)
+        hashes_indices = np.arange(self.hashes_num, dtype=np.uint64)[:, np.newaxis]
+
+        return ((first_hashes + hashes_indices * second_hashes) % np.uint64(self.bits_num)).astype(np.intp)
+
+
+def create_unique_names_index(
+        num,
+        exact_names_max_num=UNIQUE_NAMES_EXACT_MAX_NUM,
+        bloom_filter_error_rate=UNIQUE_NAMES_BLOOM_FILTER_ERROR_RATE,
+):
+    """
+    Create index of generated names for the number of generated names.
+
+    :param num: number of generated names, `None` if names are generated infinitely.
+    :param exact_names_max_num: maximum number of names the exact set is used for.
+    :param bloom_filter_error_rate: false positive rate of the Bloom filter.
+    :return: `SortedNamesSet` or `BloomFilter` instance
+    """
+    if num is None or num <= exact_names_max_num:
+        return SortedNamesSet()
+
+    return BloomFilter.for_capacity(capacity=num, error_rate=bloom_filter_error_rate)
+
+
+def load_names_index(index_path, verify_checksum=False, kind=None):
+    """
+    Load the sorted names array or the read-only Bloom filter from the names index file.
+
+    :param index_path: path to the index file.
+    :param verify_checksum: verify checksum of the index body, the whole file is read.
+    :param kind: expected kind of the index, any kind is loaded if `None`.
+    :return: `SortedNamesArray` or `BloomFilter` instance
+    """
+    index_kind, size, hashes_num, body = read_names_index(index_path, verify_checksum=verify_checksum)
+    if kind is not None and index_kind != kind:
+        raise NamesIndexError('Names index kind does not match the expected kind')
+
+    if index_kind == SORTED_NAMES_KIND:
+        return SortedNamesArray(names=body)
+
+    return BloomFilter(bits_num=size, hashes_num=hashes_num, bits=body)
+
+
+def read_encoded_names(names_path, chunk_size=DATA_READER_CHUNK_SIZE) -> np.ndarray:
+    """
+    Read names separated by whitespaces from the names file and encode them into `uint64` values.
+
+    The file is read and encoded by chunks of `chunk_size` bytes of whole lines, so only encoded names
+    and one chunk of the file are kept in memory.
+
+    :param names_path: path to the names file.
+    :param chunk_size: size of the read data chunk in bytes.
+    :return: sorted `numpy` array of distinct `uint64` names
+    """
+    names_chunks = [np.array([], dtype=np.uint64)]
+
+    with open(names_path, 'rb') as f:
+        rest_data = b''
+
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            data = rest_data + chunk
+            last_line_break = data.rfind(b'\n')
+
+            if last_line_break == -1:
+                rest_data = data
+                continue
+
+            rest_data = data[last_line_break + 1:]
+            names_chunks.append(np.unique(_encode_names_data(data[:last_line_break + 1])))
+
+        if rest_data:
+            names_chunks.append(np.unique(_encode_names_data(rest_data)))
+
+    return np.unique(np.concatenate(names_chunks))
+
+
+def accept_names(names, unique_names_index=None, excluded_names=None, max_num=None) -> np.ndarray:
+    """
+    Accept encoded names which are not excluded and are not in the index of generated names yet.
+
+    Accepted names are added to the index of generated names.
+
+    :param names: `numpy` array of `uint64` names.
+    :param unique_names_index: index of generated names with `contains` and `add` methods, duplicates are
+        accepted if `None`.
+    :param excluded_names: index of excluded names with `contains` method, no names are excluded if `None`.
+    :param max_num: maximum number of accepted names, all names are accepted if `None`.
+    :return: `numpy` array of booleans, `True` for every accepted name
+    """
+    is_accepted = np.ones(len(names), dtype=bool)
+    if excluded_names is not None:
+        is_accepted = ~excluded_names.contains(names)
+
+    if unique_names_index is not None:
+        unique_names, first_indices = np.unique(names, return_index=True)
+        is_new = np.zeros(len(names), dtype=bool)
+        is_new[first_indices[~unique_names_index.contains(unique_names)]] = True
+        is_accepted &= is_new
+
+    accepted_names_indices = np.flatnonzero(is_accepted)[:max_num]
+    if unique_names_index is not None:
+        unique_names_index.add(names[accepted_names_indices])
+
+    is_accepted = np.zeros(len(names), dtype=bool)
+    is_accepted[accepted_names_indices] = True
+
+    return is_accepted
+
+
+def iter_filtered_names_chunks(
+        names_chunks,
+        generate_chunk,
+        unique_names_index=None,
+        excluded_names=None,
+        max_fruitless_redraws=UNIQUE_NAMES_MAX_FRUITLESS_REDRAWS,
+        min_redraw_num=UNIQUE_NAMES_MIN_REDRAW_NUM,
+        stats=None,
+):
+    """
+    Lazily remove already generated and excluded names from chunks of names and redraw them.
+
+    At least `min_redraw_num` names are redrawn at once and only the required number of accepted names is taken,
+    so the last missing names of a nearly exhausted names space do not take a redraw per name.
+
+    :param names_chunks: iterator of `numpy` arrays of names as bytes.
+    :param generate_chunk: function which generates `numpy` array of the given number of names as bytes.
+    :param unique_names_index: index of generated names with `contains` and `add` methods, duplicates are
+        kept if `None`.
+    :param excluded_names: index of excluded names with `contains` method, no names are excluded if `None`.
+    :param max_fruitless_redraws: maximum number of redraws in a row without accepted names.
+    :param min_redraw_num: minimum number of redrawn names.
+    :param stats: `GenerationStats` instance of redraws and the filtering time, stats are not recorded if `None`.
+    :return: iterator of `numpy` arrays of accepted names as bytes
+    """
+    for names_chunk in names_chunks:
+        accepted_names_parts = []
+        required_names_num = len(names_chunk)
+        fruitless_redraws_num = 0
+
+        while True:
+            with time_stage(stats, 'filtering'):
+                is_accepted = accept_names(
+                    encode_names(names_chunk),
+                    unique_names_index=unique_names_index,
+                    excluded_names=excluded_names,
+                    max_num=required_names_num,
+                )
+            accepted_names_parts.append(names_chunk[is_accepted])
+            required_names_num -= len(accepted_names_parts[-1])
+
+            if not required_names_num:
+                break
+
+            fruitless_redraws_num = 0 if len(accepted_names_parts[-1]) else fruitless_redraws_num + 1
+            if fruitless_redraws_num > max_fruitless_redraws:
+                raise ValueError('Unable to generate more names, the names space is exhausted.')
+
+            names_chunk = generate_chunk(max(required_names_num, min_redraw_num))
+            if stats is not None:
+                stats.count('redraws', len(names_chunk))
+
+        yield accepted_names_parts[0] if len(accepted_names_parts) == 1 else np.concatenate(accepted_names_parts)
+
+
+def _encode_names_data(data) -> np.ndarray:
+    """
+    Split data into names by whitespaces and encode them.
+
+    :param data: data bytes.
+    :return: `numpy` array of `uint64` names
+    """
+    data = np.frombuffer(data, dtype=np.uint8)
+    is_whitespace = IS_WHITESPACE_BYTE[data]
+    names_starts = np.flatnonzero(~is_whitespace & np.concatenate(([True], is_whitespace[:-1])))
+    names_ends = np.flatnonzero(~is_whitespace & np.concatenate((is_whitespace[1:], [True]))) + 1
+    names_lens = names_ends - names_starts
+
+    if (names_lens > EOS_NAME_LENGTH).any():
+        raise ValueError(f'Names must be strings or bytes of at most {EOS_NAME_LENGTH} characters.')
+
+    positions = np.arange(EOS_NAME_LENGTH)
+    is_name_byte = positions < names_lens[:, np.newaxis]
+    names = np.zeros((len(names_starts), EOS_NAME_LENGTH), dtype=np.uint8)
+    names[is_name_byte] = data[(names_starts[:, np.newaxis] + positions)[is_name_byte]]
+
+    return encode_names(names.view(f'S{EOS_NAME_LENGTH}').ravel())
+
+
+def _contains_sorted(sorted_names, names) -> np.ndarray:
+    """
+    Check if encoded names are in the sorted array of names.
+
+    :param sorted_names: sorted `numpy` array of `uint64` names.
+    :param names: `numpy` array of `uint64` names.
+    :return: `numpy` array of booleans
+    """
+    if not len(sorted_names):
+        return np.zeros(len(names), dtype=bool)
+
+    positions = np.minimum(np.searchsorted(sorted_names, names), len(sorted_names) - 1)
+    return sorted_names[positions] == names
+
+
+def _splitmix64(values) -> np.ndarray:
+    """
+    Hash `uint64` values with the `splitmix64` finalizer.
+
+    :param values: `numpy` array of `uint64` values.
+    :return: `numpy` array of `uint64` hashes
+    """
+    values = values + SPLITMIX64_INCREMENT
+    values = (values ^ (values >> np.uint64(30))) * SPLITMIX64_FIRST_MULTIPLIER
+    values = (values ^ (values >> np.uint64(27))) * SPLITMIX64_SECOND_MULTIPLIER
+
+    return values ^ (values >> np.uint64(31))
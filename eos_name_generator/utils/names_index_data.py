@@ -0,0 +1,71 @@
+"""
+Provide implementation of the names index file format.
+
+Names index file is a binary file with the sorted array of encoded names or the Bloom filter bits:
+    - header: magic bytes, format version, kind of the index, number of hashes of the Bloom filter,
+      size of the index (number of names or number of bits) and `crc32` checksum of the rest of the file
+    - body: `uint64` sorted names or `uint8` Bloom filter bits
+
+The file is memory-mapped by `MappedFileFormat`, so the index is shared by processes of the same host.
+"""
+import numpy as np
+
+from eos_name_generator.errors import NamesIndexError
+from eos_name_generator.utils.mapped_file import MappedFileFormat
+
+NAMES_INDEX_MAGIC = b'EOSNGNI\x00'
+NAMES_INDEX_VERSION = 1
+SORTED_NAMES_KIND = 0
+BLOOM_FILTER_KIND = 1
+BODY_DTYPES = {
+    SORTED_NAMES_KIND: np.dtype('<u8'),
+    BLOOM_FILTER_KIND: np.dtype(np.uint8),
+}
+
+NAMES_INDEX_FORMAT = MappedFileFormat(
+    name='Names index',
+    magic=NAMES_INDEX_MAGIC,
+    version=NAMES_INDEX_VERSION,
+    fields_format='HIQ',
+    error=NamesIndexError,
+    padding=4,
+)
+
+
+def write_names_index(index_path, kind, size, body, hashes_num=0):
+    """
+    Write the names index file.
+
+    :param index_path: path to the index file.
+    :param kind: kind of the index, `SORTED_NAMES_KIND` or `BLOOM_FILTER_KIND`.
+    :param size: number of names of the sorted names or number of bits of the Bloom filter.
+    :param body: `numpy` array of sorted names or Bloom filter bits.
+    :param hashes_num: number of hashes of the Bloom filter.
+    """
+    body = np.ascontiguousarray(body, dtype=BODY_DTYPES[kind]).tobytes()
+    NAMES_INDEX_FORMAT.write(index_path, fields=(kind, hashes_num, size), body=body)
+
+
+def read_names_index(index_path, verify_checksum=False) -> tuple:
+    """
+    Read the names index file.
+
+    The body is the read-only view of the memory-mapped file, nothing is copied.
+
+    :param index_path: path to the index file.
+    :param verify_checksum: verify `crc32` checksum of the body of the index.
+    :return: tuple of the kind, the size, the number of hashes and the body of the index
+    """
+    (kind, hashes_num, size), index_data = NAMES_INDEX_FORMAT.read(index_path, verify_checksum=verify_checksum)
+    if kind not in BODY_DTYPES:
+        raise NamesIndexError('Names index header is invalid')
+
+    body_len = size if kind == SORTED_NAMES_KIND else -(-size // 8)
+    if len(index_data) != NAMES_INDEX_FORMAT.header_size + body_len * BODY_DTYPES[kind].itemsize:
+        raise NamesIndexError('Names index size does not match the header')
+
+    body = np.frombuffer(
+        index_data, dtype=BODY_DTYPES[kind], count=body_len, offset=NAMES_INDEX_FORMAT.header_size,
+    )
+
+    return kind, size, hashes_num, body
@@ -0,0 +1,73 @@
+"""
+Provide implementation of the parallel names generation with a process pool.
+"""
+import multiprocessing
+from collections import deque
+
+import numpy as np
+
+from eos_name_generator.constants import EOS_NAME_LENGTH
+
+_worker_generator = None
+
+
+def init_worker(generator_class, generator_kwargs):
+    """
+    Create the name generator once per worker process.
+
+    :param generator_class: name generator class.
+    :param generator_kwargs: name generator constructor arguments.
+    """
+    global _worker_generator
+    _worker_generator = generator_class(**generator_kwargs)
+
+
+def generate_names_chunk(random_provider, num) -> bytes:
+    """
+    Generate chunk of names in the worker process with its own random provider.
+
+    :param random_provider: random provider instance spawned for the chunk.
+    :param num: number of generated names.
+    :return: names packed into bytes, every name takes `EOS_NAME_LENGTH` bytes
+    """
+    _worker_generator.random_provider = random_provider
+    names_chunk = next(_worker_generator.iter_names(num=num, chunk_size=num, as_chunks=True))
+
+    return names_chunk.tobytes()
+
+
+def iter_parallel_names_chunks(generator_class, generator_kwargs, random_provider, num, chunk_size, workers):
+    """
+    Lazily generate chunks of names with a process pool.
+
+    Every chunk is generated with a child random provider spawned from `random_provider`, so the result
+    depends on the random provider seed and `chunk_size` only, but not on the number of workers.
+    The number of chunks in progress is limited, so the memory usage does not depend on `num`.
+
+    :param generator_class: name generator class.
+    :param generator_kwargs: name generator constructor arguments.
+    :param random_provider: random provider instance with `spawn` method.
+    :param num: number of generated names, names are generated infinitely if `num` is `None`.
+    :param chunk_size: number of names in a chunk.
+    :param workers: number of worker processes.
+    :return: iterator of `numpy` arrays of names as bytes
+    """
+    max_pending_chunks = 2 * workers
+    pending_chunks = deque()
+    scheduled_names_num = 0
+
+    with multiprocessing.Pool(
+            processes=workers, initializer=init_worker, initargs=(generator_class, generator_kwargs),
+    ) as pool:
+        while pending_chunks or num is None or scheduled_names_num < num:
+            while len(pending_chunks) < max_pending_chunks and (num is None or scheduled_names_num < num):
+                names_chunk_size = chunk_size if num is None else min(chunk_size, num - scheduled_names_num)
+                chunk_random_provider, = random_provider.spawn(1)
+
+                pending_chunks.append(
+                    pool.apply_async(generate_names_chunk, (chunk_random_provider, names_chunk_size)),
+                )
+                scheduled_names_num += names_chunk_size
+
+            names_chunk = pending_chunks.popleft().get()
+            yield np.frombuffer(names_chunk, dtype=f'S{EOS_NAME_LENGTH}')
@@ -21,6 +21,7 @@ setup(
     author_email='ember.toon@protonmail.com',
     packages=find_packages(),
     install_requires=requirements,
+    python_requires='>=3.6',
     entry_points={
         'console_scripts': [
             'eos-name-generator = cli.entrypoint:cli',
@@ -32,8 +33,6 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
 
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
@@ -1,6 +1,7 @@
 """
 Provide tests for command line interface's generate names list command.
 """
+import json
 from os.path import dirname
 
 from click.testing import CliRunner
@@ -175,3 +176,130 @@ def test_generate_names_list_with_invalid_custom_seed_data_path():
     print(result.output)
     assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
     assert expected_error in result.output
+
+
+def test_generate_names_list_with_workers():
+    """
+    Case: generate random eos list of names with worker processes.
+    Expect: eos names are returned.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        NUMBER_OF_GENERATED_NAMES,
+        '--workers',
+        2,
+    ])
+    random_names = result.output.splitlines()
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert NUMBER_OF_GENERATED_NAMES == len(random_names)
+
+    for name in random_names:
+        assert len(name) == EOS_NAME_LENGTH
+
+
+def test_generate_names_list_with_invalid_workers():
+    """
+    Case: generate random eos list of names with invalid number of workers.
+    Expect: workers must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        NUMBER_OF_GENERATED_NAMES,
+        '--workers',
+        0,
+    ])
+
+    expected_error = {
+        "workers": [
+            "Workers must be greater than 0.",
+        ],
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_generate_names_list_unique():
+    """
+    Case: generate random eos list of unique names.
+    Expect: eos names without duplicates are returned.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        NUMBER_OF_GENERATED_NAMES,
+        '--unique',
+    ])
+    random_names = result.output.splitlines()
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert NUMBER_OF_GENERATED_NAMES == len(set(random_names))
+
+
+def test_generate_names_list_with_stats():
+    """
+    Case: generate random eos list of names with stats.
+    Expect: eos names are printed to the standard output, stats are printed to the standard error.
+    """
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        NUMBER_OF_GENERATED_NAMES,
+        '--stats',
+    ])
+    stats = json.loads(result.stderr)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert NUMBER_OF_GENERATED_NAMES == len(result.stdout.splitlines())
+    assert NUMBER_OF_GENERATED_NAMES == stats['counters']['draws']
+    assert NUMBER_OF_GENERATED_NAMES * EOS_NAME_LENGTH == stats['counters']['bytes_emitted']
+
+
+def test_generate_names_list_unique_with_exhausted_names_space(tmp_path):
+    """
+    Case: generate random eos list of more unique names than the names space without excluded names holds.
+    Expect: names space is exhausted error message.
+    """
+    seed_data_path = tmp_path / 'data.txt'
+    seed_data_path.write_text('abcdefghijkl\nmnopqrstuvwx\n')
+    names_path = tmp_path / 'accounts.txt'
+    names_path.write_text('abcdefghijkl\n')
+    index_path = str(tmp_path / 'accounts.index')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'names_index',
+        'compile',
+        '--names-path',
+        str(names_path),
+        '--index-path',
+        index_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        2,
+        '--unique',
+        '--seed-data-path',
+        str(seed_data_path),
+        '--exclude-path',
+        index_path,
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'Unable to generate more names, the names space is exhausted.' in result.output
@@ -0,0 +1,73 @@
+"""
+Provide tests for command line interface's fit Markov chain command.
+"""
+from os.path import dirname
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from eos_name_generator.markov_chain_generator.model import MarkovChainModel
+
+
+def test_fit_markov_chain(tmp_path):
+    """
+    Case: fit Markov chain model on custom seed data and update it with the same seed data.
+    Expect: path to the model is returned, counts of the updated model are doubled.
+    """
+    data_path = dirname(__file__) + '/' + '../custom_data/data.txt'
+    model_path = str(tmp_path / 'model.bin')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'markov_chain',
+        'fit',
+        '--seed-data-path',
+        data_path,
+        '--order',
+        2,
+        '--model-path',
+        model_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert model_path == result.output.splitlines()[0]
+
+    transitions_counts = MarkovChainModel.load(model_path).transitions_counts.copy()
+
+    result = runner.invoke(cli, [
+        'markov_chain',
+        'fit',
+        '--seed-data-path',
+        data_path,
+        '--model-path',
+        model_path,
+        '--update',
+    ])
+    model = MarkovChainModel.load(model_path)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 2 == model.order
+    assert (transitions_counts * 2 == model.transitions_counts).all()
+
+
+def test_fit_markov_chain_with_invalid_order(tmp_path):
+    """
+    Case: fit Markov chain model with the order out of the supported range.
+    Expect: order must be between 1 and 3 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'markov_chain',
+        'fit',
+        '--order',
+        4,
+        '--model-path',
+        str(tmp_path / 'model.bin'),
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'Order must be between 1 and 3.' in result.output
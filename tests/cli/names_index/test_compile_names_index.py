@@ -0,0 +1,124 @@
+"""
+Provide tests for command line interface's compile names index command.
+"""
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import dict_to_pretty_json
+
+
+def test_compile_names_index(tmp_path):
+    """
+    Case: compile names index and generate names excluding the names of the index.
+    Expect: path to the names index is returned, excluded names are not generated.
+    """
+    seed_data_path = tmp_path / 'data.txt'
+    seed_data_path.write_text('abcdefghijkl\nmnopqrstuvwx\n')
+    names_path = tmp_path / 'accounts.txt'
+    names_path.write_text('eosio\nabcdefghijkl\n')
+    index_path = str(tmp_path / 'accounts.index')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'names_index',
+        'compile',
+        '--names-path',
+        str(names_path),
+        '--index-path',
+        index_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert index_path == result.output.splitlines()[0]
+
+    result = runner.invoke(cli, [
+        'generate',
+        'names_list',
+        '--num',
+        10,
+        '--seed-data-path',
+        str(seed_data_path),
+        '--exclude-path',
+        index_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert ['mnopqrstuvwx'] * 10 == result.output.splitlines()
+
+
+def test_compile_names_index_bloom_filter(tmp_path):
+    """
+    Case: compile names index as the Bloom filter.
+    Expect: path to the names index is returned.
+    """
+    names_path = tmp_path / 'accounts.txt'
+    names_path.write_text('eosio\neosio.token\n')
+    index_path = str(tmp_path / 'accounts.index')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'names_index',
+        'compile',
+        '--names-path',
+        str(names_path),
+        '--index-path',
+        index_path,
+        '--bloom-filter-error-rate',
+        0.01,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert index_path == result.output.splitlines()[0]
+
+
+def test_compile_names_index_with_invalid_names(tmp_path):
+    """
+    Case: compile names index of names which contain characters out of the `EOS` name alphabet.
+    Expect: names must contain only `EOS` name alphabet characters error message.
+    """
+    names_path = tmp_path / 'accounts.txt'
+    names_path.write_text('eosio\nEOSIO\n')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'names_index',
+        'compile',
+        '--names-path',
+        str(names_path),
+        '--index-path',
+        str(tmp_path / 'accounts.index'),
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'Names must contain only' in result.output
+
+
+def test_compile_names_index_with_invalid_bloom_filter_error_rate(tmp_path):
+    """
+    Case: compile names index as the Bloom filter with invalid false positive rate.
+    Expect: Bloom filter error rate must be between 0 and 1 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'names_index',
+        'compile',
+        '--names-path',
+        str(tmp_path / 'accounts.txt'),
+        '--index-path',
+        str(tmp_path / 'accounts.index'),
+        '--bloom-filter-error-rate',
+        2.0,
+    ])
+
+    expected_error = {
+        'bloom_filter_error_rate': [
+            'Bloom filter error rate must be between 0 and 1.',
+        ],
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
@@ -0,0 +1,98 @@
+"""
+Provide tests for command line interface's names server commands.
+"""
+import signal
+import subprocess
+import sys
+from os.path import (
+    abspath,
+    dirname,
+    exists,
+)
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import dict_to_pretty_json
+from eos_name_generator.constants import EOS_NAME_LENGTH
+
+PROJECT_PATH = dirname(dirname(dirname(dirname(abspath(__file__)))))
+SERVE_TIMEOUT = 30
+
+
+def test_serve_and_request_names(tmp_path):
+    """
+    Case: serve names over the Unix domain socket in the new process and request names by the client command.
+    Expect: requested names are returned, the socket is removed when the server is terminated.
+    """
+    socket_path = str(tmp_path / 'names.sock')
+    serve_process = subprocess.Popen(
+        [sys.executable, '-c', 'from cli.entrypoint import cli; cli()', 'serve', '--socket-path', socket_path],
+        cwd=PROJECT_PATH,
+        stdout=subprocess.PIPE,
+    )
+
+    try:
+        assert socket_path == serve_process.stdout.readline().decode().strip()
+
+        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'client',
+            '--socket-path',
+            socket_path,
+            '--num',
+            5,
+        ])
+
+    finally:
+        serve_process.send_signal(signal.SIGTERM)
+        serve_process.communicate(timeout=SERVE_TIMEOUT)
+
+    names = result.output.splitlines()
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 5 == len(names)
+    assert all(EOS_NAME_LENGTH == len(name) for name in names)
+    assert not exists(socket_path)
+
+
+def test_request_names_without_server(tmp_path):
+    """
+    Case: request names from the Unix domain socket no server is listening on.
+    Expect: no such file or directory error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'client',
+        '--socket-path',
+        str(tmp_path / 'names.sock'),
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'No such file or directory' in result.output
+
+
+def test_serve_with_invalid_port():
+    """
+    Case: serve names on the port out of the range of ports.
+    Expect: port must be between 0 and 65535 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'serve',
+        '--port',
+        70000,
+    ])
+
+    expected_error = {
+        'port': [
+            'Port must be between 0 and 65535.',
+        ],
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
@@ -0,0 +1,70 @@
+"""
+Provide tests for command line interface's train recurrent neural network command.
+"""
+from os.path import dirname
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from eos_name_generator.rnn_generator.model import GRUModel
+
+
+def test_train_rnn(tmp_path):
+    """
+    Case: train recurrent neural network model on custom seed data.
+    Expect: training reports and path to the weights are returned.
+    """
+    data_path = dirname(__file__) + '/' + '../custom_data/data.txt'
+    weights_path = str(tmp_path / 'weights.npz')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'rnn',
+        'train',
+        '--seed-data-path',
+        data_path,
+        '--weights-path',
+        weights_path,
+        '--checkpoint-path',
+        str(tmp_path / 'checkpoint.npz'),
+        '--steps',
+        3,
+        '--hidden-size',
+        8,
+        '--batch-size',
+        2,
+        '--sequence-len',
+        4,
+        '--seed',
+        1,
+    ])
+    output_lines = result.output.splitlines()
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert output_lines[0].startswith('step 3, loss ')
+    assert 'tokens/sec, max memory' in output_lines[0]
+    assert weights_path == output_lines[1]
+    assert 8 == GRUModel.load(weights_path).hidden_size
+
+
+def test_train_rnn_with_invalid_steps(tmp_path):
+    """
+    Case: train recurrent neural network model with not positive number of steps.
+    Expect: steps must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'rnn',
+        'train',
+        '--weights-path',
+        str(tmp_path / 'weights.npz'),
+        '--steps',
+        0,
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'Steps must be greater than 0.' in result.output
@@ -0,0 +1,67 @@
+"""
+Provide tests for command line interface's compile seed data command.
+"""
+from os.path import dirname
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from eos_name_generator.constants import EOS_NAME_LENGTH
+
+
+def test_compile_seed_data(tmp_path):
+    """
+    Case: compile custom seed data and generate name based on the compiled seed data.
+    Expect: path to the compiled seed data is returned, eos name is returned.
+    """
+    data_path = dirname(__file__) + '/' + '../custom_data/data.txt'
+    compiled_data_path = str(tmp_path / 'data.bin')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'compile',
+        '--seed-data-path',
+        data_path,
+        '--compiled-data-path',
+        compiled_data_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert compiled_data_path == result.output.splitlines()[0]
+
+    result = runner.invoke(cli, [
+        'generate',
+        'name',
+        '--seed-data-path',
+        compiled_data_path,
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert EOS_NAME_LENGTH == len(result.output.splitlines()[0])
+
+
+def test_compile_invalid_seed_data(tmp_path):
+    """
+    Case: compile invalid custom seed data.
+    Expect: data contains invalid characters or does not match the name length error message.
+    """
+    invalid_data_path = dirname(__file__) + '/' + '../custom_data/invalid_data.txt'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'compile',
+        '--seed-data-path',
+        invalid_data_path,
+        '--compiled-data-path',
+        str(tmp_path / 'data.bin'),
+    ])
+    expected_error = 'Data contains invalid characters or does not match the name length error'
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert expected_error in result.output
@@ -0,0 +1,100 @@
+"""
+Provide tests for command line interface's seed data capacity command.
+"""
+import json
+from os.path import dirname
+
+from click.testing import CliRunner
+
+from cli.constants import (
+    FAILED_EXIT_FROM_COMMAND_CODE,
+    PASSED_EXIT_FROM_COMMAND_CODE,
+)
+from cli.entrypoint import cli
+from cli.utils import dict_to_pretty_json
+
+
+def test_seed_data_capacity(tmp_path):
+    """
+    Case: estimate capacity of custom seed data for several numbers of generated names.
+    Expect: size of the names space and expected numbers of duplicates are returned.
+    """
+    seed_data_path = tmp_path / 'data.txt'
+    seed_data_path.write_text('abcdefghijkl\nmnopqrstuvwx\n')
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'capacity',
+        '--seed-data-path',
+        str(seed_data_path),
+        '--num',
+        1,
+        '--num',
+        2,
+    ])
+    capacity = json.loads(result.output)
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 2 == capacity['names_space_size_upper_bound']
+    assert [1, 2] == [expected_duplicates['num'] for expected_duplicates in capacity['expected_duplicates']]
+    assert 0.25 == capacity['expected_duplicates'][1]['expected_duplicates_rate']
+
+
+def test_default_seed_data_capacity():
+    """
+    Case: estimate capacity of the default seed data.
+    Expect: size of the names space is returned.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'capacity',
+    ])
+
+    assert PASSED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert json.loads(result.output)['names_space_size_upper_bound'] > 10 ** 9
+
+
+def test_seed_data_capacity_with_invalid_num():
+    """
+    Case: estimate capacity of seed data for invalid number of generated names.
+    Expect: num must be greater than 0 error message.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'capacity',
+        '--num',
+        0,
+    ])
+
+    expected_error = {
+        'nums': {
+            '0': [
+                'Num must be greater than 0.',
+            ],
+        },
+    }
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert dict_to_pretty_json(expected_error) in result.output
+
+
+def test_seed_data_capacity_with_non_existing_seed_data():
+    """
+    Case: estimate capacity of non-existing seed data.
+    Expect: no such file or directory error message.
+    """
+    data_path = dirname(__file__) + '/' + 'non_existing_data.txt'
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        'seed_data',
+        'capacity',
+        '--seed-data-path',
+        data_path,
+    ])
+
+    assert FAILED_EXIT_FROM_COMMAND_CODE == result.exit_code
+    assert 'No such file or directory' in result.output
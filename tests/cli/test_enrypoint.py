@@ -1,8 +1,20 @@
 """
 Provide tests for implementation of the entrypoint commands.
 """
+import subprocess
+import sys
+import time
+from os.path import (
+    abspath,
+    dirname,
+)
+
 from cli.entrypoint import cli
 
+PROJECT_PATH = dirname(dirname(dirname(abspath(__file__))))
+START_TIME_BUDGET = 0.4
+START_TIME_ATTEMPTS_NUM = 3
+
 
 def test_name():
     """
@@ -10,3 +22,46 @@ def test_name():
     Expect: the name is the same as in setup.py (`cli`).
     """
     assert 'cli' == cli.name
+
+
+def run_cli_in_new_interpreter(code):
+    """
+    Run the code in the new interpreter from the project directory and get the time of the run.
+
+    :param code: Python code.
+    :return: tuple of the standard output and the time of the run in seconds
+    """
+    start_time = time.perf_counter()
+    completed_process = subprocess.run(
+        [sys.executable, '-c', code], cwd=PROJECT_PATH, check=True, stdout=subprocess.PIPE,
+    )
+
+    return completed_process.stdout.decode(), time.perf_counter() - start_time
+
+
+def test_start_does_not_import_heavy_modules():
+    """
+    Case: start the command line interface and print help in the new interpreter.
+    Expect: `numpy` and `marshmallow` are not imported, random providers are not created.
+    """
+    output, _ = run_cli_in_new_interpreter(
+        'import sys\n'
+        'from cli.entrypoint import cli\n'
+        'cli(["--help"], standalone_mode=False)\n'
+        'print(sorted(set(sys.modules) & {"numpy", "marshmallow"}))\n',
+    )
+
+    assert output.endswith('[]\n')
+
+
+def test_start_time():
+    """
+    Case: print help of the command line interface in the new interpreter several times.
+    Expect: the fastest start fits into the start time budget.
+    """
+    start_times = [
+        run_cli_in_new_interpreter('from cli.entrypoint import cli\ncli(["--help"], standalone_mode=False)')[1]
+        for _ in range(START_TIME_ATTEMPTS_NUM)
+    ]
+
+    assert min(start_times) < START_TIME_BUDGET
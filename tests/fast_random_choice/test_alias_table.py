@@ -0,0 +1,57 @@
+"""
+Provide tests for AliasTable.
+"""
+import numpy as np
+
+from eos_name_generator.utils import (
+    AliasTable,
+    FastRandomChoice,
+)
+
+
+def test_draw_many_distribution():
+    """
+    Case: draw a lot of indices from the alias table.
+    Expect: indices are distributed according to the probabilities.
+    """
+    accuracy = 0.01
+    draws_number = 100_000
+    probabilities = [0.1, 0.2, 0.0, 0.3, 0.4]
+
+    alias_table = AliasTable(probabilities=probabilities)
+    indices = alias_table.draw_many(np.random.random_sample(draws_number))
+    frequencies = np.bincount(indices, minlength=len(probabilities)) / draws_number
+
+    assert len(probabilities) == len(alias_table)
+    assert np.all(np.abs(frequencies - probabilities) < accuracy)
+
+
+def test_draw_distribution():
+    """
+    Case: draw indices from the alias table one by one.
+    Expect: indices are distributed according to the probabilities, zero probability index is never drawn.
+    """
+    accuracy = 0.02
+    draws_number = 20_000
+    probabilities = [0.5, 0.0, 0.25, 0.25]
+
+    alias_table = AliasTable(probabilities=probabilities)
+    indices = [alias_table.draw(random_float) for random_float in np.random.random_sample(draws_number)]
+    frequencies = np.bincount(indices, minlength=len(probabilities)) / draws_number
+
+    assert 0 == frequencies[1]
+    assert np.all(np.abs(frequencies - probabilities) < accuracy)
+
+
+def test_fast_random_choice_caches_alias_tables():
+    """
+    Case: choose elements with the same probabilities several times.
+    Expect: alias table is built once.
+    """
+    fast_random = FastRandomChoice()
+
+    for _ in range(10):
+        fast_random.choice(seq=[True, False], p=[0.9, 0.1])
+        fast_random.choice(seq=[True, False], p=[0.9, 0.1], size=10)
+
+    assert 1 == len(fast_random._alias_tables)
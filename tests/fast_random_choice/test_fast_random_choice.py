@@ -1,11 +1,16 @@
 """
 Provide tests for FastRandomChoice.
 """
+import pickle
 import random
 
+import numpy
 import pytest
 
-from eos_name_generator.utils import FastRandomChoice
+from eos_name_generator.utils import (
+    FastRandomChoice,
+    get_random_provider_instance,
+)
 
 
 def test_random_choice():
@@ -167,3 +172,133 @@ def test_random_choice_with_invalid_probability_sum():
 
     with pytest.raises(ValueError):
         fast_random.choice(seq=numbers, p=numbers_probabilities)
+
+
+def test_random_choice_with_size():
+    """
+    Case: test random choice of a batch of elements.
+    Expect: `numpy` array of elements from sequence is returned.
+    """
+    numbers = [1, 2, 3, 4]
+    numbers_probabilities = [0.25, 0.25, 0.5, 0]
+    size = 1_000
+
+    fast_random = FastRandomChoice()
+    random_numbers = fast_random.choice(seq=numbers, p=numbers_probabilities, size=size)
+
+    assert size == len(random_numbers)
+    assert set(random_numbers) <= {1, 2, 3}
+
+
+def test_prepare():
+    """
+    Case: prepare random choice and draw elements from it.
+    Expect: elements from sequence are returned.
+    """
+    numbers = [1, 2, 3, 4]
+    numbers_probabilities = [0.25, 0.25, 0.5, 0]
+    size = 1_000
+
+    fast_random = FastRandomChoice()
+    prepared_choice = fast_random.prepare(seq=numbers, p=numbers_probabilities)
+    random_numbers = prepared_choice.draw_many(size)
+
+    assert prepared_choice.draw() in {1, 2, 3}
+    assert size == len(random_numbers)
+    assert set(random_numbers) <= {1, 2, 3}
+
+
+def test_prepare_with_invalid_probabilities():
+    """
+    Case: prepare random choice with empty sequence, different lengths and negative probabilities.
+    Expect: the same errors as random choice raises.
+    """
+    fast_random = FastRandomChoice()
+
+    with pytest.raises(IndexError):
+        fast_random.prepare(seq=[], p=[])
+
+    with pytest.raises(ValueError):
+        fast_random.prepare(seq=[1, 2], p=[1])
+
+    with pytest.raises(ValueError):
+        fast_random.prepare(seq=[1, 2], p=[2, -1])
+
+
+def test_random_choice_with_seed():
+    """
+    Case: choose elements with two random providers with the same seed.
+    Expect: the same elements are returned both for single and batch draws.
+    """
+    numbers = list(range(100))
+    numbers_probabilities = [1 / 100] * 100
+
+    fast_random = FastRandomChoice(1)
+    same_seed_fast_random = FastRandomChoice(1)
+
+    random_number = fast_random.choice(seq=numbers, p=numbers_probabilities)
+    random_numbers = fast_random.choice(seq=numbers, p=numbers_probabilities, size=100)
+
+    assert random_number == same_seed_fast_random.choice(seq=numbers, p=numbers_probabilities)
+    assert list(random_numbers) == list(same_seed_fast_random.choice(seq=numbers, p=numbers_probabilities, size=100))
+
+
+def test_multidimensional_shifting_with_seed():
+    """
+    Case: get indices by multidimensional shifting with two random providers with the same seed.
+    Expect: the same indices are returned both for single and batch draws, global `numpy` random state is not used.
+    """
+    probabilities = [0.1, 0.2, 0.3, 0.4]
+
+    fast_random = FastRandomChoice(1)
+    same_seed_fast_random = FastRandomChoice(1)
+
+    index = fast_random.multidimensional_shifting(probabilities=probabilities)
+    indices = fast_random.multidimensional_shifting(probabilities=probabilities, num_samples=100)
+
+    numpy.random.seed(2)
+
+    assert index == same_seed_fast_random.multidimensional_shifting(probabilities=probabilities)
+    assert indices.tolist() == same_seed_fast_random.multidimensional_shifting(
+        probabilities=probabilities, num_samples=100,
+    ).tolist()
+
+
+def test_spawn():
+    """
+    Case: spawn child random providers from random providers with the same seed.
+    Expect: children are reproducible and produce different random streams.
+    """
+    children = FastRandomChoice(1).spawn(2)
+    same_seed_children = FastRandomChoice(1).spawn(2)
+
+    first_child_stream = list(children[0].random_sample(10))
+
+    assert 2 == len(children)
+    assert first_child_stream == list(same_seed_children[0].random_sample(10))
+    assert first_child_stream != list(children[1].random_sample(10))
+
+
+def test_pickle_random_provider():
+    """
+    Case: pickle and unpickle random provider.
+    Expect: unpickled random provider continues the same random stream.
+    """
+    fast_random = FastRandomChoice(1)
+    fast_random.random_sample(10)
+
+    unpickled_fast_random = pickle.loads(pickle.dumps(fast_random))
+
+    assert list(fast_random.random_sample(10)) == list(unpickled_fast_random.random_sample(10))
+    assert fast_random.random() == unpickled_fast_random.random()
+
+
+def test_get_random_provider_instance():
+    """
+    Case: get the default random provider instance twice.
+    Expect: the same `FastRandomChoice` instance is returned.
+    """
+    random_provider = get_random_provider_instance()
+
+    assert isinstance(random_provider, FastRandomChoice)
+    assert random_provider is get_random_provider_instance()
@@ -0,0 +1,193 @@
+"""
+Provide tests for MarkovChainNameGenerator.
+"""
+from itertools import islice
+
+import pytest
+
+from eos_name_generator import MarkovChainNameGenerator
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    EOS_NAME_LENGTH,
+)
+from eos_name_generator.utils import (
+    FastRandomChoice,
+    GenerationStats,
+)
+from eos_name_generator.utils.names_index import SortedNamesArray
+
+
+def test_generate():
+    """
+    Case: generate `EOS` name with the Markov chain.
+    Expect: name of the `EOS` name alphabet letters is returned.
+    """
+    name_generator = MarkovChainNameGenerator()
+    name = name_generator.generate()
+
+    assert isinstance(name, str)
+    assert EOS_NAME_LENGTH == len(name)
+    assert set(name) <= set(EOS_NAME_ALPHABET[6:])
+
+
+def test_generate_list():
+    """
+    Case: generate list of `EOS` names with the Markov chain.
+    Expect: list of names of the `EOS` name alphabet letters is returned.
+    """
+    name_generator = MarkovChainNameGenerator()
+    names = name_generator.generate_list(num=100_000)
+
+    assert 100_000 == len(names)
+    assert {EOS_NAME_LENGTH} == set(map(len, names))
+    assert set(''.join(names)) <= set(EOS_NAME_ALPHABET[6:])
+    assert 100_000 * 0.1 > len(names) - len(set(names))
+
+
+def test_generate_with_single_word(tmp_path):
+    """
+    Case: generate `EOS` name with the Markov chain fitted on the single word.
+    Expect: name is the repeated word.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('abc\n')
+    name_generator = MarkovChainNameGenerator(seed_data_path=str(data_path), order=2)
+
+    assert ['abcabcabcabc'] * 3 == name_generator.generate_list(num=3)
+
+
+def test_generate_with_empty_seed_data(tmp_path):
+    """
+    Case: create the Markov chain name generator with the empty seed data file.
+    Expect: unable to fit the Markov chain model error message.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('')
+
+    with pytest.raises(ValueError) as error:
+        MarkovChainNameGenerator(seed_data_path=str(data_path))
+
+    assert 'Unable to fit the Markov chain model, there are no words to fit on.' == str(error.value)
+
+
+def test_generate_with_seeded_random_provider():
+    """
+    Case: generate `EOS` names twice with the random providers with the same seed.
+    Expect: the same names are returned.
+    """
+    first_names = MarkovChainNameGenerator(random_provider_instance=FastRandomChoice(1)).generate_list(num=1000)
+    second_names = MarkovChainNameGenerator(random_provider_instance=FastRandomChoice(1)).generate_list(num=1000)
+
+    assert first_names == second_names
+
+
+def test_iter_names():
+    """
+    Case: lazily generate `EOS` names with the Markov chain.
+    Expect: names and chunks of names are yielded.
+    """
+    name_generator = MarkovChainNameGenerator()
+    names = list(name_generator.iter_names(num=10, chunk_size=3))
+    names_chunks = list(name_generator.iter_names(num=10, chunk_size=3, as_chunks=True))
+
+    assert 10 == len(names)
+    assert {EOS_NAME_LENGTH} == set(map(len, names))
+    assert [3, 3, 3, 1] == [len(names_chunk) for names_chunk in names_chunks]
+    assert 5 == len(list(islice(name_generator.iter_names(), 5)))
+
+
+@pytest.mark.parametrize('order', [0, 4])
+def test_set_invalid_order(order):
+    """
+    Case: set the order of the Markov chain out of the supported range.
+    Expect: the order of the Markov chain must be between 1 and 3 error message.
+    """
+    name_generator = MarkovChainNameGenerator()
+
+    with pytest.raises(ValueError) as error:
+        name_generator.order = order
+
+    assert 'The order of the Markov chain must be between 1 and 3.' == str(error.value)
+
+
+def test_set_invalid_random_provider():
+    """
+    Case: set the random provider without `random_sample` method.
+    Expect: the interface `random_provider` does not contain random_sample method error message.
+    """
+    with pytest.raises(AttributeError) as error:
+        MarkovChainNameGenerator(random_provider_instance=object())
+
+    assert 'The interface `random_provider` does not contain random_sample method.' == str(error.value)
+
+
+def test_generate_with_saved_model(tmp_path):
+    """
+    Case: generate `EOS` names with the saved Markov chain model.
+    Expect: the saved model is loaded, the same names as with the fitted model are returned.
+    """
+    model_path = str(tmp_path / 'model.bin')
+    name_generator = MarkovChainNameGenerator(order=2, random_provider_instance=FastRandomChoice(1))
+    name_generator.model.save(model_path)
+
+    loaded_name_generator = MarkovChainNameGenerator(
+        order=1, random_provider_instance=FastRandomChoice(1), model_path=model_path,
+    )
+
+    assert 2 == loaded_name_generator.order
+    assert name_generator.generate_list(num=100) == loaded_name_generator.generate_list(num=100)
+
+
+def test_generate_list_unique_and_exclude():
+    """
+    Case: generate list of unique `EOS` names excluding names of the names index.
+    Expect: names are not duplicated and excluded names are not generated.
+    """
+    name_generator = MarkovChainNameGenerator(random_provider_instance=FastRandomChoice(0))
+    excluded_names = name_generator.generate_list(num=500)
+
+    names = name_generator.generate_list(num=2000, unique=True, exclude=SortedNamesArray.from_names(excluded_names))
+
+    assert 2000 == len(set(names))
+    assert not set(excluded_names) & set(names)
+
+
+def test_generate_list_with_stats():
+    """
+    Case: generate list of `EOS` names with the Markov chain with stats.
+    Expect: names are counted as draws, bytes of names are counted, stages of the generation are timed.
+    """
+    stats = GenerationStats()
+    names = MarkovChainNameGenerator(stats=stats).generate_list(num=1000)
+
+    assert 1000 == stats.counters['draws']
+    assert 0 == stats.counters['base_words']
+    assert sum(len(name) for name in names) == stats.counters['bytes_emitted']
+    assert stats.timings['sampling'] > 0
+    assert stats.timings['lookup'] > 0
+    assert stats.timings['string_building'] > 0
+
+
+def test_generate_list_exclude_with_stats():
+    """
+    Case: generate list of `EOS` names of the Markov chain excluding names drawn with the same seed with stats.
+    Expect: excluded names are redrawn and counted as draws, bytes of accepted names only are counted.
+    """
+    excluded_names = MarkovChainNameGenerator(random_provider_instance=FastRandomChoice(0)).generate_list(num=100)
+    stats = GenerationStats()
+    name_generator = MarkovChainNameGenerator(random_provider_instance=FastRandomChoice(0), stats=stats)
+    names = name_generator.generate_list(num=100, exclude=SortedNamesArray.from_names(excluded_names))
+
+    assert stats.counters['redraws'] >= 100
+    assert 100 + stats.counters['redraws'] == stats.counters['draws']
+    assert EOS_NAME_LENGTH * len(names) == stats.counters['bytes_emitted']
+    assert stats.timings['filtering'] > 0
+
+
+def test_generate_with_invalid_stats():
+    """
+    Case: create the Markov chain name generator with stats object which does not contain count method.
+    Expect: the interface `stats` does not contain count method error message.
+    """
+    with pytest.raises(AttributeError):
+        MarkovChainNameGenerator(stats={})
@@ -0,0 +1,151 @@
+"""
+Provide tests for MarkovChainModel.
+"""
+import numpy
+import pytest
+
+from eos_name_generator.errors import MarkovChainModelError
+from eos_name_generator.markov_chain_generator.model import MarkovChainModel
+
+
+def test_fit():
+    """
+    Case: fit the first order Markov chain model on words.
+    Expect: transitions are counted from the start of a word to the end of a word.
+    """
+    model = MarkovChainModel(order=1).fit({2: numpy.array([b'ab', b'ac'], dtype='S2'), 1: [b'a']})
+    start, end, a, b, c = 0, 0, 6, 7, 8
+
+    assert 3 == model.transitions_counts[start, a]
+    assert 1 == model.transitions_counts[a, b]
+    assert 1 == model.transitions_counts[a, c]
+    assert 1 == model.transitions_counts[a, end]
+    assert 1 == model.transitions_counts[b, end]
+    assert 8 == model.transitions_counts.sum()
+
+    model.fit({2: [b'ab']})
+
+    assert 2 == model.transitions_counts[a, b]
+    assert 11 == model.transitions_counts.sum()
+
+
+def test_draw_next_symbols():
+    """
+    Case: draw next symbols of the fitted model.
+    Expect: symbols are drawn according to cumulative probabilities, unknown states end the word.
+    """
+    model = MarkovChainModel(order=1).fit({2: [b'ab', b'ac', b'ac'], 1: [b'a']})
+    a = 6
+    states = numpy.array([a, a, a, a, 31])
+    random_floats = numpy.array([0.0, 0.25, 0.5, 0.99, 0.5])
+
+    assert [0, 7, 8, 8, 0] == model.draw_next_symbols(states, random_floats).tolist()
+
+
+def test_draw_next_symbols_frequencies():
+    """
+    Case: draw many next symbols of the start state.
+    Expect: frequencies of symbols match probabilities.
+    """
+    model = MarkovChainModel(order=2).fit({1: [b'a', b'b', b'b', b'c']})
+    random_floats = numpy.random.default_rng(1).random(100_000)
+    symbols = model.draw_next_symbols(numpy.zeros(100_000, dtype=numpy.intp), random_floats)
+
+    assert [0.25, 0.5, 0.25] == pytest.approx(numpy.bincount(symbols, minlength=9)[6:9] / 100_000, abs=0.01)
+
+
+def test_get_next_states():
+    """
+    Case: get next states of the second order Markov chain model.
+    Expect: the last two symbols are kept, the end of word returns to the start state.
+    """
+    model = MarkovChainModel(order=2)
+    states = model.get_states(numpy.array([[6, 7], [6, 7]]))
+    next_states = model.get_next_states(states, numpy.array([8, 0]))
+
+    assert [7 * 32 + 8, 0] == next_states.tolist()
+
+
+def test_create_model_with_invalid_order():
+    """
+    Case: create the Markov chain model with the order out of the supported range.
+    Expect: the order of the Markov chain must be between 1 and 3 error message.
+    """
+    with pytest.raises(ValueError) as error:
+        MarkovChainModel(order=4)
+
+    assert 'The order of the Markov chain must be between 1 and 3.' == str(error.value)
+
+
+def test_save_and_load(tmp_path):
+    """
+    Case: save the fitted model and load it.
+    Expect: loaded model has the same tables as read-only views of the model file.
+    """
+    model_path = str(tmp_path / 'model.bin')
+    model = MarkovChainModel(order=2).fit({4: [b'mime', b'jail'], 7: [b'torques']})
+    model.save(model_path)
+
+    loaded_model = MarkovChainModel.load(model_path, verify_checksum=True)
+
+    assert 2 == loaded_model.order
+    assert numpy.array_equal(model.transitions_counts, loaded_model.transitions_counts)
+    assert numpy.array_equal(model.cumulative_probabilities, loaded_model.cumulative_probabilities)
+    assert not loaded_model.transitions_counts.flags.writeable
+    assert not loaded_model.cumulative_probabilities.flags.writeable
+
+
+def test_update_saved_model(tmp_path):
+    """
+    Case: fit the loaded model on new words and save it to the same file.
+    Expect: the model has the same tables as the model fitted on all words at once.
+    """
+    model_path = str(tmp_path / 'model.bin')
+    MarkovChainModel(order=1).fit({4: [b'mime', b'jail']}).save(model_path)
+
+    loaded_model = MarkovChainModel.load(model_path)
+    loaded_model.fit({7: [b'torques']}).save(model_path)
+
+    updated_model = MarkovChainModel.load(model_path)
+    model = MarkovChainModel(order=1).fit({4: [b'mime', b'jail'], 7: [b'torques']})
+
+    assert numpy.array_equal(model.transitions_counts, updated_model.transitions_counts)
+    assert numpy.array_equal(model.cumulative_probabilities, updated_model.cumulative_probabilities)
+
+
+def test_load_invalid_model(tmp_path):
+    """
+    Case: load the model from the file with invalid header or damaged tables.
+    Expect: Markov chain model header is invalid and does not match the checksum error messages.
+    """
+    model_path = tmp_path / 'model.bin'
+    model_path.write_bytes(b'mime\njail\n')
+
+    with pytest.raises(MarkovChainModelError) as error:
+        MarkovChainModel.load(str(model_path))
+
+    assert 'Markov chain model header is invalid' == error.value.message
+
+    MarkovChainModel(order=1).fit({4: [b'mime']}).save(str(model_path))
+    model_data = bytearray(model_path.read_bytes())
+    model_data[-1] ^= 0xff
+    model_path.write_bytes(bytes(model_data))
+
+    with pytest.raises(MarkovChainModelError) as error:
+        MarkovChainModel.load(str(model_path), verify_checksum=True)
+
+    assert 'Markov chain model does not match the checksum' == error.value.message
+
+
+def test_load_not_fitted_model(tmp_path):
+    """
+    Case: load the saved model which is not fitted on any word.
+    Expect: Markov chain model is not fitted on any word error message.
+    """
+    model_path = str(tmp_path / 'model.bin')
+    MarkovChainModel(order=3).save(model_path)
+
+    with pytest.raises(MarkovChainModelError) as error:
+        MarkovChainModel.load(model_path)
+
+    assert 'Markov chain model is not fitted on any word' == error.value.message
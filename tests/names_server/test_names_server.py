@@ -0,0 +1,243 @@
+"""
+Provide tests for NamesServer and NamesClient.
+"""
+import socket
+import threading
+
+import pytest
+
+from eos_name_generator import RandomNameGenerator
+from eos_name_generator.constants import (
+    EOS_NAME_LENGTH,
+    NAMES_SERVER_MAX_NAMES_NUM,
+)
+from eos_name_generator.errors import NamesServerError
+from eos_name_generator.names_server import (
+    NamesClient,
+    NamesServer,
+)
+from eos_name_generator.names_server.protocol import MAX_REQUEST_LEN
+from eos_name_generator.utils import FastRandomChoice
+
+
+@pytest.fixture(scope='module')
+def generator():
+    """
+    Get the random generator shared by servers of tests.
+    """
+    return RandomNameGenerator(random_provider_instance=FastRandomChoice(0))
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """
+    Get path to the Unix domain socket.
+    """
+    return str(tmp_path / 'names.sock')
+
+
+@pytest.fixture
+def serve():
+    """
+    Get function which serves requests of the server in the thread until the end of the test.
+    """
+    names_servers = []
+
+    def serve_names_server(names_server):
+        names_servers.append((names_server, threading.Thread(target=names_server.serve_forever)))
+        names_servers[-1][1].start()
+
+        return names_server
+
+    yield serve_names_server
+
+    for names_server, serve_thread in names_servers:
+        names_server.shutdown()
+        serve_thread.join()
+        names_server.close()
+
+
+def test_generate_over_unix_socket(generator, socket_path, serve):
+    """
+    Case: request names from the server over the Unix domain socket.
+    Expect: `EOS` name and list of `EOS` names are returned.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+
+    with NamesClient(socket_path=socket_path) as names_client:
+        names_client.ping()
+        name = names_client.generate()
+        names = names_client.generate_list(100)
+
+    assert EOS_NAME_LENGTH == len(name)
+    assert 100 == len(names)
+    assert all(EOS_NAME_LENGTH == len(name) for name in names)
+
+
+def test_generate_over_tcp_socket(generator, serve):
+    """
+    Case: request names from the server over the TCP socket of the port chosen by the system.
+    Expect: list of `EOS` names is returned.
+    """
+    names_server = serve(NamesServer(generator=generator, port=0))
+    host, port = names_server.address
+
+    with NamesClient(host=host, port=port) as names_client:
+        names = names_client.generate_list(10)
+
+    assert 10 == len(names)
+
+
+def test_generate_list_over_max_names_num(generator, socket_path, serve):
+    """
+    Case: request more names than the server responds to one request.
+    Expect: names are requested by several requests, all names are returned.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+
+    with NamesClient(socket_path=socket_path) as names_client:
+        names = names_client.generate_list(NAMES_SERVER_MAX_NAMES_NUM + 10)
+
+    assert NAMES_SERVER_MAX_NAMES_NUM + 10 == len(names)
+
+
+def test_concurrent_clients(generator, socket_path, serve):
+    """
+    Case: request names from the server by several clients at once.
+    Expect: every client gets all requested names.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+    names_nums = []
+
+    def request_names():
+        with NamesClient(socket_path=socket_path) as names_client:
+            names_nums.append(sum(len(names_client.generate_list(50)) for _ in range(20)))
+
+    clients_threads = [threading.Thread(target=request_names) for _ in range(8)]
+    for client_thread in clients_threads:
+        client_thread.start()
+
+    for client_thread in clients_threads:
+        client_thread.join()
+
+    assert [1000] * 8 == names_nums
+
+
+@pytest.mark.parametrize('request_line', [b'', b'names', b'names 0', b'names -1', b'names many', b'name 1', b'hello'])
+def test_invalid_request(generator, request_line):
+    """
+    Case: get the response to the invalid request line.
+    Expect: the error response is returned.
+    """
+    with NamesServer(generator=generator, port=0) as names_server:
+        response = names_server.get_response(request_line + b'\n')
+
+    assert response.startswith(b'ERROR ')
+    assert response.endswith(b'\n')
+
+
+def test_invalid_request_over_socket(generator, socket_path, serve):
+    """
+    Case: send the invalid request line and the valid one over the same connection.
+    Expect: the error response and the names response are returned.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.connect(socket_path)
+        with client_socket.makefile('rwb') as client_file:
+            client_file.write(f'names {NAMES_SERVER_MAX_NAMES_NUM + 1}\nnames 2\n'.encode())
+            client_file.flush()
+
+            error_response = client_file.readline()
+            names_response = client_file.readline()
+
+    assert f'ERROR Num must be between 1 and {NAMES_SERVER_MAX_NAMES_NUM}.\n'.encode() == error_response
+    assert 3 == len(names_response.split())
+    assert names_response.startswith(b'OK ')
+
+
+def test_too_long_request_over_socket(generator, socket_path, serve):
+    """
+    Case: send the request line longer than the maximum request length and the valid one over the same connection.
+    Expect: the single error response to the long line and the ping response are returned.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.connect(socket_path)
+        with client_socket.makefile('rwb') as client_file:
+            client_file.write(b'names ' + b'1' * 4 * MAX_REQUEST_LEN + b'\nping\n')
+            client_file.flush()
+
+            error_response = client_file.readline()
+            ping_response = client_file.readline()
+
+    assert f'ERROR Request is longer than {MAX_REQUEST_LEN} bytes.\n'.encode() == error_response
+    assert b'OK\n' == ping_response
+
+
+def test_client_error_response(socket_path):
+    """
+    Case: request names from the server which responds with the error.
+    Expect: NamesServerError with the message of the server is raised.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind(socket_path)
+        server_socket.listen()
+
+        with NamesClient(socket_path=socket_path) as names_client:
+            connection, _ = server_socket.accept()
+            connection.sendall(b'ERROR Names are over.\n')
+
+            with pytest.raises(NamesServerError) as error:
+                names_client.generate()
+
+            connection.close()
+
+    assert 'Names are over.' == error.value.message
+
+
+def test_server_without_address(generator, socket_path):
+    """
+    Case: create the server without the socket path and the port or with both.
+    Expect: ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        NamesServer(generator=generator)
+
+    with pytest.raises(ValueError):
+        NamesServer(generator=generator, socket_path=socket_path, port=0)
+
+
+def test_server_removes_stale_socket(generator, socket_path):
+    """
+    Case: create the server on the socket file left by the stopped server, close the server.
+    Expect: the stale socket file is replaced, the socket file is removed on close.
+    """
+    stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale_socket.bind(socket_path)
+    stale_socket.close()
+
+    with NamesServer(generator=generator, socket_path=socket_path) as names_server:
+        assert socket_path == names_server.address
+
+    with pytest.raises(FileNotFoundError):
+        NamesClient(socket_path=socket_path)
+
+
+def test_server_on_socket_in_use(generator, socket_path, serve):
+    """
+    Case: create the server on the socket of the running server or on the regular file.
+    Expect: NamesServerError is raised.
+    """
+    serve(NamesServer(generator=generator, socket_path=socket_path))
+
+    with pytest.raises(NamesServerError):
+        NamesServer(generator=generator, socket_path=socket_path)
+
+    with open(socket_path + '.txt', 'w'):
+        pass
+
+    with pytest.raises(NamesServerError):
+        NamesServer(generator=generator, socket_path=socket_path + '.txt')
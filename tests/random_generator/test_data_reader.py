@@ -3,9 +3,14 @@ Provide tests for DataReader.
 """
 from os.path import dirname
 
+import numpy
 import pytest
 
-from eos_name_generator.errors import ValidationDataError
+from eos_name_generator.errors import (
+    CompiledDataError,
+    ValidationDataError,
+)
+from eos_name_generator.random_generator.compiled_data import read_compiled_data
 from eos_name_generator.random_generator.data_reader import DataReader
 
 
@@ -41,3 +46,238 @@ def test_get_dictionary_by_word_len_with_non_existing_data_path():
     data_reader = DataReader(data_path='')
     with pytest.raises(FileNotFoundError):
         data_reader.get_dictionary_by_word_len()
+
+
+def test_get_dictionary_by_word_len_is_compact():
+    """
+    Case: get dictionary by word length.
+    Expect: words of each length are stored in `numpy` array of fixed-width bytes sorted by the word length.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+
+    with open(custom_data_path) as f:
+        words = f.read().splitlines()
+
+    data_reader = DataReader(data_path=custom_data_path)
+    base_dict = data_reader.get_dictionary_by_word_len()
+
+    assert sorted(base_dict) == list(base_dict)
+    assert len(words) == sum(len(base_words) for base_words in base_dict.values())
+
+    for word_len, base_words in base_dict.items():
+        assert numpy.dtype(f'S{word_len}') == base_words.dtype
+        assert sorted(word.encode() for word in words if len(word) == word_len) == sorted(base_words.tolist())
+
+
+def test_get_dictionary_by_word_len_from_compiled_data(tmp_path):
+    """
+    Case: compile custom data and get dictionary by word length from the compiled data.
+    Expect: the same dictionary as from the text data is returned.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    compiled_data_path = str(tmp_path / 'data.bin')
+
+    data_reader = DataReader(data_path=custom_data_path)
+    data_reader.compile(compiled_data_path=compiled_data_path)
+
+    base_dict = data_reader.get_dictionary_by_word_len()
+    compiled_base_dict = DataReader(data_path=compiled_data_path).get_dictionary_by_word_len()
+
+    assert list(base_dict) == list(compiled_base_dict)
+
+    for word_len, base_words in base_dict.items():
+        assert base_words.tolist() == compiled_base_dict[word_len].tolist()
+
+
+def test_read_compiled_data_with_invalid_checksum(tmp_path):
+    """
+    Case: read compiled data with corrupted words.
+    Expect: compiled data does not match the checksum error message.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    compiled_data_path = tmp_path / 'data.bin'
+    DataReader(data_path=custom_data_path).compile(compiled_data_path=str(compiled_data_path))
+
+    compiled_data = bytearray(compiled_data_path.read_bytes())
+    compiled_data[-1] ^= 0xFF
+    compiled_data_path.write_bytes(bytes(compiled_data))
+
+    probabilities = read_compiled_data(str(compiled_data_path))[1]
+    assert 1 == pytest.approx(sum(probabilities.values()))
+
+    with pytest.raises(CompiledDataError):
+        read_compiled_data(str(compiled_data_path), verify_checksum=True)
+
+
+def test_compile_over_mapped_compiled_data(tmp_path):
+    """
+    Case: compile data onto the path of the compiled data which is read and memory-mapped.
+    Expect: the mapped words are not changed, the new compiled data is read from the path.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'mime\njail\n')
+    compiled_data_path = str(tmp_path / 'data.bin')
+    DataReader(data_path=str(data_path), seed_data_cache=None).compile(compiled_data_path)
+
+    base_dict, _ = read_compiled_data(compiled_data_path)
+
+    data_path.write_bytes(b'abc\n')
+    DataReader(data_path=str(data_path), seed_data_cache=None).compile(compiled_data_path)
+
+    assert [b'mime', b'jail'] == base_dict[4].tolist()
+    assert {3: [b'abc']} == {
+        word_len: words.tolist() for word_len, words in read_compiled_data(compiled_data_path)[0].items()
+    }
+
+
+def test_read_truncated_compiled_data(tmp_path):
+    """
+    Case: read compiled data truncated in the buckets table and in words.
+    Expect: compiled data buckets table and words are truncated error messages.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    compiled_data_path = tmp_path / 'data.bin'
+    DataReader(data_path=custom_data_path).compile(compiled_data_path=str(compiled_data_path))
+    compiled_data = compiled_data_path.read_bytes()
+
+    compiled_data_path.write_bytes(compiled_data[:20])
+
+    with pytest.raises(CompiledDataError) as error:
+        read_compiled_data(str(compiled_data_path))
+
+    assert 'Compiled data buckets table is truncated' == error.value.message
+
+    compiled_data_path.write_bytes(compiled_data[:-8])
+
+    with pytest.raises(CompiledDataError) as error:
+        read_compiled_data(str(compiled_data_path))
+
+    assert 'is truncated' in error.value.message
+
+
+def test_get_dictionary_by_word_len_reports_all_invalid_lines(tmp_path):
+    """
+    Case: get dictionary by word len with several invalid words.
+    Expect: data contains invalid characters or does not match the name length error with all invalid lines.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'mime\nJail\n\ntorques\nabcdefghijklm\nwor1d\nword\rword\n' + 'blessé\n'.encode())
+    data_reader = DataReader(data_path=str(data_path))
+
+    with pytest.raises(ValidationDataError) as error:
+        data_reader.get_dictionary_by_word_len()
+
+    assert [2, 3, 5, 6, 7, 8] == error.value.invalid_lines
+    assert 'on lines: 2, 3, 5, 6, 7, 8' in str(error.value)
+
+
+def test_get_dictionary_by_word_len_with_skip_invalid(tmp_path):
+    """
+    Case: get dictionary by word len with invalid words and windows line breaks in skip invalid mode.
+    Expect: dictionary of the valid words is returned.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'mime\r\nJail\r\ntorques\r\nwor1d\r\njail')
+    data_reader = DataReader(data_path=str(data_path), skip_invalid=True)
+    base_dict = data_reader.get_dictionary_by_word_len()
+
+    assert [b'mime', b'jail'] == base_dict[4].tolist()
+    assert [b'torques'] == base_dict[7].tolist()
+    assert [4, 7] == list(base_dict)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64])
+def test_get_dictionary_by_word_len_by_chunks(chunk_size):
+    """
+    Case: get dictionary by word len reading seed data by small chunks.
+    Expect: the same dictionary and probabilities as reading seed data at once are returned.
+    """
+    data_path = dirname(__file__) + '/custom_data/data.txt'
+    data_reader = DataReader(data_path=data_path, seed_data_cache=None)
+    chunks_data_reader = DataReader(data_path=data_path, seed_data_cache=None, chunk_size=chunk_size)
+
+    base_dict = data_reader.get_dictionary_by_word_len()
+    chunks_base_dict = chunks_data_reader.get_dictionary_by_word_len()
+
+    assert list(base_dict) == list(chunks_base_dict)
+    for word_len, words in base_dict.items():
+        assert words.tolist() == chunks_base_dict[word_len].tolist()
+
+    assert data_reader.get_probabilities_by_word_len() == chunks_data_reader.get_probabilities_by_word_len()
+
+
+def test_get_dictionary_by_word_len_by_chunks_reports_all_invalid_lines(tmp_path):
+    """
+    Case: get dictionary by word len with several invalid words reading seed data by small chunks.
+    Expect: data contains invalid characters or does not match the name length error with all invalid lines.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'mime\nJail\n\ntorques\nabcdefghijklm\nwor1d\nword\rword\njail')
+    data_reader = DataReader(data_path=str(data_path), chunk_size=3)
+
+    with pytest.raises(ValidationDataError) as error:
+        data_reader.get_dictionary_by_word_len()
+
+    assert [2, 3, 5, 6, 7] == error.value.invalid_lines
+
+
+def test_get_dictionary_by_word_len_with_reservoir(tmp_path):
+    """
+    Case: get dictionary by word len with reservoir size less than number of words of the same length.
+    Expect: uniform sample of words is kept, probabilities are based on all words.
+    """
+    words = [f'{first}{second}'.encode() for first in 'abcdefghij' for second in 'abcdefghij']
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'\n'.join(words + [b'mime', b'jail']))
+
+    words_counts = dict.fromkeys(words, 0)
+    for reservoir_seed in range(200):
+        data_reader = DataReader(
+            data_path=str(data_path), chunk_size=16, reservoir_size=10, reservoir_seed=reservoir_seed,
+        )
+        base_dict = data_reader.get_dictionary_by_word_len()
+
+        assert 10 == len(set(base_dict[2].tolist()))
+        assert [b'mime', b'jail'] == base_dict[4].tolist()
+        assert {2: 100 / 102, 4: 2 / 102} == data_reader.get_probabilities_by_word_len()
+
+        for word in base_dict[2].tolist():
+            words_counts[word] += 1
+
+    assert 5 < min(words_counts.values())
+    assert 40 > max(words_counts.values())
+
+
+def test_compile_with_reservoir(tmp_path):
+    """
+    Case: compile data with reservoir size less than number of words of the same length.
+    Expect: compiled data has the reservoir sample of words and probabilities based on all words.
+    """
+    words = [f'{first}{second}'.encode() for first in 'abcdefghij' for second in 'abcdefghij']
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'\n'.join(words + [b'mime', b'jail']))
+    compiled_data_path = str(tmp_path / 'data.bin')
+
+    DataReader(data_path=str(data_path), reservoir_size=10, reservoir_seed=1).compile(compiled_data_path)
+    base_dict, probabilities = read_compiled_data(compiled_data_path, verify_checksum=True)
+
+    assert 10 == len(base_dict[2])
+    assert {2: 100 / 102, 4: 2 / 102} == probabilities
+
+
+def test_get_dictionary_by_word_len_with_seeded_reservoir_is_reproducible(tmp_path):
+    """
+    Case: get dictionary by word len twice with the same reservoir seed.
+    Expect: the same sample of words is returned.
+    """
+    data_path = dirname(__file__) + '/custom_data/data.txt'
+
+    first_base_dict = DataReader(
+        data_path=data_path, seed_data_cache=None, reservoir_size=2, reservoir_seed=1,
+    ).get_dictionary_by_word_len()
+    second_base_dict = DataReader(
+        data_path=data_path, seed_data_cache=None, reservoir_size=2, reservoir_seed=1,
+    ).get_dictionary_by_word_len()
+
+    assert {word_len: words.tolist() for word_len, words in first_base_dict.items()} == \
+        {word_len: words.tolist() for word_len, words in second_base_dict.items()}
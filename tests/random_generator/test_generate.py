@@ -1,6 +1,7 @@
 """
 Provide tests for RandomNameGenerator.
 """
+from itertools import islice
 from os.path import dirname
 
 import numpy
@@ -9,6 +10,12 @@ import pytest
 from eos_name_generator import RandomNameGenerator
 from eos_name_generator.constants import EOS_NAME_LENGTH
 from eos_name_generator.errors import ValidationDataError
+from eos_name_generator.utils import (
+    FastRandomChoice,
+    GenerationStats,
+    decode_names,
+)
+from eos_name_generator.utils.names_index import SortedNamesArray
 
 
 def test_generate():
@@ -29,7 +36,7 @@ def test_sustainability_of_algorithm():
     Expect: name is returned.
     """
     number_of_test = 1_000_00
-    accuracy = 0.01
+    accuracy = 0.1
     name_generator = RandomNameGenerator()
     generated_names = name_generator.generate_list(num=number_of_test)
 
@@ -166,3 +173,328 @@ def test_generate_with_non_existing_numbers_probabilities():
 
     with pytest.raises(TypeError):
         RandomNameGenerator(numbers_probabilities=non_existing_numbers_probabilities)
+
+
+def test_generate_list_has_same_distribution_as_generate():
+    """
+    Case: generate names consisted of the base word and numbers with `generate` and `generate_list`.
+    Expect: base word lengths of names have the same distribution.
+    """
+    number_of_names = 20_000
+    accuracy = 0.02
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+
+    name_generator = RandomNameGenerator(seed_data_path=custom_data_path, numbers_probabilities=1)
+    names = [name_generator.generate() for _ in range(number_of_names)]
+    batch_names = name_generator.generate_list(num=number_of_names)
+
+    for word_len in range(1, EOS_NAME_LENGTH + 1):
+        frequency = sum(len(name.rstrip('12345')) == word_len for name in names) / number_of_names
+        batch_frequency = sum(len(name.rstrip('12345')) == word_len for name in batch_names) / number_of_names
+
+        assert abs(frequency - batch_frequency) < accuracy
+
+
+def test_generate_list_consists_of_seed_words():
+    """
+    Case: generate batch of names without numbers.
+    Expect: every name is the single word or the base word followed by the additional word or numbers.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+
+    with open(custom_data_path) as f:
+        words = set(f.read().splitlines())
+
+    name_generator = RandomNameGenerator(seed_data_path=custom_data_path, numbers_probabilities=0)
+    names = name_generator.generate_list(num=10_000)
+
+    for name in names:
+        base_word = name.rstrip('12345')
+        is_single_word_name = name in words
+        is_numbers_name = base_word != name and base_word in words
+        is_alphabet_name = any(
+            name[:index] in words and name[index:] in words for index in range(1, EOS_NAME_LENGTH)
+        )
+
+        assert is_single_word_name or is_numbers_name or is_alphabet_name
+
+
+def test_generate_list_with_seeded_random_provider():
+    """
+    Case: generate names with random providers with the same seed.
+    Expect: the same names are returned.
+    """
+    name_generator = RandomNameGenerator(random_provider_instance=FastRandomChoice(1))
+    same_seed_name_generator = RandomNameGenerator(random_provider_instance=FastRandomChoice(1))
+
+    assert name_generator.generate() == same_seed_name_generator.generate()
+    assert name_generator.generate_list(num=100) == same_seed_name_generator.generate_list(num=100)
+
+
+def test_iter_names():
+    """
+    Case: lazily generate names by chunks smaller than the number of names.
+    Expect: names are returned one by one.
+    """
+    number_of_names = 1_000
+    name_generator = RandomNameGenerator()
+    names = list(name_generator.iter_names(num=number_of_names, chunk_size=300))
+
+    assert number_of_names == len(names)
+
+    for name in names:
+        assert EOS_NAME_LENGTH == len(name)
+        assert isinstance(name, str)
+
+
+def test_iter_names_as_chunks():
+    """
+    Case: lazily generate chunks of names.
+    Expect: `numpy` arrays of names are returned, the last chunk contains the rest of the names.
+    """
+    name_generator = RandomNameGenerator()
+    names_chunks = list(name_generator.iter_names(num=1_000, chunk_size=300, as_chunks=True))
+
+    assert [300, 300, 300, 100] == [len(names_chunk) for names_chunk in names_chunks]
+    assert numpy.dtype(f'S{EOS_NAME_LENGTH}') == names_chunks[0].dtype
+
+
+def test_iter_names_infinitely():
+    """
+    Case: lazily generate names without number of names.
+    Expect: names are generated while they are consumed.
+    """
+    name_generator = RandomNameGenerator()
+    names = list(islice(name_generator.iter_names(chunk_size=10), 25))
+
+    assert 25 == len(names)
+
+
+def test_iter_names_with_invalid_chunk_size():
+    """
+    Case: lazily generate names with not positive chunk size.
+    Expect: the chunk size must be greater than 0 error message.
+    """
+    name_generator = RandomNameGenerator()
+
+    with pytest.raises(ValueError):
+        name_generator.iter_names(chunk_size=0)
+
+
+def test_generate_list_with_workers():
+    """
+    Case: generate names with different number of worker processes and random providers with the same seed.
+    Expect: the same names are returned.
+    """
+    number_of_names = 1_000
+    name_generator = RandomNameGenerator(random_provider_instance=FastRandomChoice(1))
+    same_seed_name_generator = RandomNameGenerator(random_provider_instance=FastRandomChoice(1))
+
+    names = name_generator.generate_list(num=number_of_names, workers=2)
+
+    assert number_of_names == len(names)
+    assert names == same_seed_name_generator.generate_list(num=number_of_names, workers=1)
+
+    for name in names:
+        assert EOS_NAME_LENGTH == len(name)
+
+
+def test_generate_list_with_invalid_workers():
+    """
+    Case: generate names with not positive number of workers and with random provider without `spawn` method.
+    Expect: the number of workers must be greater than 0 and the interface `random_provider` does not contain
+        spawn method error messages.
+    """
+    with pytest.raises(ValueError):
+        RandomNameGenerator().generate_list(num=10, workers=0)
+
+    with pytest.raises(AttributeError):
+        RandomNameGenerator(random_provider_instance=numpy.random).generate_list(num=10, workers=2)
+
+
+def test_generate_list_unique():
+    """
+    Case: generate list of unique `EOS` names.
+    Expect: list does not contain duplicates.
+    """
+    names = RandomNameGenerator().generate_list(num=200_000, unique=True)
+
+    assert 200_000 == len(names)
+    assert len(names) == len(set(names))
+
+
+def test_generate_list_unique_with_workers():
+    """
+    Case: generate list of unique `EOS` names with worker processes.
+    Expect: list does not contain duplicates.
+    """
+    names = RandomNameGenerator().generate_list(num=100_000, workers=2, unique=True)
+
+    assert 100_000 == len(names)
+    assert len(names) == len(set(names))
+
+
+def test_generate_list_unique_exhausts_names_space():
+    """
+    Case: generate list of all unique `EOS` names the small custom data allows.
+    Expect: all names from the names space are returned once.
+    """
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path)
+    names_space_size = name_generator.get_names_space_size_upper_bound()
+
+    names = name_generator.generate_list(num=names_space_size, unique=True)
+
+    assert 2 + 5 ** 2 == names_space_size
+    assert names_space_size == len(set(names))
+    assert {'abcdefghijkl', 'mnopqrstuvwx'} < set(names)
+
+
+def test_iter_names_unique_over_names_space_size():
+    """
+    Case: generate more unique `EOS` names than the names space contains.
+    Expect: ValueError is raised before names are generated.
+    """
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path)
+
+    with pytest.raises(ValueError):
+        name_generator.iter_names(num=name_generator.get_names_space_size_upper_bound() + 1, unique=True)
+
+
+def test_generate_list_exclude():
+    """
+    Case: generate list of `EOS` names excluding names of the names index.
+    Expect: excluded names are not generated.
+    """
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path)
+    excluded_names = SortedNamesArray.from_names(['abcdefghijkl', 'abcdefghij11', 'abcdefghij12'])
+
+    names = name_generator.generate_list(num=1000, exclude=excluded_names)
+
+    assert 1000 == len(names)
+    assert not {'abcdefghijkl', 'abcdefghij11', 'abcdefghij12'} & set(names)
+
+
+def test_generate_list_unique_and_exclude():
+    """
+    Case: generate list of unique `EOS` names excluding names of the names index.
+    Expect: all not excluded names are returned once.
+    """
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path)
+    excluded_names = SortedNamesArray.from_names(['abcdefghijkl', 'abcdefghij11'])
+
+    names_num = name_generator.get_names_space_size_upper_bound() - 2
+
+    names = name_generator.generate_list(num=names_num, unique=True, exclude=excluded_names)
+
+    assert names_num == len(set(names))
+    assert not {'abcdefghijkl', 'abcdefghij11'} & set(names)
+
+
+def test_generate_list_with_invalid_exclude():
+    """
+    Case: generate list of `EOS` names excluding names of the object which is not names index.
+    Expect: the interface `exclude` does not contain contains method error message.
+    """
+    with pytest.raises(AttributeError):
+        RandomNameGenerator().generate_list(num=10, exclude=['abcdefghijkl'])
+
+
+def test_generate_list_encoded():
+    """
+    Case: generate list of `EOS` names encoded into `uint64` values.
+    Expect: `numpy` array of values of generated names is returned.
+    """
+    names = RandomNameGenerator(random_provider_instance=FastRandomChoice(1)).generate_list(num=1000)
+    values = RandomNameGenerator(random_provider_instance=FastRandomChoice(1)).generate_list(num=1000, encoded=True)
+
+    assert numpy.uint64 == values.dtype
+    assert names == decode_names(values).astype(f'U{EOS_NAME_LENGTH}').tolist()
+
+
+def test_iter_names_encoded():
+    """
+    Case: lazily generate `EOS` names encoded into `uint64` values.
+    Expect: integer values and chunks of `uint64` values are returned.
+    """
+    name_generator = RandomNameGenerator()
+
+    values = list(name_generator.iter_names(num=10, encoded=True))
+    values_chunks = list(name_generator.iter_names(num=10, chunk_size=4, as_chunks=True, encoded=True))
+
+    assert all(isinstance(value, int) for value in values)
+    assert [4, 4, 2] == [len(values_chunk) for values_chunk in values_chunks]
+    assert all(numpy.uint64 == values_chunk.dtype for values_chunk in values_chunks)
+
+
+def test_generate_without_partner_words():
+    """
+    Case: generate random names based on custom data without words of the complement length of some base words.
+    Expect: base words without partner words are followed by numbers, base words of the name length are not.
+    """
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path, numbers_probabilities=0)
+
+    names = {name_generator.generate() for _ in range(1000)}
+
+    for name in names - {'abcdefghijkl', 'mnopqrstuvwx'}:
+        assert name.startswith('abcdefghij')
+        assert set(name[10:]) <= set('12345')
+
+
+def test_generate_list_with_stats():
+    """
+    Case: generate list of `EOS` names with stats.
+    Expect: every drawn name has a base word and at most one additional word or number, bytes of names are counted.
+    """
+    stats = GenerationStats()
+    name_generator = RandomNameGenerator(stats=stats)
+    names = name_generator.generate_list(num=1000)
+
+    counters = stats.counters
+    assert 1000 == counters['draws'] == counters['base_words']
+    assert counters['additional_words'] + counters['digit_suffixes'] <= counters['draws']
+    assert sum(len(name) for name in names) == counters['bytes_emitted']
+    assert stats.timings['sampling'] > 0
+    assert stats.timings['lookup'] > 0
+
+
+def test_generate_with_stats():
+    """
+    Case: generate `EOS` names one by one with stats.
+    Expect: names are counted the same way as names of the list.
+    """
+    stats = GenerationStats()
+    name_generator = RandomNameGenerator(stats=stats)
+    names = [name_generator.generate() for _ in range(100)]
+
+    assert 100 == stats.counters['draws'] == stats.counters['base_words']
+    assert sum(len(name) for name in names) == stats.counters['bytes_emitted']
+
+
+def test_generate_list_unique_with_stats():
+    """
+    Case: generate list of unique `EOS` names of the small names space with stats.
+    Expect: redraws are counted as draws, bytes of accepted names only are counted.
+    """
+    stats = GenerationStats()
+    small_data_path = dirname(__file__) + '/custom_data/small_data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=small_data_path, stats=stats)
+    names = name_generator.generate_list(num=20, unique=True)
+
+    assert stats.counters['redraws'] > 0
+    assert 20 + stats.counters['redraws'] >= stats.counters['draws'] > 20
+    assert 12 * len(names) == stats.counters['bytes_emitted']
+    assert stats.timings['filtering'] > 0
+
+
+def test_generate_with_invalid_stats():
+    """
+    Case: create generator with stats object which does not contain count method.
+    Expect: the interface `stats` does not contain count method error message.
+    """
+    with pytest.raises(AttributeError):
+        RandomNameGenerator(stats={})
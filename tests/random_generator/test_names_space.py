@@ -0,0 +1,60 @@
+"""
+Provide tests for NamesSpace.
+"""
+from os.path import dirname
+
+import numpy
+import pytest
+
+from eos_name_generator import RandomNameGenerator
+from eos_name_generator.random_generator.names_space import NamesSpace
+from eos_name_generator.utils import FastRandomChoice
+
+
+def test_names_space_size():
+    """
+    Case: get the space of names of the basic dictionary with the word of complement length and the duplicate word.
+    Expect: distinct base words are combined with distinct additional words and numbers.
+    """
+    words_by_word_len = {
+        12: numpy.array([b'abcdefghijkl', b'abcdefghijkl', b'mnopqrstuvwx'], dtype='S12'),
+        10: numpy.array([b'abcdefghij'], dtype='S10'),
+        2: numpy.array([b'ab', b'cd'], dtype='S2'),
+    }
+    probabilities_by_word_len = {12: 0.5, 10: 0.25, 2: 0.25}
+
+    names_space = NamesSpace.from_words(words_by_word_len, probabilities_by_word_len, 0.1)
+    numberless_names_space = NamesSpace.from_words(words_by_word_len, probabilities_by_word_len, 0)
+
+    assert 2 + 1 * (2 + 5 ** 2) + 2 * (1 + 5 ** 10) == names_space.size_upper_bound
+    assert 2 + 1 * 2 + 2 * 1 == numberless_names_space.size_upper_bound
+    assert pytest.approx(1.0) == names_space.groups_sizes @ names_space.groups_probabilities
+
+
+def test_expected_distinct_names_num():
+    """
+    Case: get the expected number of distinct names of two equally probable names.
+    Expect: the expected number is the same as the closed form of two names.
+    """
+    names_space = NamesSpace(groups_sizes=numpy.array([2]), groups_probabilities=numpy.array([0.5]))
+
+    assert 0 == names_space.get_expected_distinct_names_num(0)
+    assert pytest.approx(1.0) == names_space.get_expected_distinct_names_num(1)
+    assert pytest.approx(1.5) == names_space.get_expected_distinct_names_num(2)
+    assert pytest.approx(0.5) == names_space.get_expected_duplicates_num(2)
+    assert pytest.approx(0.25) == names_space.get_expected_duplicates_rate(2)
+
+
+def test_expected_duplicates_num_of_generated_names():
+    """
+    Case: generate list of names and count duplicates.
+    Expect: number of duplicates is close to the expected number of duplicates.
+    """
+    accuracy = 0.05
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    name_generator = RandomNameGenerator(seed_data_path=custom_data_path, random_provider_instance=FastRandomChoice(1))
+
+    names = name_generator.generate_list(num=100_000)
+    expected_duplicates_num = name_generator.get_names_space().get_expected_duplicates_num(100_000)
+
+    assert abs(len(names) - len(set(names)) - expected_duplicates_num) < accuracy * expected_duplicates_num
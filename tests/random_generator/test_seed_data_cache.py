@@ -0,0 +1,98 @@
+"""
+Provide tests for SeedDataCache.
+"""
+import os
+import threading
+from os.path import dirname
+
+import pytest
+
+from eos_name_generator.random_generator.data_reader import DataReader
+from eos_name_generator.random_generator.seed_data_cache import SeedDataCache
+
+
+def test_get_dictionary_by_word_len_from_cache():
+    """
+    Case: get dictionary by word length with two data readers of the same data.
+    Expect: data is parsed once, the same read-only arrays are returned.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    seed_data_cache = SeedDataCache()
+
+    base_dict = DataReader(data_path=custom_data_path, seed_data_cache=seed_data_cache).get_dictionary_by_word_len()
+    cached_base_dict = DataReader(
+        data_path=custom_data_path, seed_data_cache=seed_data_cache,
+    ).get_dictionary_by_word_len()
+
+    assert 1 == len(seed_data_cache)
+
+    for word_len, base_words in base_dict.items():
+        assert base_words is cached_base_dict[word_len]
+        assert not base_words.flags.writeable
+
+
+def test_get_dictionary_by_word_len_from_cache_with_modified_data(tmp_path):
+    """
+    Case: get dictionary by word length, modify data and get dictionary by word length again.
+    Expect: modified data is parsed again.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('mime\njail\n')
+    seed_data_cache = SeedDataCache()
+    data_reader = DataReader(data_path=str(data_path), seed_data_cache=seed_data_cache)
+
+    assert [4] == list(data_reader.get_dictionary_by_word_len())
+
+    data_path.write_text('mime\njail\ntorques\n')
+    os.utime(str(data_path), ns=(0, 0))
+
+    assert [4, 7] == list(data_reader.get_dictionary_by_word_len())
+    assert {4: pytest.approx(2 / 3), 7: pytest.approx(1 / 3)} == data_reader.get_probabilities_by_word_len()
+
+
+def test_seed_data_cache_eviction():
+    """
+    Case: put more entries to the cache than the maximum number of entries and the maximum size.
+    Expect: the least recently used entries are evicted, entries larger than the maximum size are not cached.
+    """
+    seed_data_cache = SeedDataCache(max_entries=2, max_bytes=100)
+
+    seed_data_cache.put('first', 1, 10)
+    seed_data_cache.put('second', 2, 10)
+    seed_data_cache.get('first')
+    seed_data_cache.put('third', 3, 10)
+
+    assert 1 == seed_data_cache.get('first')
+    assert seed_data_cache.get('second') is None
+
+    seed_data_cache.put('fourth', 4, 90)
+
+    assert seed_data_cache.get('third') is None
+    assert 1 == seed_data_cache.get('first')
+    assert 4 == seed_data_cache.get('fourth')
+
+    seed_data_cache.put('fifth', 5, 101)
+
+    assert seed_data_cache.get('fifth') is None
+
+
+def test_seed_data_cache_with_threads():
+    """
+    Case: read the same data from several threads.
+    Expect: the data is cached once.
+    """
+    custom_data_path = dirname(__file__) + '/custom_data/data.txt'
+    seed_data_cache = SeedDataCache()
+
+    def read_data():
+        for _ in range(10):
+            DataReader(data_path=custom_data_path, seed_data_cache=seed_data_cache).get_dictionary_by_word_len()
+
+    threads = [threading.Thread(target=read_data) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert 1 == len(seed_data_cache)
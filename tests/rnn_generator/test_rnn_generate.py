@@ -0,0 +1,179 @@
+"""
+Provide tests for RNNNameGenerator.
+"""
+from itertools import islice
+
+import numpy
+import pytest
+
+from eos_name_generator import RNNNameGenerator
+from eos_name_generator.constants import (
+    EOS_NAME_ALPHABET,
+    EOS_NAME_LENGTH,
+)
+from eos_name_generator.rnn_generator.model import GRUModel
+from eos_name_generator.utils import (
+    FastRandomChoice,
+    GenerationStats,
+)
+from eos_name_generator.utils.names_index import SortedNamesArray
+
+
+@pytest.fixture
+def weights_path(tmp_path):
+    """
+    Save GRU model with random weights.
+
+    :param tmp_path: temporary directory.
+    :return: path to the weights
+    """
+    random_generator = numpy.random.default_rng(1)
+    weights_path = str(tmp_path / 'weights.npz')
+    GRUModel(
+        input_weights=random_generator.normal(size=(32, 48)),
+        hidden_weights=random_generator.normal(size=(16, 48)),
+        input_bias=numpy.zeros(48),
+        hidden_bias=numpy.zeros(48),
+        output_weights=random_generator.normal(size=(16, 32)),
+        output_bias=numpy.zeros(32),
+    ).save(weights_path)
+
+    return weights_path
+
+
+def test_generate(weights_path):
+    """
+    Case: generate `EOS` name with the GRU model.
+    Expect: name of the `EOS` name alphabet characters starting with a letter is returned.
+    """
+    name = RNNNameGenerator(weights_path=weights_path).generate()
+
+    assert isinstance(name, str)
+    assert EOS_NAME_LENGTH == len(name)
+    assert name[0].isalpha()
+    assert set(name) <= set(EOS_NAME_ALPHABET[1:])
+
+
+def test_generate_list(weights_path):
+    """
+    Case: generate list of `EOS` names with the GRU model by small batches.
+    Expect: list of names of the `EOS` name alphabet characters starting with a letter is returned.
+    """
+    names = RNNNameGenerator(weights_path=weights_path, batch_size=7).generate_list(num=100)
+
+    assert 100 == len(names)
+    assert {EOS_NAME_LENGTH} == set(map(len, names))
+    assert all(name[0].isalpha() for name in names)
+    assert set(''.join(names)) <= set(EOS_NAME_ALPHABET[1:])
+
+
+def test_generate_with_dominant_symbol(tmp_path):
+    """
+    Case: generate `EOS` names with the GRU model which output is dominated by the single symbol.
+    Expect: names consist of the dominant symbol.
+    """
+    weights_path = str(tmp_path / 'weights.npz')
+    output_bias = numpy.zeros(32)
+    output_bias[EOS_NAME_ALPHABET.index('q')] = 100
+    GRUModel(
+        input_weights=numpy.zeros((32, 12)),
+        hidden_weights=numpy.zeros((4, 12)),
+        input_bias=numpy.zeros(12),
+        hidden_bias=numpy.zeros(12),
+        output_weights=numpy.zeros((4, 32)),
+        output_bias=output_bias,
+    ).save(weights_path)
+
+    assert ['q' * EOS_NAME_LENGTH] * 3 == RNNNameGenerator(weights_path=weights_path).generate_list(num=3)
+
+
+def test_generate_with_seeded_random_provider(weights_path):
+    """
+    Case: generate `EOS` names twice with the random providers with the same seed.
+    Expect: the same names are returned.
+    """
+    first_names = RNNNameGenerator(
+        weights_path=weights_path, random_provider_instance=FastRandomChoice(1),
+    ).generate_list(num=100)
+    second_names = RNNNameGenerator(
+        weights_path=weights_path, random_provider_instance=FastRandomChoice(1),
+    ).generate_list(num=100)
+
+    assert first_names == second_names
+
+
+def test_iter_names(weights_path):
+    """
+    Case: lazily generate `EOS` names with the GRU model.
+    Expect: names and chunks of names are yielded.
+    """
+    name_generator = RNNNameGenerator(weights_path=weights_path, batch_size=2)
+    names = list(name_generator.iter_names(num=10, chunk_size=3))
+    names_chunks = list(name_generator.iter_names(num=10, chunk_size=3, as_chunks=True))
+
+    assert 10 == len(names)
+    assert {EOS_NAME_LENGTH} == set(map(len, names))
+    assert [3, 3, 3, 1] == [len(names_chunk) for names_chunk in names_chunks]
+    assert 5 == len(list(islice(name_generator.iter_names(chunk_size=4), 5)))
+
+
+def test_set_invalid_temperature(weights_path):
+    """
+    Case: create the generator with not positive temperature.
+    Expect: the temperature must be greater than 0 error message.
+    """
+    with pytest.raises(ValueError) as error:
+        RNNNameGenerator(weights_path=weights_path, temperature=0)
+
+    assert 'The temperature must be greater than 0.' == str(error.value)
+
+
+def test_generate_with_default_weights():
+    """
+    Case: generate `EOS` names with the GRU model trained on the default seed data.
+    Expect: names of the `EOS` name alphabet letters are returned.
+    """
+    names = RNNNameGenerator().generate_list(num=100)
+
+    assert {EOS_NAME_LENGTH} == set(map(len, names))
+    assert set(''.join(names)) <= set(EOS_NAME_ALPHABET[1:])
+
+
+def test_generate_list_unique_and_exclude():
+    """
+    Case: generate list of unique `EOS` names excluding names of the names index.
+    Expect: names are not duplicated and excluded names are not generated.
+    """
+    name_generator = RNNNameGenerator(random_provider_instance=FastRandomChoice(0))
+    excluded_names = name_generator.generate_list(num=500)
+
+    names = name_generator.generate_list(num=2000, unique=True, exclude=SortedNamesArray.from_names(excluded_names))
+
+    assert 2000 == len(set(names))
+    assert not set(excluded_names) & set(names)
+
+
+def test_generate_with_stats(weights_path):
+    """
+    Case: generate `EOS` names with the GRU model with stats one by one and as the encoded list.
+    Expect: names are counted as draws, bytes of names are counted, stages of the generation are timed.
+    """
+    stats = GenerationStats()
+    name_generator = RNNNameGenerator(weights_path=weights_path, batch_size=7, stats=stats)
+    name_generator.generate()
+    encoded_names = name_generator.generate_list(num=100, encoded=True)
+
+    assert 101 == stats.counters['draws']
+    assert EOS_NAME_LENGTH + encoded_names.nbytes == stats.counters['bytes_emitted']
+    assert stats.timings['sampling'] > 0
+    assert stats.timings['lookup'] > 0
+    assert stats.timings['string_building'] > 0
+
+
+def test_generate_with_invalid_stats(weights_path):
+    """
+    Case: create the GRU model name generator with stats object which does not contain count method.
+    Expect: the interface `stats` does not contain count method error message.
+    """
+    with pytest.raises(AttributeError):
+        RNNNameGenerator(weights_path=weights_path, stats={})
@@ -0,0 +1,93 @@
+"""
+Provide tests for GRUModel.
+"""
+import numpy
+import pytest
+
+from eos_name_generator.errors import RNNModelError
+from eos_name_generator.rnn_generator.model import GRUModel
+
+
+def create_model(hidden_size=8, seed=1):
+    """
+    Create GRU model with random weights.
+
+    :param hidden_size: hidden size of the model.
+    :param seed: seed of random weights.
+    :return: GRU model
+    """
+    random_generator = numpy.random.default_rng(seed)
+    return GRUModel(
+        input_weights=random_generator.normal(size=(32, 3 * hidden_size)),
+        hidden_weights=random_generator.normal(size=(hidden_size, 3 * hidden_size)),
+        input_bias=random_generator.normal(size=3 * hidden_size),
+        hidden_bias=random_generator.normal(size=3 * hidden_size),
+        output_weights=random_generator.normal(size=(hidden_size, 32)),
+        output_bias=random_generator.normal(size=32),
+    )
+
+
+def test_step():
+    """
+    Case: advance the batch of hidden states by input symbols.
+    Expect: hidden states and logits match the reference GRU cell computed state by state.
+    """
+    model = create_model()
+    symbols = numpy.array([0, 6, 31])
+    hidden_states = numpy.random.default_rng(2).normal(size=(3, 8)).astype(numpy.float32)
+    hidden_projections = hidden_states @ model.hidden_weights + model.hidden_bias
+
+    next_hidden_states, next_hidden_projections, logits = model.step(symbols, hidden_states, hidden_projections)
+
+    for symbol, hidden_state, next_hidden_state, next_hidden_projection, state_logits in zip(
+            symbols, hidden_states, next_hidden_states, next_hidden_projections, logits,
+    ):
+        input_projection = model.input_weights[symbol] + model.input_bias
+        hidden_projection = hidden_state @ model.hidden_weights + model.hidden_bias
+        reset_gate = 1 / (1 + numpy.exp(-(input_projection[:8] + hidden_projection[:8])))
+        update_gate = 1 / (1 + numpy.exp(-(input_projection[8:16] + hidden_projection[8:16])))
+        new_gate = numpy.tanh(input_projection[16:] + reset_gate * hidden_projection[16:])
+        expected_hidden_state = (1 - update_gate) * new_gate + update_gate * hidden_state
+
+        assert expected_hidden_state == pytest.approx(next_hidden_state, abs=1e-5)
+        assert expected_hidden_state @ model.hidden_weights + model.hidden_bias == \
+            pytest.approx(next_hidden_projection, abs=1e-4)
+        assert expected_hidden_state @ model.output_weights + model.output_bias == \
+            pytest.approx(state_logits, abs=1e-4)
+
+
+def test_save_and_load(tmp_path):
+    """
+    Case: save the model weights and load them.
+    Expect: loaded model has the same weights.
+    """
+    weights_path = str(tmp_path / 'weights.npz')
+    model = create_model()
+    model.save(weights_path)
+
+    loaded_model = GRUModel.load(weights_path)
+
+    assert 8 == loaded_model.hidden_size
+    for name, weights in model.get_weights().items():
+        assert numpy.array_equal(weights, loaded_model.get_weights()[name])
+
+
+def test_load_invalid_weights(tmp_path):
+    """
+    Case: load the model from weights with missing weights or inconsistent shapes.
+    Expect: RNN model weights do not contain and shape does not match error messages.
+    """
+    weights_path = str(tmp_path / 'weights.npz')
+    weights = create_model().get_weights()
+
+    numpy.savez(weights_path, **{name: value for name, value in weights.items() if name != 'output_bias'})
+    with pytest.raises(RNNModelError) as error:
+        GRUModel.load(weights_path)
+
+    assert 'RNN model weights do not contain output_bias' == error.value.message
+
+    numpy.savez(weights_path, **dict(weights, output_bias=numpy.zeros(31)))
+    with pytest.raises(RNNModelError) as error:
+        GRUModel.load(weights_path)
+
+    assert 'RNN model weights output_bias shape (31,) does not match (32,)' == error.value.message
@@ -0,0 +1,137 @@
+"""
+Provide tests for RNNTrainer.
+"""
+from os.path import dirname
+
+import numpy
+import pytest
+
+from eos_name_generator.rnn_generator.generator import RNNNameGenerator
+from eos_name_generator.rnn_generator.trainer import (
+    RNNTrainer,
+    get_loss_and_gradients,
+    get_max_rss_bytes,
+)
+
+DATA_PATH = dirname(__file__) + '/custom_data/data.txt'
+
+
+def test_get_loss_and_gradients():
+    """
+    Case: get loss and gradients of the window with double precision weights.
+    Expect: gradients match the numerical gradients of the loss.
+    """
+    random_generator = numpy.random.default_rng(1)
+    hidden_size, sequence_len, batch_size = 3, 4, 2
+    weights = {
+        'input_weights': random_generator.normal(size=(32, 3 * hidden_size)),
+        'hidden_weights': random_generator.normal(size=(hidden_size, 3 * hidden_size)),
+        'input_bias': random_generator.normal(size=3 * hidden_size),
+        'hidden_bias': random_generator.normal(size=3 * hidden_size),
+        'output_weights': random_generator.normal(size=(hidden_size, 32)),
+        'output_bias': random_generator.normal(size=32),
+    }
+    inputs = random_generator.integers(0, 32, (sequence_len, batch_size))
+    targets = random_generator.integers(0, 32, (sequence_len, batch_size))
+    hidden_states = random_generator.normal(size=(batch_size, hidden_size))
+
+    gradients = get_loss_and_gradients(weights, inputs, targets, hidden_states)[1]
+
+    for name, weight in weights.items():
+        for index in numpy.ndindex(weight.shape):
+            value = weight[index]
+            weight[index] = value + 1e-6
+            increased_loss = get_loss_and_gradients(weights, inputs, targets, hidden_states)[0]
+            weight[index] = value - 1e-6
+            decreased_loss = get_loss_and_gradients(weights, inputs, targets, hidden_states)[0]
+            weight[index] = value
+
+            assert (increased_loss - decreased_loss) / 2e-6 == pytest.approx(gradients[name][index], abs=1e-6)
+
+
+def test_train():
+    """
+    Case: train the model on custom data.
+    Expect: loss decreases, reports contain throughput and memory usage, trained model generates names.
+    """
+    reports = []
+    trainer = RNNTrainer(seed_data_path=DATA_PATH, hidden_size=16, batch_size=4, sequence_len=8, seed=1)
+    model = trainer.train(steps=200, report_interval=50, report_callback=reports.append)
+
+    assert [50, 100, 150, 200] == [report.step for report in reports]
+    assert reports[-1].loss < reports[0].loss
+    assert all(report.tokens_per_second > 0 and report.max_rss_bytes > 0 for report in reports)
+    assert 16 == model.hidden_size
+
+
+def test_resume_training(tmp_path):
+    """
+    Case: interrupt training after saving the checkpoint and resume it with the new trainer.
+    Expect: resumed training has the same weights as uninterrupted training with checkpoint hyperparameters.
+    """
+    checkpoint_path = str(tmp_path / 'checkpoint.npz')
+    uninterrupted_trainer = RNNTrainer(seed_data_path=DATA_PATH, hidden_size=8, batch_size=2, sequence_len=4, seed=1)
+    uninterrupted_model = uninterrupted_trainer.train(steps=30)
+
+    def interrupt(report):
+        if report.step == 15:
+            raise KeyboardInterrupt
+
+    trainer = RNNTrainer(
+        seed_data_path=DATA_PATH, checkpoint_path=checkpoint_path, hidden_size=8, batch_size=2, sequence_len=4, seed=1,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        trainer.train(steps=30, checkpoint_interval=10, report_interval=5, report_callback=interrupt)
+
+    resumed_trainer = RNNTrainer(seed_data_path=DATA_PATH, checkpoint_path=checkpoint_path, hidden_size=4)
+    assert 10 == resumed_trainer.step
+
+    resumed_model = resumed_trainer.train(steps=30)
+    for name, weights in uninterrupted_model.get_weights().items():
+        assert numpy.array_equal(weights, resumed_model.get_weights()[name])
+
+
+def test_generate_with_trained_model(tmp_path):
+    """
+    Case: generate names with weights of the trained model.
+    Expect: names are returned.
+    """
+    weights_path = str(tmp_path / 'weights.npz')
+    RNNTrainer(seed_data_path=DATA_PATH, hidden_size=8, batch_size=2, sequence_len=4, seed=1).train(steps=5).save(
+        weights_path,
+    )
+
+    assert 3 == len(RNNNameGenerator(weights_path=weights_path).generate_list(num=3))
+
+
+def test_train_with_too_small_data(tmp_path):
+    """
+    Case: train the model on data smaller than the batch of windows.
+    Expect: the seed data is too small for the batch size and the sequence length error message.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_text('mime\njail\n')
+    trainer = RNNTrainer(seed_data_path=str(data_path), batch_size=4, sequence_len=8)
+
+    with pytest.raises(ValueError) as error:
+        trainer.train(steps=1)
+
+    assert 'The seed data is too small for the batch size and the sequence length.' == str(error.value)
+
+
+def test_get_max_rss_bytes(monkeypatch):
+    """
+    Case: get the peak resident set size on Linux, macOS and Windows.
+    Expect: kilobytes are scaled to bytes on Linux, bytes are returned on macOS, `None` is returned on Windows.
+    """
+    resource = pytest.importorskip('resource')
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    monkeypatch.setattr('sys.platform', 'linux')
+    assert max_rss * 1024 <= get_max_rss_bytes()
+
+    monkeypatch.setattr('sys.platform', 'darwin')
+    assert max_rss <= get_max_rss_bytes() < max_rss * 1024
+
+    monkeypatch.setattr('sys.platform', 'win32')
+    assert get_max_rss_bytes() is None
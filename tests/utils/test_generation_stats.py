@@ -0,0 +1,70 @@
+"""
+Provide tests for GenerationStats.
+"""
+import time
+
+from eos_name_generator.utils import GenerationStats
+from eos_name_generator.utils.generation_stats import (
+    STATS_COUNTERS,
+    STATS_STAGES,
+    time_stage,
+)
+
+
+def test_count():
+    """
+    Case: count generated entities.
+    Expect: counters are increased, other counters stay zero.
+    """
+    stats = GenerationStats()
+    stats.count('draws')
+    stats.count('draws', 10)
+
+    assert 11 == stats.counters['draws']
+    assert 0 == stats.counters['redraws']
+
+
+def test_time():
+    """
+    Case: time the generation stage twice.
+    Expect: timing of the stage is the sum of times of both blocks.
+    """
+    stats = GenerationStats()
+    for _ in range(2):
+        with stats.time('sampling'):
+            time.sleep(0.01)
+
+    assert stats.timings['sampling'] >= 0.02
+    assert 0.0 == stats.timings['lookup']
+
+
+def test_time_stage_without_stats():
+    """
+    Case: time the generation stage without stats.
+    Expect: the block is executed, nothing is recorded.
+    """
+    executed = False
+    with time_stage(None, 'sampling'):
+        executed = True
+
+    assert executed
+
+
+def test_reset_and_to_dict():
+    """
+    Case: reset recorded stats and get them as dictionary.
+    Expect: dictionary of all counters and timings is returned, reset counters and timings are zero.
+    """
+    stats = GenerationStats()
+    stats.count('bytes_emitted', 12)
+    with time_stage(stats, 'lookup'):
+        pass
+
+    stats_dict = stats.to_dict()
+    stats.reset()
+
+    assert list(STATS_COUNTERS) == list(stats_dict['counters'])
+    assert list(STATS_STAGES) == list(stats_dict['timings'])
+    assert 12 == stats_dict['counters']['bytes_emitted']
+    assert {0} == set(stats.to_dict()['counters'].values())
+    assert {0.0} == set(stats.to_dict()['timings'].values())
@@ -0,0 +1,63 @@
+"""
+Provide tests for MappedFileFormat.
+"""
+import pytest
+
+from eos_name_generator.errors import NamesIndexError
+from eos_name_generator.utils.mapped_file import MappedFileFormat
+
+TEST_FORMAT = MappedFileFormat(
+    name='Test file', magic=b'EOSNGTF\x00', version=2, fields_format='HQ', error=NamesIndexError, padding=6,
+)
+
+
+def test_write_and_read(tmp_path):
+    """
+    Case: write the file of the format and read it.
+    Expect: header fields and the mapped body of the file are returned.
+    """
+    path = str(tmp_path / 'test.bin')
+    TEST_FORMAT.write(path, fields=(3, 2 ** 40), body=b'body')
+
+    fields, data = TEST_FORMAT.read(path, verify_checksum=True)
+
+    assert 30 == TEST_FORMAT.header_size
+    assert (3, 2 ** 40) == fields
+    assert b'body' == data[TEST_FORMAT.header_size:]
+
+
+def test_write_over_mapped_file(tmp_path):
+    """
+    Case: write the file of the format onto the path of the mapped file.
+    Expect: the mapped file is not changed, the new file is read from the path.
+    """
+    path = str(tmp_path / 'test.bin')
+    TEST_FORMAT.write(path, fields=(1, 1), body=b'first')
+    _, first_data = TEST_FORMAT.read(path)
+
+    TEST_FORMAT.write(path, fields=(2, 2), body=b'')
+
+    assert b'first' == first_data[TEST_FORMAT.header_size:]
+    assert (2, 2) == TEST_FORMAT.read(path)[0]
+    assert [tmp_path / 'test.bin'] == list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize('file_data, verify_checksum, expected_message', [
+    (b'', False, 'Test file header is invalid'),
+    (b'EOSNGMC\x00' + b'\x00' * 24, False, 'Test file header is invalid'),
+    (b'EOSNGTF\x00\x01' + b'\x00' * 23, False, 'Test file version 1 is not supported'),
+    (b'EOSNGTF\x00\x02' + b'\x00' * 23 + b'body', True, 'Test file does not match the checksum'),
+])
+def test_read_invalid_file(file_data, verify_checksum, expected_message, tmp_path):
+    """
+    Case: read the empty file, the file of another format, of another version or with damaged body.
+    Expect: the error of the format is raised with the header is invalid, version is not supported
+        and does not match the checksum messages.
+    """
+    path = tmp_path / 'test.bin'
+    path.write_bytes(file_data)
+
+    with pytest.raises(NamesIndexError) as error:
+        TEST_FORMAT.read(str(path), verify_checksum=verify_checksum)
+
+    assert expected_message == error.value.message
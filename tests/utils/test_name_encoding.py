@@ -0,0 +1,63 @@
+"""
+Provide tests for encoding of `EOS` names into `uint64` values.
+"""
+import numpy as np
+import pytest
+
+from eos_name_generator import RandomNameGenerator
+from eos_name_generator.utils import (
+    decode_names,
+    encode_names,
+)
+
+
+def test_encode_names():
+    """
+    Case: encode `EOS` names into `uint64` values.
+    Expect: values are the same as `EOS` account names values.
+    """
+    values = encode_names(['eosio', 'eosio.token', b'zzzzzzzzzzzz', ''])
+
+    assert np.uint64 == values.dtype
+    assert [0x5530EA0000000000, 0x5530EA033482A600, 0xFFFFFFFFFFFFFFF0, 0] == values.tolist()
+
+
+def test_encode_names_with_invalid_characters():
+    """
+    Case: encode names which contain characters out of the `EOS` name alphabet or are too long.
+    Expect: ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        encode_names(['eosio6'])
+
+    with pytest.raises(ValueError):
+        encode_names(['abcdefghijklm'])
+
+
+def test_decode_names():
+    """
+    Case: decode `uint64` values of `EOS` account names.
+    Expect: names without trailing padding are returned.
+    """
+    names = decode_names([0x5530EA0000000000, 0x5530EA033482A600, 0xFFFFFFFFFFFFFFF0, 0])
+
+    assert [b'eosio', b'eosio.token', b'zzzzzzzzzzzz', b''] == names.tolist()
+
+
+def test_decode_names_with_thirteenth_character():
+    """
+    Case: decode `uint64` value of the name of 13 characters.
+    Expect: ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        decode_names([0x5530EA0000000001])
+
+
+def test_encode_and_decode_generated_names():
+    """
+    Case: encode generated `EOS` names and decode them back.
+    Expect: the same names are returned.
+    """
+    names = RandomNameGenerator().generate_list(num=10_000)
+
+    assert names == decode_names(encode_names(names)).astype('U12').tolist()
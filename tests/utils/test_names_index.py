@@ -0,0 +1,189 @@
+"""
+Provide tests for indices of already generated and excluded names.
+"""
+import numpy as np
+import pytest
+
+from eos_name_generator.errors import NamesIndexError
+from eos_name_generator.utils import encode_names
+from eos_name_generator.utils.names_index import (
+    BloomFilter,
+    SortedNamesArray,
+    SortedNamesSet,
+    accept_names,
+    create_unique_names_index,
+    iter_filtered_names_chunks,
+    load_names_index,
+    read_encoded_names,
+)
+
+
+@pytest.mark.parametrize('unique_names_index', [SortedNamesSet(), BloomFilter.for_capacity(10_000, 0.001)])
+def test_accept_names_unique(unique_names_index):
+    """
+    Case: add batches of names with duplicates to the index.
+    Expect: only the first occurrence of every name is added.
+    """
+    names = np.random.default_rng(0).integers(0, 5_000, size=(20, 500)).astype(np.uint64)
+
+    added_names = np.concatenate([
+        names_batch[accept_names(names_batch, unique_names_index=unique_names_index)] for names_batch in names
+    ])
+
+    assert len(added_names) == len(np.unique(added_names))
+    assert len(added_names) > 0.99 * len(np.unique(names))
+
+
+def test_sorted_names_set_is_exact():
+    """
+    Case: add batches of names with duplicates to the exact set.
+    Expect: every distinct name is added exactly once.
+    """
+    random_generator = np.random.default_rng(0)
+    names = random_generator.integers(0, 5_000, size=(20, 500)).astype(np.uint64)
+    sorted_names_set = SortedNamesSet()
+
+    added_names_num = sum(accept_names(names_batch, unique_names_index=sorted_names_set).sum() for names_batch in names)
+
+    assert len(np.unique(names)) == added_names_num == len(sorted_names_set)
+    assert sorted_names_set.contains(names.ravel()).all()
+
+
+def test_bloom_filter_false_positive_rate():
+    """
+    Case: check names which are not in the Bloom filter filled up to its capacity.
+    Expect: false positive rate is close to the requested one.
+    """
+    bloom_filter = BloomFilter.for_capacity(capacity=100_000, error_rate=0.01)
+    bloom_filter.add(np.arange(100_000, dtype=np.uint64))
+
+    false_positive_rate = bloom_filter.contains(np.arange(100_000, 200_000, dtype=np.uint64)).mean()
+
+    assert bloom_filter.contains(np.arange(100_000, dtype=np.uint64)).all()
+    assert false_positive_rate < 0.02
+
+
+def test_accept_names_with_max_num():
+    """
+    Case: accept new names with the maximum number of accepted names.
+    Expect: only first new names are accepted and added to the index.
+    """
+    sorted_names_set = SortedNamesSet()
+    sorted_names_set.add(np.array([2], dtype=np.uint64))
+
+    names = np.array([5, 2, 5, 3, 4], dtype=np.uint64)
+
+    is_added = accept_names(names, unique_names_index=sorted_names_set, max_num=2)
+
+    assert [True, False, False, True, False] == is_added.tolist()
+    assert [False, False, True, True, False, True] == sorted_names_set.contains(np.arange(6, dtype=np.uint64)).tolist()
+
+
+def test_create_unique_names_index():
+    """
+    Case: create index of generated names for different numbers of names.
+    Expect: exact set for the moderate number of names, Bloom filter for the huge number of names.
+    """
+    assert isinstance(create_unique_names_index(None, exact_names_max_num=100), SortedNamesSet)
+    assert isinstance(create_unique_names_index(100, exact_names_max_num=100), SortedNamesSet)
+    assert isinstance(create_unique_names_index(101, exact_names_max_num=100), BloomFilter)
+
+
+def test_accept_names_excluded():
+    """
+    Case: accept names with the index of excluded names.
+    Expect: excluded names are rejected, duplicates are accepted without the index of generated names.
+    """
+    excluded_names = SortedNamesArray.from_names(['abc', 'abd'])
+
+    is_accepted = accept_names(encode_names(['abc', 'abe', 'abd', 'abe']), excluded_names=excluded_names)
+
+    assert [False, True, False, True] == is_accepted.tolist()
+
+
+@pytest.mark.parametrize('names_index', [
+    SortedNamesArray.from_names(['eosio', 'eosio.token', 'abc']),
+    BloomFilter.for_capacity(capacity=100, error_rate=0.001),
+])
+def test_save_and_load_names_index(names_index, tmp_path):
+    """
+    Case: save names index and load it from the file.
+    Expect: loaded index is memory-mapped and contains the same names.
+    """
+    names = encode_names(['eosio', 'eosio.token', 'abc', 'abd'])
+    if isinstance(names_index, BloomFilter):
+        names_index.add(names[:3])
+
+    index_path = str(tmp_path / 'names.index')
+    names_index.save(index_path)
+    loaded_names_index = load_names_index(index_path, verify_checksum=True)
+
+    assert type(names_index) is type(loaded_names_index)
+    assert names_index.contains(names).tolist() == loaded_names_index.contains(names).tolist()
+    assert [True, True, True, False] == loaded_names_index.contains(names).tolist()
+
+
+def test_load_names_index_with_invalid_file(tmp_path):
+    """
+    Case: load names index from the file which is not the names index or has unexpected kind.
+    Expect: NamesIndexError is raised.
+    """
+    invalid_index_path = tmp_path / 'invalid.index'
+    invalid_index_path.write_bytes(b'eosio' * 10)
+    index_path = str(tmp_path / 'names.index')
+    SortedNamesArray.from_names(['eosio']).save(index_path)
+
+    with pytest.raises(NamesIndexError):
+        load_names_index(str(invalid_index_path))
+
+    with pytest.raises(NamesIndexError):
+        BloomFilter.load(index_path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_read_encoded_names(chunk_size, tmp_path):
+    """
+    Case: read names separated by whitespaces from the names file by chunks.
+    Expect: sorted distinct encoded names of the file are returned.
+    """
+    names_data = b'eosio\r\neosio.token  abc\n\nabd\teosio\nabcdefghijkl'
+    names_path = tmp_path / 'names.txt'
+    names_path.write_bytes(names_data)
+
+    names = read_encoded_names(str(names_path), chunk_size=chunk_size)
+
+    assert np.unique(encode_names(names_data.split())).tolist() == names.tolist()
+
+
+def test_read_encoded_names_with_too_long_name(tmp_path):
+    """
+    Case: read the names file with the name longer than `EOS` name.
+    Expect: names must be at most 12 characters error message.
+    """
+    names_path = tmp_path / 'names.txt'
+    names_path.write_bytes(b'eosio\nabcdefghijklm\n')
+
+    with pytest.raises(ValueError) as error:
+        read_encoded_names(str(names_path))
+
+    assert 'Names must be strings or bytes of at most 12 characters.' == str(error.value)
+
+
+def test_iter_filtered_names_chunks_with_exhausted_names_space():
+    """
+    Case: remove duplicates from chunks when no new names could be redrawn.
+    Expect: ValueError is raised.
+    """
+    names_chunks = iter([np.array([b'abc', b'abd'], dtype='S12'), np.array([b'abc', b'abc'], dtype='S12')])
+    unique_names_chunks = iter_filtered_names_chunks(
+        names_chunks=names_chunks,
+        generate_chunk=lambda num: np.full(num, b'abd', dtype='S12'),
+        unique_names_index=SortedNamesSet(),
+        max_fruitless_redraws=3,
+        min_redraw_num=1,
+    )
+
+    assert [b'abc', b'abd'] == next(unique_names_chunks).tolist()
+
+    with pytest.raises(ValueError):
+        next(unique_names_chunks)